@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+"""Benchmark the compact codec against JSON for stored responses and events.
+
+Generates one synthetic stream with the mock server's event generator and compares
+payload size and decode time of ``codec.decode`` / ``codec.decode_many`` with
+``model_validate_json`` for the final ``ResponseResource`` and for all events.
+
+Usage:
+    python benchmarks/bench_codec.py [--output-chars N] [--top-logprobs N] [--backend json|msgpack]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types import codec
+from openresponses_types.mock_server import stream_events
+from openresponses_types.streaming import parse_event
+from openresponses_types.types import CreateResponseBody, ResponseResource
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the compact binary codec")
+    parser.add_argument("--output-chars", type=int, default=2000, help="Length of streamed output text")
+    parser.add_argument("--top-logprobs", type=int, default=2, help="Alternatives per logprob")
+    parser.add_argument("--backend", choices=["json", "msgpack"], default=None, help="Codec backend")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    body = CreateResponseBody(model="gpt-4", input="Hi")
+    events = list(stream_events(body, output_chars=args.output_chars, top_logprobs=args.top_logprobs))
+    response = events[-1].response
+
+    response_json = response.model_dump_json()
+    response_packed = codec.encode(response, backend=args.backend)
+    events_json = [event.model_dump_json() for event in events]
+    events_packed = codec.encode_many(events, backend=args.backend)
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))  # type: ignore[arg-type]
+
+    validate = best(lambda: ResponseResource.model_validate_json(response_json))
+    decode = best(lambda: codec.decode(response_packed))
+    print(f"response: {len(response_json)} B JSON, {len(response_packed)} B encoded")
+    print(f"  model_validate_json: {validate * 1000:8.2f} ms")
+    print(f"  codec.decode:        {decode * 1000:8.2f} ms  ({validate / decode:.1f}x)")
+
+    validate = best(lambda: [parse_event(data) for data in events_json])
+    decode = best(lambda: codec.decode_many(events_packed))
+    print(f"{len(events)} events: {sum(map(len, events_json))} B JSON, {len(events_packed)} B encoded")
+    print(f"  parse_event:         {validate * 1000:8.2f} ms")
+    print(f"  codec.decode_many:   {decode * 1000:8.2f} ms  ({validate / decode:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+"""Benchmark emitting text deltas as SSE frames.
+
+Compares building a ``ResponseOutputTextDeltaStreamingEvent`` per delta and
+encoding it with ``model_dump_json`` against ``ResponseStreamEmitter.text_delta``,
+which only escapes the delta text.
+
+Usage:
+    python benchmarks/bench_emitter.py [--deltas N] [--delta-size N]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types.emitter import ResponseStreamEmitter
+from openresponses_types.mock_server import build_response, encode_sse, make_text
+from openresponses_types.types import CreateResponseBody, ResponseOutputTextDeltaStreamingEvent, Type49
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SSE delta emission")
+    parser.add_argument("--deltas", type=int, default=10000, help="Number of text deltas per stream")
+    parser.add_argument("--delta-size", type=int, default=4, help="Characters per delta")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    text = make_text(args.deltas * args.delta_size)
+    deltas = [text[index : index + args.delta_size] for index in range(0, len(text), args.delta_size)]
+    body = CreateResponseBody(model="gpt-4", input="Hi")
+    response = build_response(body, response_id="resp_bench", status="in_progress", output=[])
+
+    def with_models() -> int:
+        buffer = bytearray()
+        for sequence_number, delta in enumerate(deltas):
+            event = ResponseOutputTextDeltaStreamingEvent(
+                type=Type49.response_output_text_delta,
+                sequence_number=sequence_number,
+                item_id="msg_bench",
+                output_index=0,
+                content_index=0,
+                delta=delta,
+                logprobs=[],
+            )
+            buffer += encode_sse(event)
+        return len(buffer)
+
+    def with_emitter() -> int:
+        emitter = ResponseStreamEmitter(response)
+        emitter.start_message(item_id="msg_bench")
+        for delta in deltas:
+            emitter.text_delta(delta)
+        return len(emitter.take())
+
+    models = min(timeit.repeat(with_models, number=1, repeat=args.repeat))
+    emitted = min(timeit.repeat(with_emitter, number=1, repeat=args.repeat))
+
+    print(f"{len(deltas)} deltas of {args.delta_size} chars")
+    print(f"model + model_dump_json: {models * 1000:8.2f} ms")
+    print(f"ResponseStreamEmitter:   {emitted * 1000:8.2f} ms  ({models / emitted:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+"""Benchmark ``evolve`` against ``model_copy`` for step-by-step response building.
+
+Builds a ``ResponseResource`` with many output messages (with logprobs) and times
+three typical server-side updates with ``model_copy(update=..., deep=True)`` and
+with ``evolve``: a status change, replacing the text of one content part and
+appending an output item.
+
+Usage:
+    python benchmarks/bench_evolve.py [--items N] [--chars N]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types.evolve import evolve
+from openresponses_types.mock_server import stream_events
+from openresponses_types.types import CreateResponseBody, ResponseResource
+
+
+def build(items: int, chars: int) -> ResponseResource:
+    """Return a completed response whose output repeats one streamed message ``items`` times."""
+    body = CreateResponseBody(model="gpt-4", input="Hi")
+    response = list(stream_events(body, output_chars=chars, top_logprobs=2))[-1].response
+    message = response.output[0]
+    return response.model_copy(update={"output": [message.model_copy(deep=True) for _ in range(items)]})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark evolve against model_copy")
+    parser.add_argument("--items", type=int, default=20, help="Output items in the response")
+    parser.add_argument("--chars", type=int, default=500, help="Text length of each output item")
+    parser.add_argument("--number", type=int, default=20, help="Updates per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    response = build(args.items, args.chars)
+    message = response.output[0]
+    index = args.items // 2
+    part = response.output[index].content[0]
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number  # type: ignore[arg-type]
+
+    cases = {
+        "status": (
+            lambda: response.model_copy(update={"status": "completed"}, deep=True),
+            lambda: evolve(response, status="completed"),
+        ),
+        f"output[{index}].content[0].text": (
+            lambda: response.model_copy(deep=True).output[index].content[0].__setattr__("text", "x"),
+            lambda: evolve(response, {f"output[{index}].content[0].text": "x"}),
+        ),
+        "append output item": (
+            lambda: response.model_copy(update={"output": [*response.output, message]}, deep=True),
+            lambda: evolve(response, output=[*response.output, message]),
+        ),
+    }
+    print(f"ResponseResource with {args.items} output items of {len(part.text)} chars")
+    for name, (copy, evolved) in cases.items():
+        copy_time, evolve_time = best(copy), best(evolved)
+        print(
+            f"  {name:28s} model_copy(deep) {copy_time * 1e6:9.1f} us  evolve {evolve_time * 1e6:7.1f} us"
+            f"  ({copy_time / evolve_time:.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
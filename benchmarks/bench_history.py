@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+"""Benchmark converting long response histories into input items.
+
+Compares the direct field-mapping converters in ``openresponses_types.history``
+against dumping each output item to a dict and validating it as an input item.
+
+Usage:
+    python benchmarks/bench_history.py [--items N] [--repeat R]
+"""
+
+import argparse
+import timeit
+
+from pydantic import TypeAdapter
+
+from openresponses_types.history import InputItem, OutputItem, to_input_items
+
+
+def make_history(n_items: int) -> list[OutputItem]:
+    """Build a realistic mix of messages, function calls and outputs."""
+    raw = []
+    for index in range(n_items // 3):
+        call_id = f"call_{index}"
+        raw.append(
+            {
+                "type": "function_call",
+                "id": f"fc_{index}",
+                "call_id": call_id,
+                "name": "search",
+                "arguments": '{"query": "weather in Paris", "limit": 5}',
+                "status": "completed",
+            }
+        )
+        raw.append(
+            {
+                "type": "function_call_output",
+                "id": f"fco_{index}",
+                "call_id": call_id,
+                "output": "Sunny, 24 degrees. " * 10,
+                "status": "completed",
+            }
+        )
+        raw.append(
+            {
+                "type": "message",
+                "id": f"msg_{index}",
+                "status": "completed",
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": "It is sunny. " * 20, "annotations": [], "logprobs": []}],
+            }
+        )
+    return TypeAdapter(list[OutputItem]).validate_python(raw)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark history conversion")
+    parser.add_argument("--items", type=int, default=3000, help="Number of output items in the history")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    history = make_history(args.items)
+    adapter = TypeAdapter(list[InputItem])
+
+    def round_trip() -> None:
+        adapter.validate_python([item.model_dump() for item in history])
+
+    def direct() -> None:
+        to_input_items(history)
+
+    baseline = min(timeit.repeat(round_trip, number=1, repeat=args.repeat))
+    converted = min(timeit.repeat(direct, number=1, repeat=args.repeat))
+
+    print(f"items: {len(history)}")
+    print(f"dump + validate: {baseline * 1000:8.2f} ms")
+    print(f"direct convert:  {converted * 1000:8.2f} ms  ({baseline / converted:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
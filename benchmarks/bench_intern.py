@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""Benchmark memory held by many parsed responses with and without interning.
+
+Builds a corpus of ``ResponseResource`` JSON documents sharing long instructions,
+tool definitions with schemas, metadata and model names (as a multi-tenant
+service would hold), parses them in a fresh child process per mode and reports
+the resident set size growth and the ``tracemalloc`` total.
+
+Usage:
+    python benchmarks/bench_intern.py [--responses N]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tracemalloc
+
+INSTRUCTIONS = [f"Tenant {tenant} policy: answer briefly and cite the knowledge base. " * 30 for tenant in range(5)]
+TOOLS = [
+    {
+        "type": "function",
+        "name": f"tool_{index}",
+        "description": f"Tool number {index}: looks things up in the catalogue and returns matching records. " * 3,
+        "parameters": {
+            "type": "object",
+            "properties": {"query": {"type": "string"}, "limit": {"type": "integer", "minimum": 1}},
+            "required": ["query"],
+            "additionalProperties": False,
+        },
+        "strict": True,
+    }
+    for index in range(8)
+]
+
+
+def corpus(count: int) -> list[str]:
+    """Return ``count`` response documents as JSON text."""
+    from openresponses_types.mock_server import build_response, make_text
+    from openresponses_types.types import CreateResponseBody, Message, MessageRole, MessageStatus, OutputTextContent
+
+    documents = []
+    for index in range(count):
+        body = CreateResponseBody(
+            model=f"gpt-4.1-{index % 3}", input="Hi", instructions=INSTRUCTIONS[index % 5], metadata={"tenant": "t"}
+        )
+        message = Message(
+            type="message",
+            id=f"msg_{index}",
+            status=MessageStatus.completed,
+            role=MessageRole.assistant,
+            content=[OutputTextContent(type="output_text", text=make_text(200), annotations=[], logprobs=[])],
+        )
+        data = build_response(body, response_id=f"resp_{index}", status="completed", output=[message]).model_dump(
+            mode="json"
+        )
+        data["tools"] = TOOLS
+        documents.append(json.dumps(data))
+    return documents
+
+
+def _rss_kib() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize() // 1024
+
+
+def measure(count: int, intern: bool) -> None:
+    """Parse the corpus in this process and print RSS growth and traced bytes."""
+    from openresponses_types.intern import InternTable, parse_response
+    from openresponses_types.types import ResponseResource
+
+    documents = corpus(count)
+    table = InternTable()
+    tracemalloc.start()
+    before = _rss_kib()
+    if intern:
+        held = [parse_response(document, table) for document in documents]
+    else:
+        held = [ResponseResource.model_validate_json(document) for document in documents]
+    traced, _ = tracemalloc.get_traced_memory()
+    print(json.dumps({"rss_kib": _rss_kib() - before, "traced_kib": traced // 1024, "held": len(held)}))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark interning memory savings")
+    parser.add_argument("--responses", type=int, default=5000, help="Number of responses to hold")
+    parser.add_argument("--mode", choices=["plain", "intern"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        measure(args.responses, args.mode == "intern")
+        return
+
+    results = {}
+    for mode in ("plain", "intern"):
+        command = [sys.executable, __file__, "--responses", str(args.responses), "--mode", mode]
+        results[mode] = json.loads(subprocess.run(command, check=True, capture_output=True, text=True).stdout)
+
+    plain, interned = results["plain"], results["intern"]
+    print(f"{args.responses} responses held")
+    print(f"plain:    RSS +{plain['rss_kib'] / 1024:7.1f} MiB, traced {plain['traced_kib'] / 1024:7.1f} MiB")
+    print(f"interned: RSS +{interned['rss_kib'] / 1024:7.1f} MiB, traced {interned['traced_kib'] / 1024:7.1f} MiB")
+    print(f"reduction: {1 - interned['rss_kib'] / plain['rss_kib']:.0%} RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Benchmark rejecting oversized request bodies with ``check_limits``.
+
+Times a ``CreateResponseBody`` whose last input item carries a text over the
+10 MiB limit, and a valid body of many small items, with ``check_limits``
+against ``model_validate_json`` (which only reports ``string_too_long`` after
+decoding the whole body) and ``pydantic_core.from_json``.
+
+Usage:
+    python benchmarks/bench_limits.py [--mib N] [--items N]
+"""
+
+import argparse
+import json
+import timeit
+
+import pydantic_core
+from pydantic import ValidationError
+
+from openresponses_types.limits import check_limits
+from openresponses_types.types import CreateResponseBody
+
+
+def body(items: int, text_chars: int) -> bytes:
+    """Return a request body of ``items`` short messages followed by one with ``text_chars`` characters."""
+    messages = [
+        {"type": "message", "role": "user", "content": [{"type": "input_text", "text": f"Message {index}"}]}
+        for index in range(items)
+    ]
+    if text_chars:
+        messages.append(
+            {"type": "message", "role": "user", "content": [{"type": "input_text", "text": "x" * text_chars}]}
+        )
+    return json.dumps({"model": "gpt-4", "input": messages}).encode()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the limits pre-check")
+    parser.add_argument("--mib", type=int, default=12, help="Size of the oversized text in MiB")
+    parser.add_argument("--items", type=int, default=200, help="Short input items in each body")
+    parser.add_argument("--number", type=int, default=5, help="Calls per repetition")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number  # type: ignore[arg-type]
+
+    def validate(data: bytes) -> object:
+        try:
+            return CreateResponseBody.model_validate_json(data)
+        except ValidationError as exc:
+            return exc.errors()
+
+    for label, data in [
+        (f"oversized ({args.mib} MiB text)", body(args.items, args.mib << 20)),
+        ("valid", body(args.items, 0)),
+    ]:
+        print(f"{label}, {len(data) / 1024:.0f} KiB: {check_limits(data, CreateResponseBody)}")
+        baseline = best(lambda: validate(data))  # noqa: B023
+        for name, func in [
+            ("model_validate_json", lambda: validate(data)),  # noqa: B023
+            ("from_json", lambda: pydantic_core.from_json(data)),  # noqa: B023
+            ("check_limits", lambda: check_limits(data, CreateResponseBody)),  # noqa: B023
+        ]:
+            seconds = best(func)
+            print(f"  {name:20s} {seconds * 1e3:9.2f} ms  ({baseline / seconds:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+"""Benchmark ``Literal`` aliases against ``StrEnum`` classes on the event hot path.
+
+Builds the ``--literal-enums`` variant of ``openresponses_types.types`` in memory
+with ``scripts/generate_types.py`` and compares parsing, constructing and dumping
+``response.output_text.delta`` events with both variants.
+
+Usage:
+    python benchmarks/bench_literal_enums.py [--events N]
+"""
+
+import argparse
+import importlib.util
+import sys
+import timeit
+import types
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def literal_types() -> types.ModuleType:
+    """Return ``openresponses_types.types`` regenerated with ``Literal`` aliases."""
+    spec = importlib.util.spec_from_file_location("generate_types", PROJECT_ROOT / "scripts" / "generate_types.py")
+    assert spec is not None and spec.loader is not None
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+
+    import openresponses_types.types
+
+    module = types.ModuleType("openresponses_types_literal")
+    sys.modules[module.__name__] = module
+    source = generator.literal_enums(Path(openresponses_types.types.__file__).read_text())
+    exec(compile(source, module.__name__, "exec"), module.__dict__)  # noqa: S102
+    return module
+
+
+def measure(module: types.ModuleType, lines: list[str], *, literal: bool, repeat: int) -> dict[str, float]:
+    """Return the best time of each operation on ``lines`` with the event model of ``module``."""
+    event_type = module.ResponseOutputTextDeltaStreamingEvent
+    type_value = "response.output_text.delta" if literal else module.Type49.response_output_text_delta
+    parsed = [event_type.model_validate_json(line) for line in lines]
+    dumped = [event.model_dump() for event in parsed]
+
+    def construct() -> None:
+        for index in range(len(lines)):
+            event_type(
+                type=type_value,
+                sequence_number=index,
+                item_id="msg_bench",
+                output_index=0,
+                content_index=0,
+                delta="word ",
+                logprobs=[],
+            )
+
+    operations = {
+        "model_validate_json": lambda: [event_type.model_validate_json(line) for line in lines],
+        "model_validate": lambda: [event_type.model_validate(data) for data in dumped],
+        "construct": construct,
+        "model_dump_json": lambda: [event.model_dump_json() for event in parsed],
+        "model_dump": lambda: [event.model_dump() for event in parsed],
+    }
+    return {name: min(timeit.repeat(func, number=1, repeat=repeat)) for name, func in operations.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Literal aliases against StrEnum classes")
+    parser.add_argument("--events", type=int, default=5000, help="Number of text delta events")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    from openresponses_types import types as enum_types
+
+    variants = {"StrEnum": enum_types, "Literal": literal_types()}
+    lines = [
+        enum_types.ResponseOutputTextDeltaStreamingEvent(
+            type=enum_types.Type49.response_output_text_delta,
+            sequence_number=index,
+            item_id="msg_bench",
+            output_index=0,
+            content_index=0,
+            delta="word ",
+            logprobs=[],
+        ).model_dump_json()
+        for index in range(args.events)
+    ]
+
+    print(f"{args.events} response.output_text.delta events")
+    results = {
+        label: measure(module, lines, literal=label == "Literal", repeat=args.repeat)
+        for label, module in variants.items()
+    }
+    for name in results["StrEnum"]:
+        enum_time, literal_time = results["StrEnum"][name], results["Literal"][name]
+        print(
+            f"  {name:20s} StrEnum {enum_time * 1000:8.2f} ms  Literal {literal_time * 1000:8.2f} ms"
+            f"  ({enum_time / literal_time:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""Benchmark parsing response snapshots with and without a shared ``ParseContext``.
+
+Records the lifecycle events (``response.created``, ``response.in_progress``,
+``response.completed``) of a stream whose request carries many function tools
+with JSON Schemas and long instructions, and parses them with ``iter_events``
+alone and with a fresh ``ParseContext`` per stream, for several numbers of tools.
+The context is meant for requests with many large tools: with a handful of them
+it costs more than it saves.
+
+Usage:
+    python benchmarks/bench_parse_context.py [--tools N,N,...] [--output-chars N]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types.mock_server import encode_sse, stream_events
+from openresponses_types.streaming import ParseContext, iter_events
+from openresponses_types.types import CreateResponseBody
+
+
+def tool(index: int) -> dict[str, object]:
+    """Return a function tool definition with a moderately sized parameter schema."""
+    properties = {
+        f"field_{field}": {"type": "string", "description": f"Value of field {field} used to filter results."}
+        for field in range(8)
+    }
+    return {
+        "type": "function",
+        "name": f"tool_{index}",
+        "description": "Looks up records in the catalogue and returns the matching entries. " * 2,
+        "parameters": {"type": "object", "properties": properties, "required": ["field_0"]},
+        "strict": True,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark structural sharing of response snapshots")
+    parser.add_argument("--tools", default="8,64,256", help="Comma-separated numbers of function tools to try")
+    parser.add_argument("--output-chars", type=int, default=200, help="Length of streamed output text")
+    parser.add_argument("--number", type=int, default=50, help="Streams parsed per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number  # type: ignore[arg-type]
+
+    for tools in map(int, args.tools.split(",")):
+        body = CreateResponseBody.model_validate(
+            {
+                "model": "gpt-4",
+                "input": "Find the order.",
+                "instructions": "Answer briefly and cite the catalogue. " * 40,
+                "tools": [tool(index) for index in range(tools)],
+                "metadata": {"tenant": "acme"},
+            }
+        )
+        events = stream_events(body, output_chars=args.output_chars)
+        frames = [encode_sse(event) for event in events if hasattr(event, "response")]
+
+        plain = best(lambda frames=frames: list(iter_events(frames)))
+        shared = best(lambda frames=frames: list(iter_events(frames, context=ParseContext())))
+        print(f"{len(frames)} snapshot events, {sum(map(len, frames))} B, {tools} tools")
+        print(f"  iter_events:              {plain * 1000:8.2f} ms per stream")
+        print(f"  iter_events(context=...): {shared * 1000:8.2f} ms per stream  ({plain / shared:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+"""Benchmark incremental parsing of streamed function call arguments.
+
+Splits a large arguments payload into small deltas and compares re-parsing the
+accumulated string after every delta (with a best-effort closing suffix) against
+feeding each delta to ``PartialJSONParser``.
+
+Usage:
+    python benchmarks/bench_partial_json.py [--kib N] [--delta-size N]
+"""
+
+import argparse
+import json
+import timeit
+
+from openresponses_types.mock_server import make_text
+from openresponses_types.partial_json import PartialJSONParser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark partial JSON parsing of argument deltas")
+    parser.add_argument("--kib", type=int, default=64, help="Size of the arguments payload in KiB")
+    parser.add_argument("--delta-size", type=int, default=8, help="Characters per delta")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    lines = [make_text(60) for _ in range(args.kib * 1024 // 64)]
+    text = json.dumps({"path": "notes.txt", "lines": lines})
+    deltas = [text[index : index + args.delta_size] for index in range(0, len(text), args.delta_size)]
+
+    def reparse() -> object:
+        accumulated = ""
+        value = None
+        for delta in deltas:
+            accumulated += delta
+            for suffix in ("", '"]}', "]}", "}"):
+                try:
+                    value = json.loads(accumulated + suffix)
+                    break
+                except ValueError:
+                    continue
+        return value
+
+    def incremental() -> object:
+        partial = PartialJSONParser()
+        for delta in deltas:
+            partial.feed(delta)
+        return partial.close()
+
+    slow = min(timeit.repeat(reparse, number=1, repeat=args.repeat))
+    fast = min(timeit.repeat(incremental, number=1, repeat=args.repeat))
+
+    print(f"payload: {len(text) / 1024:.0f} KiB in {len(deltas)} deltas")
+    print(f"re-parse accumulated: {slow * 1000:9.2f} ms")
+    print(f"PartialJSONParser:    {fast * 1000:9.2f} ms  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Benchmark reading routing fields with ``peek`` against full validation.
+
+Times reading ``model``, ``stream`` and ``previous_response_id`` from a
+``CreateResponseBody`` with a long conversation, and ``response.usage`` from a
+``response.completed`` event, with ``peek`` (with and without field validation),
+``pydantic_core.from_json`` and ``model_validate_json``.
+
+Usage:
+    python benchmarks/bench_peek.py [--turns N] [--output-chars N]
+"""
+
+import argparse
+import timeit
+
+import pydantic_core
+
+from openresponses_types.mock_server import make_text, stream_events
+from openresponses_types.peek import peek
+from openresponses_types.types import CreateResponseBody, ResponseCompletedStreamingEvent
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark peek against full validation")
+    parser.add_argument("--turns", type=int, default=50, help="Conversation turns in the request body")
+    parser.add_argument("--output-chars", type=int, default=2000, help="Length of the completed response text")
+    parser.add_argument("--number", type=int, default=200, help="Calls per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number  # type: ignore[arg-type]
+
+    def report(label: str, results: dict[str, float]) -> None:
+        print(label)
+        baseline = results["model_validate_json"]
+        for name, seconds in results.items():
+            print(f"  {name:22s} {seconds * 1e6:9.1f} us  ({baseline / seconds:.1f}x)")
+
+    turns = [
+        {"type": "message", "role": role, "content": make_text(300)}
+        for _ in range(args.turns)
+        for role in ("user", "assistant")
+    ]
+    body = CreateResponseBody.model_validate(
+        {"model": "gpt-4", "input": turns, "stream": True, "previous_response_id": "resp_1"}
+    ).model_dump_json(exclude_none=True)
+    paths = ["model", "stream", "previous_response_id"]
+    report(
+        f"CreateResponseBody ({len(body)} B), {', '.join(paths)}:",
+        {
+            "model_validate_json": best(lambda: CreateResponseBody.model_validate_json(body)),
+            "from_json": best(lambda: pydantic_core.from_json(body)),
+            "peek": best(lambda: peek(body, paths)),
+            "peek(model=...)": best(lambda: peek(body, paths, model=CreateResponseBody)),
+        },
+    )
+
+    report(
+        "CreateResponseBody, model (found before input, scanning stops):",
+        {
+            "model_validate_json": best(lambda: CreateResponseBody.model_validate_json(body)),
+            "from_json": best(lambda: pydantic_core.from_json(body)),
+            "peek": best(lambda: peek(body, ["model"])),
+            "peek(model=...)": best(lambda: peek(body, ["model"], model=CreateResponseBody)),
+        },
+    )
+
+    request = CreateResponseBody(model="gpt-4", input="Hi")
+    event = list(stream_events(request, output_chars=args.output_chars, top_logprobs=2))[-1]
+    data = event.model_dump_json()
+    report(
+        f"ResponseCompletedStreamingEvent ({len(data)} B), response.usage:",
+        {
+            "model_validate_json": best(lambda: ResponseCompletedStreamingEvent.model_validate_json(data)),
+            "from_json": best(lambda: pydantic_core.from_json(data)),
+            "peek": best(lambda: peek(data, ["response.usage"])),
+            "peek(model=...)": best(lambda: peek(data, ["response.usage"], model=ResponseCompletedStreamingEvent)),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Benchmark rejecting malformed request bodies with ``validate_or_reject``.
+
+Times ``CreateResponseBody`` payloads that are invalid in typical ways (a bad
+role in every input item, a wrong content part type, a missing tool name, a wrong
+scalar type) with ``model_validate_json`` (counting the errors only, and
+rendering them with ``errors()``) against ``validate_or_reject``, and the cost of
+both on a valid payload.
+
+Usage:
+    python benchmarks/bench_rejection.py [--items N]
+"""
+
+import argparse
+import json
+import timeit
+
+from pydantic import ValidationError
+
+from openresponses_types.rejection import validate_or_reject
+from openresponses_types.types import CreateResponseBody
+
+
+def payloads(items: int) -> dict[str, str]:
+    """Return one valid and several malformed request bodies with ``items`` input items."""
+    message = {"type": "message", "role": "user", "content": [{"type": "input_text", "text": "Hello there"}]}
+    tool = {"type": "function", "name": "lookup", "parameters": {"type": "object"}}
+    valid = {"model": "gpt-4", "input": [message] * items, "tools": [tool] * 4}
+    return {
+        "valid": json.dumps(valid),
+        "bad role": json.dumps({**valid, "input": [{**message, "role": "robot"}] * items}),
+        "bad content part": json.dumps(
+            {**valid, "input": [{**message, "content": [{"type": "input_text", "text": 1}]}] * items}
+        ),
+        "missing tool name": json.dumps({**valid, "tools": [{"type": "function"}] * 4}),
+        "wrong scalar": json.dumps({**valid, "temperature": "hot"}),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark fast rejection of malformed payloads")
+    parser.add_argument("--items", type=int, default=20, help="Input items per request body")
+    parser.add_argument("--number", type=int, default=50, help="Calls per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    def best(func: object) -> float:
+        return min(timeit.repeat(func, number=args.number, repeat=args.repeat)) / args.number  # type: ignore[arg-type]
+
+    def count(data: str) -> int:
+        try:
+            CreateResponseBody.model_validate_json(data)
+        except ValidationError as exc:
+            return exc.error_count()
+        return 0
+
+    def render(data: str) -> object:
+        try:
+            return CreateResponseBody.model_validate_json(data)
+        except ValidationError as exc:
+            return exc.errors()
+
+    validate_or_reject("{}", CreateResponseBody)
+    for name, data in payloads(args.items).items():
+        full = best(lambda: render(data))  # noqa: B023
+        counted = best(lambda: count(data))  # noqa: B023
+        fast = best(lambda: validate_or_reject(data, CreateResponseBody))  # noqa: B023
+        print(f"{name} ({count(data)} errors): {validate_or_reject(data, CreateResponseBody)!r:.70}")
+        print(f"  model_validate_json + errors()   {full * 1e6:9.1f} us")
+        print(f"  model_validate_json, count only  {counted * 1e6:9.1f} us")
+        print(f"  validate_or_reject               {fast * 1e6:9.1f} us  ({full / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
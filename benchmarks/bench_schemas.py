@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Benchmark serving JSON Schemas from the prebuilt files against ``model_json_schema()``.
+
+Times, for ``CreateResponseBody``, ``ResponseResource`` and every streaming event
+model, generating the schema with ``model_json_schema()`` plus ``json.dumps``
+against the first (file read) and later (cached) calls of ``json_schema_bytes``,
+as a freshly started worker would see them.
+
+Usage:
+    python benchmarks/bench_schemas.py [--repeat N]
+"""
+
+import argparse
+import json
+import time
+
+from openresponses_types import schemas
+from openresponses_types._cache import LRUCache
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark prebuilt JSON Schema loading")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    models = [
+        model
+        for name, model in schemas.public_models().items()
+        if name in ("CreateResponseBody", "ResponseResource") or name.endswith("StreamingEvent")
+    ]
+
+    def best(func: object) -> float:
+        timings = []
+        for _ in range(args.repeat):
+            schemas._SCHEMAS = LRUCache(256)
+            start = time.perf_counter()
+            func()  # type: ignore[operator]
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def generate() -> None:
+        for model in models:
+            json.dumps(model.model_json_schema(), separators=(",", ":")).encode()
+
+    def load() -> None:
+        for model in models:
+            schemas.json_schema_bytes(model)
+
+    def load_twice() -> None:
+        load()
+        start = time.perf_counter()
+        load()
+        cached.append(time.perf_counter() - start)
+
+    cached: list[float] = []
+    generated, loaded = best(generate), best(load)
+    best(load_twice)
+    print(f"{len(models)} models")
+    print(f"  model_json_schema + dumps  {generated * 1e3:8.2f} ms")
+    print(f"  json_schema_bytes (files)  {loaded * 1e3:8.2f} ms  ({generated / loaded:.0f}x)")
+    print(f"  json_schema_bytes (cached) {min(cached) * 1e3:8.2f} ms  ({generated / min(cached):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
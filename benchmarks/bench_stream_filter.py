@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""Benchmark SSE parsing with and without an event-type subscription.
+
+Records a reasoning-heavy stream from the mock server's event generator and parses
+it with a plain ``SSEParser`` and with one subscribed only to
+``response.output_text.delta`` and ``response.completed``.
+
+Usage:
+    python benchmarks/bench_stream_filter.py [--reasoning-chars N] [--output-chars N] [--no-event-lines]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types.mock_server import encode_sse, stream_events
+from openresponses_types.streaming import SSEParser
+from openresponses_types.types import CreateResponseBody
+
+SUBSCRIBED = {"response.output_text.delta", "response.completed"}
+
+
+def record_stream(reasoning_chars: int, output_chars: int, event_lines: bool) -> bytes:
+    """Return the raw SSE bytes of one synthetic response."""
+    body = CreateResponseBody(model="gpt-4", input="Explain the weather.")
+    frames = [
+        encode_sse(event)
+        for event in stream_events(body, output_chars=output_chars, reasoning_chars=reasoning_chars, delta_size=4)
+    ]
+    if not event_lines:
+        frames = [frame.split(b"\n", 1)[1] for frame in frames]
+    return b"".join(frames)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark subscribed SSE parsing")
+    parser.add_argument("--reasoning-chars", type=int, default=16000, help="Length of streamed reasoning text")
+    parser.add_argument("--output-chars", type=int, default=2000, help="Length of streamed output text")
+    parser.add_argument("--no-event-lines", action="store_true", help="Omit SSE event: lines (type sniffed from data)")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    raw = record_stream(args.reasoning_chars, args.output_chars, not args.no_event_lines)
+    chunks = [raw[index : index + 4096] for index in range(0, len(raw), 4096)]
+
+    def parse(subscribe: set[str] | None) -> int:
+        sse = SSEParser(subscribe)
+        count = sum(len(sse.feed(chunk)) for chunk in chunks)
+        return count + len(sse.flush())
+
+    total = parse(None)
+    kept = parse(SUBSCRIBED)
+    full = min(timeit.repeat(lambda: parse(None), number=1, repeat=args.repeat))
+    filtered = min(timeit.repeat(lambda: parse(SUBSCRIBED), number=1, repeat=args.repeat))
+
+    print(f"stream: {len(raw) / 1024:.0f} KiB, {total} events, {kept} subscribed")
+    print(f"parse all:        {full * 1000:8.2f} ms")
+    print(f"subscribed only:  {filtered * 1000:8.2f} ms  ({full / filtered:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+"""Benchmark strict-mode validation against the default (lax) models.
+
+Validates a ``CreateResponseBody`` with tools, messages and sampling parameters
+and all events of a synthetic stream from JSON with ``openresponses_types.types``
+and ``openresponses_types.strict``, and times ``to_strict`` / ``to_lax`` on the
+final response.
+
+Usage:
+    python benchmarks/bench_strict.py [--output-chars N] [--top-logprobs N]
+"""
+
+import argparse
+import timeit
+
+from openresponses_types import strict, types
+from openresponses_types.mock_server import stream_events
+
+REQUEST = {
+    "model": "gpt-4",
+    "input": [
+        {"type": "message", "role": "system", "content": "You are terse."},
+        {"type": "message", "role": "user", "content": [{"type": "input_text", "text": "What is the weather?"}]},
+    ],
+    "tools": [
+        {
+            "type": "function",
+            "name": f"tool_{index}",
+            "description": "Looks things up.",
+            "parameters": {"type": "object", "properties": {"q": {"type": "string"}}},
+            "strict": True,
+        }
+        for index in range(4)
+    ],
+    "temperature": 0.7,
+    "top_p": 1.0,
+    "max_output_tokens": 512,
+    "top_logprobs": 2,
+    "metadata": {"tenant": "acme"},
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark strict-mode model validation")
+    parser.add_argument("--output-chars", type=int, default=2000, help="Length of streamed output text")
+    parser.add_argument("--top-logprobs", type=int, default=2, help="Alternatives per logprob")
+    parser.add_argument("--number", type=int, default=200, help="Request validations per repetition")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions")
+    args = parser.parse_args()
+
+    def best(func: object, number: int = 1) -> float:
+        return min(timeit.repeat(func, number=number, repeat=args.repeat)) / number  # type: ignore[arg-type]
+
+    def compare(label: str, lax: float, strict_time: float, unit: float = 1e3, suffix: str = "ms") -> None:
+        print(f"  {label:22s} lax {lax * unit:8.2f} {suffix}  strict {strict_time * unit:8.2f} {suffix}", end="")
+        print(f"  ({lax / strict_time:.2f}x)")
+
+    request = types.CreateResponseBody.model_validate(REQUEST).model_dump_json(exclude_none=True)
+    lax_body = types.CreateResponseBody.model_validate_json
+    strict_body = strict.CreateResponseBody.model_validate_json
+    print("CreateResponseBody.model_validate_json:")
+    compare(
+        "per request",
+        best(lambda: lax_body(request), args.number),
+        best(lambda: strict_body(request), args.number),
+        1e6,
+        "us",
+    )
+
+    body = types.CreateResponseBody(model="gpt-4", input="Hi")
+    events = list(stream_events(body, output_chars=args.output_chars, top_logprobs=args.top_logprobs))
+    lines = [(type(event), type(strict.to_strict(event)), event.model_dump_json()) for event in events]
+    print(f"{len(events)} streaming events, model_validate_json:")
+    compare(
+        "all events",
+        best(lambda: [lax_type.model_validate_json(line) for lax_type, _, line in lines]),
+        best(lambda: [strict_type.model_validate_json(line) for _, strict_type, line in lines]),
+    )
+
+    response = events[-1].response
+    strict_response = strict.to_strict(response)
+    response_json = response.model_dump_json()
+    print("ResponseResource:")
+    compare(
+        "model_validate_json",
+        best(lambda: types.ResponseResource.model_validate_json(response_json)),
+        best(lambda: strict.ResponseResource.model_validate_json(response_json)),
+    )
+    print(f"  to_strict {best(lambda: strict.to_strict(response)) * 1e3:8.2f} ms", end="")
+    print(f"  to_lax {best(lambda: strict.to_lax(strict_response)) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
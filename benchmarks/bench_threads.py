@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""Benchmark multi-threaded validation throughput against thread count.
+
+Records the events of synthetic streams as JSON lines, then has N threads each
+validate every recorded payload (``parse_event`` for events and
+``ResponseResource.model_validate_json`` for the final responses) and reports
+payloads per second for each thread count. Throughput only scales on a
+free-threaded build (``python3.13t``); with the GIL it stays flat.
+
+Usage:
+    python benchmarks/bench_threads.py [--threads 1,2,4,8] [--streams N]
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from openresponses_types.mock_server import stream_events
+from openresponses_types.streaming import parse_event
+from openresponses_types.types import CreateResponseBody, ResponseResource
+
+
+def record(streams: int, output_chars: int) -> list[tuple[Callable[[str], object], str]]:
+    """Return ``(validator, payload)`` pairs for the events and responses of ``streams`` streams."""
+    payloads: list[tuple[Callable[[str], object], str]] = []
+    for index in range(streams):
+        body = CreateResponseBody(model=f"gpt-4.1-{index % 3}", input="Hi")
+        events = list(stream_events(body, output_chars=output_chars, top_logprobs=1))
+        payloads.extend((parse_event, event.model_dump_json()) for event in events)
+        payloads.append((ResponseResource.model_validate_json, events[-1].response.model_dump_json()))
+    return payloads
+
+
+def run(threads: int, payloads: list[tuple[Callable[[str], object], str]], rounds: int) -> float:
+    """Return payloads validated per second with ``threads`` threads each validating every payload."""
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(rounds):
+            for validate, payload in payloads:
+                validate(payload)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    return threads * rounds * len(payloads) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark validation throughput with threads")
+    parser.add_argument("--threads", default="1,2,4,8", help="Comma-separated thread counts")
+    parser.add_argument("--streams", type=int, default=4, help="Number of recorded streams")
+    parser.add_argument("--output-chars", type=int, default=400, help="Length of each streamed output text")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over the payloads per thread")
+    args = parser.parse_args()
+
+    payloads = record(args.streams, args.output_chars)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{len(payloads)} payloads, Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+    baseline = 0.0
+    for threads in (int(count) for count in args.threads.split(",")):
+        throughput = run(threads, payloads, args.rounds)
+        baseline = baseline or throughput
+        print(f"  {threads:3d} threads: {throughput:10.0f} payloads/s  ({throughput / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
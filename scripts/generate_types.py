@@ -5,15 +5,17 @@ This script downloads the OpenResponses OpenAPI spec, detects changes,
 and regenerates Pydantic models when the spec has been updated.
 
 Usage:
-    python scripts/generate_types.py [--force] [--check] [--version]
+    python scripts/generate_types.py [--force] [--check] [--version] [--literal-enums]
 
 Options:
-    --force     Regenerate even if spec hasn't changed
-    --check     Check if spec has changed without regenerating (exit 1 if changed)
-    --version   Show current spec version and hash, then exit
+    --force          Regenerate even if spec hasn't changed
+    --check          Check if spec has changed without regenerating (exit 1 if changed)
+    --version        Show current spec version and hash, then exit
+    --literal-enums  Annotate enum-valued fields with Literal aliases instead of StrEnum classes
 """
 
 import argparse
+import ast
 import hashlib
 import json
 import re
@@ -31,6 +33,8 @@ SPEC_CACHE_FILE = SPEC_CACHE_DIR / "openapi.json"
 SPEC_HASH_FILE = SPEC_CACHE_DIR / "openapi.sha256"
 SPEC_VERSION_FILE = SPEC_CACHE_DIR / "openapi.version"
 OUTPUT_FILE = PROJECT_ROOT / "src" / "openresponses_types" / "types.py"
+STRICT_FILE = PROJECT_ROOT / "src" / "openresponses_types" / "strict.py"
+SCHEMAS_DIR = PROJECT_ROOT / "src" / "openresponses_types" / "_json_schemas"
 INIT_FILE = PROJECT_ROOT / "src" / "openresponses_types" / "__init__.py"
 PYPROJECT_FILE = PROJECT_ROOT / "pyproject.toml"
 
@@ -50,6 +54,71 @@ To regenerate:
 
 '''
 
+STRICT_HEADER = '''\
+"""Auto-generated strict-mode Pydantic models from OpenResponses OpenAPI specification.
+
+DO NOT EDIT THIS FILE MANUALLY.
+
+Every model of ``openresponses_types.types`` with ``strict=True``: no coercions
+(``"3"`` is not an ``int``), so validation of exact JSON is cheaper and stricter.
+Enum classes are shared with ``openresponses_types.types``; in Python (not JSON)
+input, enum-valued fields require enum members. ``to_strict()`` and ``to_lax()``
+convert between the two namespaces without revalidating.
+
+This file is generated by: scripts/generate_types.py
+Source: {spec_url}
+Spec Version: {spec_version}
+Spec Hash: {spec_hash}
+
+To regenerate:
+    uv run python scripts/generate_types.py --force
+"""
+
+'''
+
+STRICT_FOOTER = '''
+
+_TO_STRICT: dict[type[BaseModel], type[BaseModel]] = {
+    getattr(_lax, name): model
+    for name, model in list(globals().items())
+    if isinstance(model, type) and issubclass(model, BaseModel) and model.__module__ == __name__
+}
+_TO_LAX = {model: lax for lax, model in _TO_STRICT.items()}
+
+
+def _convert(value: Any, classes: dict[type[BaseModel], type[BaseModel]]) -> Any:
+    target = classes.get(type(value))
+    if target is not None:
+        model = target.__new__(target)
+        fields = {name: _convert(item, classes) for name, item in value.__dict__.items()}
+        object.__setattr__(model, "__dict__", fields)
+        object.__setattr__(model, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        object.__setattr__(model, "__pydantic_extra__", value.__pydantic_extra__)
+        object.__setattr__(model, "__pydantic_private__", value.__pydantic_private__)
+        return model
+    if type(value) is list:
+        return [_convert(item, classes) for item in value]
+    if type(value) is dict:
+        return {key: _convert(item, classes) for key, item in value.items()}
+    return value
+
+
+def to_strict(model: BaseModel) -> BaseModel:
+    """Return the strict-mode counterpart of an ``openresponses_types.types`` model, without revalidating."""
+    if type(model) not in _TO_STRICT:
+        raise TypeError(f"{type(model).__qualname__} is not a model of openresponses_types.types")
+    strict: BaseModel = _convert(model, _TO_STRICT)
+    return strict
+
+
+def to_lax(model: BaseModel) -> BaseModel:
+    """Return the ``openresponses_types.types`` counterpart of a strict-mode model, without revalidating."""
+    if type(model) not in _TO_LAX:
+        raise TypeError(f"{type(model).__qualname__} is not a model of openresponses_types.strict")
+    lax: BaseModel = _convert(model, _TO_LAX)
+    return lax
+'''
+
 
 def fetch_spec() -> bytes:
     """Fetch the OpenResponses OpenAPI spec from the remote URL."""
@@ -115,23 +184,123 @@ def fix_discriminator_issues() -> None:
     OUTPUT_FILE.write_text(content)
 
 
-def format_output() -> None:
-    """Format the generated file with ruff."""
+def literal_enums(content: str) -> str:
+    """Rewrite enum-valued field annotations of generated source to ``Literal`` aliases.
+
+    Every ``StrEnum`` class ``Name`` gets a ``NameLiteral = Literal[...]`` alias of
+    its values right after its definition, and model field annotations referring to
+    ``Name`` use the alias instead. The enum classes stay in the module as
+    compatibility exports: their members are ``str`` and still validate, but fields
+    hold (and dump) plain strings. Validating and serializing a ``Literal`` is
+    cheaper than an enum lookup on the event hot path.
+    """
+    tree = ast.parse(content)
+    enums: dict[str, tuple[int, list[str]]] = {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and any(
+            isinstance(base, ast.Name) and base.id == "StrEnum" for base in node.bases
+        ):
+            values = [
+                statement.value.value
+                for statement in node.body
+                if isinstance(statement, ast.Assign)
+                and isinstance(statement.value, ast.Constant)
+                and isinstance(statement.value.value, str)
+            ]
+            enums[node.name] = (node.end_lineno or node.lineno, values)
+
+    references: list[tuple[int, int, int, str]] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef) or node.name in enums:
+            continue
+        for statement in node.body:
+            if not isinstance(statement, ast.AnnAssign):
+                continue
+            for name in ast.walk(statement.annotation):
+                if isinstance(name, ast.Name) and name.id in enums:
+                    references.append((name.lineno, name.col_offset, name.end_col_offset or 0, name.id))
+
+    lines = content.split("\n")
+    for lineno, start, end, name in sorted(references, reverse=True):
+        line = lines[lineno - 1]
+        lines[lineno - 1] = f"{line[:start]}{name}Literal{line[end:]}"
+    for name, (end_lineno, values) in sorted(enums.items(), key=lambda item: item[1][0], reverse=True):
+        alias = f"{name}Literal = Literal[{', '.join(json.dumps(value) for value in values)}]"
+        lines[end_lineno:end_lineno] = ["", "", alias]
+    return "\n".join(lines)
+
+
+def use_literal_enums() -> None:
+    """Apply :func:`literal_enums` to the generated file."""
+    print("Replacing enum field annotations with Literal aliases...")
+    OUTPUT_FILE.write_text(literal_enums(OUTPUT_FILE.read_text()))
+
+
+def strict_variant(content: str) -> str:
+    """Return the body of the strict-mode module for generated ``types.py`` source.
+
+    Models are copied with ``strict=True`` added to their class keywords; enum
+    classes are imported from ``openresponses_types.types`` instead of redefined so
+    both namespaces share them. The module docstring is dropped; blank lines left
+    by removed classes are collapsed by ruff.
+    """
+    tree = ast.parse(content)
+    lines = content.split("\n")
+    keywords: list[tuple[int, int]] = []
+    enums: list[tuple[str, int, int]] = []
+    import_line = 0
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            if any(isinstance(base, ast.Name) and base.id == "StrEnum" for base in node.bases):
+                enums.append((node.name, node.lineno, node.end_lineno or node.lineno))
+            else:
+                last = node.bases[-1]
+                keywords.append((last.end_lineno or last.lineno, last.end_col_offset or 0))
+        elif isinstance(node, ast.ImportFrom) and node.module == "pydantic":
+            import_line = node.end_lineno or node.lineno
+
+    for lineno, col in sorted(keywords, reverse=True):
+        line = lines[lineno - 1]
+        lines[lineno - 1] = f"{line[:col]}, strict=True{line[col:]}"
+    for _, start, end in reversed(enums):
+        del lines[start - 1 : end]
+    lines[import_line:import_line] = [
+        "",
+        "from openresponses_types import types as _lax",
+        f"from openresponses_types.types import {', '.join(name for name, _, _ in enums)}",
+    ]
+    docstring = tree.body[0]
+    if isinstance(docstring, ast.Expr) and isinstance(docstring.value, ast.Constant):
+        del lines[: docstring.end_lineno]
+    return "\n".join(lines)
+
+
+def generate_strict_variant(spec_hash: str, spec_version: str) -> None:
+    """Write the strict-mode variant of the generated file."""
+    print("Generating strict-mode models...")
+    header = STRICT_HEADER.format(spec_url=OPENRESPONSES_SPEC_URL, spec_hash=spec_hash, spec_version=spec_version)
+    STRICT_FILE.write_text(header + strict_variant(OUTPUT_FILE.read_text()).strip() + "\n" + STRICT_FOOTER)
+    format_output(STRICT_FILE)
+    print(f"Generated: {STRICT_FILE}")
+
+
+def format_output(path: Path = OUTPUT_FILE) -> None:
+    """Format a generated file with ruff."""
     print("Formatting with ruff...")
 
     # Fix lint issues (import sorting, trailing newline, etc.)
-    fix_cmd = ["ruff", "check", "--fix", str(OUTPUT_FILE)]
+    fix_cmd = ["ruff", "check", "--fix", str(path)]
     subprocess.run(fix_cmd, capture_output=True, text=True, check=False)
 
     # Format the file
-    format_cmd = ["ruff", "format", str(OUTPUT_FILE)]
+    format_cmd = ["ruff", "format", str(path)]
     result = subprocess.run(format_cmd, capture_output=True, text=True, check=False)
 
     if result.returncode != 0:
         print(f"Warning: ruff formatting failed: {result.stderr}", file=sys.stderr)
 
 
-def generate_models(spec_hash: str, spec_version: str) -> None:
+def generate_models(spec_hash: str, spec_version: str, *, literal: bool = False) -> None:
     """Run datamodel-codegen to generate Pydantic models."""
     print("Generating Pydantic models...")
 
@@ -161,9 +330,35 @@ def generate_models(spec_hash: str, spec_version: str) -> None:
 
     prepend_header(spec_hash, spec_version)
     fix_discriminator_issues()
+    if literal:
+        use_literal_enums()
     format_output()
     update_init_metadata(spec_hash, spec_version)
     print(f"Generated: {OUTPUT_FILE}")
+    generate_strict_variant(spec_hash, spec_version)
+    generate_json_schemas()
+
+
+def generate_json_schemas() -> None:
+    """Write the JSON Schemas of the freshly generated models, importing them in a new interpreter."""
+    print("Generating JSON Schemas...")
+    subprocess.run([sys.executable, __file__, "--write-json-schemas"], check=True)
+    print(f"Generated: {SCHEMAS_DIR}")
+
+
+def write_json_schemas(directory: Path = SCHEMAS_DIR) -> None:
+    """Write one compact JSON Schema file per public model, their spec hash and the pydantic minor version."""
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+    from openresponses_types import __spec_hash__
+    from openresponses_types.schemas import public_models, schema_version
+
+    directory.mkdir(exist_ok=True)
+    for stale in directory.glob("*.json"):
+        stale.unlink()
+    for name, model in public_models().items():
+        (directory / f"{name}.json").write_text(json.dumps(model.model_json_schema(), separators=(",", ":")) + "\n")
+    (directory / "spec.sha256").write_text(f"{__spec_hash__}\n")
+    (directory / "pydantic.version").write_text(f"{schema_version()}\n")
 
 
 def prepend_header(spec_hash: str, spec_version: str) -> None:
@@ -222,8 +417,18 @@ def main() -> None:
         "--check", action="store_true", help="Check if spec has changed without regenerating (exit 1 if changed)"
     )
     parser.add_argument("--version", action="store_true", help="Show current spec version and hash, then exit")
+    parser.add_argument(
+        "--literal-enums",
+        action="store_true",
+        help="Annotate enum-valued fields with Literal aliases instead of StrEnum classes",
+    )
+    parser.add_argument("--write-json-schemas", action="store_true", help=argparse.SUPPRESS)
     args = parser.parse_args()
 
+    if args.write_json_schemas:
+        write_json_schemas()
+        return
+
     if args.version:
         cached_version = get_cached_version()
         cached_hash = get_cached_hash()
@@ -260,7 +465,7 @@ def main() -> None:
         sys.exit(1)
 
     save_spec_cache(spec_content, current_hash, current_version)
-    generate_models(current_hash, current_version)
+    generate_models(current_hash, current_version, literal=args.literal_enums)
 
     print("\nGeneration complete!")
     print(f"Spec version: {current_version}")
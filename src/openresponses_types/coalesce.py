@@ -0,0 +1,191 @@
+"""Merge runs of small delta events before fanning them out.
+
+When deltas carry one or two tokens each, the per-event cost of re-broadcasting
+them dominates. :class:`DeltaCoalescer` merges consecutive text, refusal,
+reasoning, reasoning-summary and function-call-argument deltas that target the
+same ``item_id`` and content/summary index into a single event, within a byte and
+time window. ``logprobs`` are concatenated, and emitted events are renumbered so
+``sequence_number`` stays contiguous and monotonic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Hashable, Iterable, Iterator
+from typing import Any
+
+from openresponses_types.streaming import StreamingEvent
+from openresponses_types.types import (
+    ResponseFunctionCallArgumentsDeltaStreamingEvent,
+    ResponseOutputTextDeltaStreamingEvent,
+    ResponseReasoningDeltaStreamingEvent,
+    ResponseReasoningSummaryDeltaStreamingEvent,
+    ResponseRefusalDeltaStreamingEvent,
+)
+
+DeltaEvent = (
+    ResponseOutputTextDeltaStreamingEvent
+    | ResponseRefusalDeltaStreamingEvent
+    | ResponseReasoningDeltaStreamingEvent
+    | ResponseReasoningSummaryDeltaStreamingEvent
+    | ResponseFunctionCallArgumentsDeltaStreamingEvent
+)
+
+
+def _run_key(event: StreamingEvent) -> Hashable | None:
+    """Return the key under which ``event`` may be merged with its neighbours, or ``None``."""
+    if isinstance(
+        event,
+        ResponseOutputTextDeltaStreamingEvent
+        | ResponseRefusalDeltaStreamingEvent
+        | ResponseReasoningDeltaStreamingEvent,
+    ):
+        return (type(event), event.item_id, event.output_index, event.content_index)
+    if isinstance(event, ResponseReasoningSummaryDeltaStreamingEvent):
+        return (type(event), event.item_id, event.output_index, event.summary_index)
+    if isinstance(event, ResponseFunctionCallArgumentsDeltaStreamingEvent):
+        return (type(event), event.item_id, event.output_index)
+    return None
+
+
+class DeltaCoalescer:
+    """Stateful stage that merges consecutive deltas for the same content part.
+
+    Call :meth:`push` for every event and send what it returns. A run of deltas is
+    flushed when a different event arrives, when its text reaches ``max_bytes``
+    (counted in UTF-8), or when ``max_delay`` seconds of ``clock`` time have passed
+    since its first delta; call :meth:`flush_due` from a timer (or :meth:`flush` at
+    end of stream) so a quiet stream does not hold text back. With
+    ``renumber=False`` merged events keep the ``sequence_number`` of their last
+    delta instead of being renumbered.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int = 1024,
+        max_delay: float | None = 0.05,
+        renumber: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_delay = max_delay
+        self.renumber = renumber
+        self.clock = clock
+        self._run: list[DeltaEvent] = []
+        self._run_key: Hashable | None = None
+        self._run_bytes = 0
+        self._run_started = 0.0
+        self._next_sequence = 0
+
+    @property
+    def pending(self) -> bool:
+        """Whether a run of deltas is waiting to be flushed."""
+        return bool(self._run)
+
+    def deadline(self) -> float | None:
+        """Clock time at which the pending run must be flushed, if any."""
+        if not self._run or self.max_delay is None:
+            return None
+        return self._run_started + self.max_delay
+
+    def push(self, event: StreamingEvent) -> list[StreamingEvent]:
+        """Add ``event`` to the stage and return the events ready to send, in order."""
+        ready: list[StreamingEvent] = []
+        key = _run_key(event)
+        if self._run and key != self._run_key:
+            ready.append(self._take_run())
+        if key is None:
+            ready.append(self._number(event))
+            return ready
+
+        delta: str = event.delta  # type: ignore[union-attr]
+        if not self._run:
+            self._run_key = key
+            self._run_started = self.clock()
+        self._run.append(event)  # type: ignore[arg-type]
+        self._run_bytes += len(delta) if delta.isascii() else len(delta.encode())
+        if self._run_bytes >= self.max_bytes or self._expired():
+            ready.append(self._take_run())
+        return ready
+
+    def flush_due(self) -> list[StreamingEvent]:
+        """Flush the pending run if its time window has elapsed."""
+        return [self._take_run()] if self._run and self._expired() else []
+
+    def flush(self) -> list[StreamingEvent]:
+        """Flush the pending run unconditionally."""
+        return [self._take_run()] if self._run else []
+
+    def _expired(self) -> bool:
+        return self.max_delay is not None and self.clock() - self._run_started >= self.max_delay
+
+    def _take_run(self) -> StreamingEvent:
+        run, self._run, self._run_key, self._run_bytes = self._run, [], None, 0
+        first = run[0]
+        if len(run) == 1:
+            return self._number(first)
+        update: dict[str, Any] = {
+            "delta": "".join([event.delta for event in run]),
+            "sequence_number": run[-1].sequence_number,
+            "obfuscation": None,
+        }
+        if isinstance(first, ResponseOutputTextDeltaStreamingEvent):
+            update["logprobs"] = [
+                logprob
+                for event in run
+                if isinstance(event, ResponseOutputTextDeltaStreamingEvent)
+                for logprob in event.logprobs
+            ]
+        if isinstance(first, ResponseRefusalDeltaStreamingEvent):
+            del update["obfuscation"]
+        return self._number(first.model_copy(update=update))
+
+    def _number(self, event: StreamingEvent) -> StreamingEvent:
+        if not self.renumber:
+            return event
+        sequence_number, self._next_sequence = self._next_sequence, self._next_sequence + 1
+        if event.sequence_number == sequence_number:
+            return event
+        return event.model_copy(update={"sequence_number": sequence_number})
+
+
+def coalesce(events: Iterable[StreamingEvent], **options: Any) -> Iterator[StreamingEvent]:
+    """Coalesce a synchronous event iterable; accepts the :class:`DeltaCoalescer` options."""
+    coalescer = DeltaCoalescer(**options)
+    for event in events:
+        yield from coalescer.push(event)
+        yield from coalescer.flush_due()
+    yield from coalescer.flush()
+
+
+async def acoalesce(events: AsyncIterable[StreamingEvent], **options: Any) -> AsyncIterator[StreamingEvent]:
+    """Coalesce an async event stream, flushing pending deltas when ``max_delay`` elapses."""
+    coalescer = DeltaCoalescer(**options)
+    iterator = aiter(events)
+    next_event: asyncio.Future[StreamingEvent] | None = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(iterator))
+            deadline = coalescer.deadline()
+            timeout = None if deadline is None else max(0.0, deadline - coalescer.clock())
+            done, _ = await asyncio.wait({next_event}, timeout=timeout)
+            if not done:
+                for event in coalescer.flush_due():
+                    yield event
+                continue
+            try:
+                received = next_event.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                next_event = None
+            for event in coalescer.push(received):
+                yield event
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+    for event in coalescer.flush():
+        yield event
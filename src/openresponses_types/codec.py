@@ -0,0 +1,218 @@
+"""Compact, schema-aware binary encoding of the generated models.
+
+For archiving responses and stream events, :func:`encode` writes a model as
+positional arrays in the generated models' field order, so key names such as
+``sequence_number`` or ``output_index`` are not repeated. Models are tagged with a
+small integer for their class and a bitmap of their explicitly set fields (so
+``exclude_unset`` dumps survive the round trip), enum members are encoded as
+small integers, and trailing ``None`` fields are dropped. :func:`decode` rebuilds the models
+without validation, so it is only meant for trusted data written by
+:func:`encode`. The saving grows with payload size; archives of many small stream
+events should use :func:`encode_many` / :func:`decode_many` to share one header
+and one parse.
+
+Payloads are serialized with MessagePack when ``msgpack`` is installed
+(``pip install openresponses-types[msgpack]``) and as compact JSON arrays
+otherwise; the format is recorded in the header, so either can be read back with
+the matching backend. Every payload carries a version tag derived from
+``__spec_hash__``, since the class and enum numbering follows the generated
+``types`` module: data written for another spec version is rejected.
+"""
+
+from __future__ import annotations
+
+import enum
+import importlib.util
+from collections.abc import Iterable
+from typing import Any, Literal, TypeVar, overload
+
+import pydantic_core
+from pydantic import BaseModel
+
+from openresponses_types import __spec_hash__, types
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+Backend = Literal["msgpack", "json"]
+
+MAGIC = b"ORC"
+FORMAT_VERSION = 2
+SPEC_TAG = bytes.fromhex(__spec_hash__)[:8]
+"""First eight bytes of the spec hash, written into every payload header."""
+
+_HEADER_SIZE = len(MAGIC) + 2 + len(SPEC_TAG)
+_BACKEND_CODES: dict[str, bytes] = {"json": b"j", "msgpack": b"m"}
+_ENUM = -1
+_LIST = -2
+_SCALARS = -3
+
+
+class _Plan:
+    """Positional layout of one model class."""
+
+    __slots__ = ("cls", "tag", "names", "bits", "_fields_sets")
+
+    def __init__(self, cls: type[BaseModel], tag: int) -> None:
+        self.cls = cls
+        self.tag = tag
+        self.names = tuple(cls.model_fields)
+        self.bits = {name: 1 << index for index, name in enumerate(self.names)}
+        self._fields_sets: dict[int, frozenset[str]] = {}
+
+    def mask(self, fields_set: set[str]) -> int:
+        """Return the bitmap of ``fields_set`` in field order."""
+        bits = self.bits
+        return sum(bits[name] for name in fields_set if name in bits)
+
+    def fields_set(self, mask: int) -> set[str]:
+        """Return the names of the fields in the bitmap ``mask``."""
+        names = self._fields_sets.get(mask)
+        if names is None:
+            names = frozenset(name for name, bit in self.bits.items() if mask & bit)
+            self._fields_sets[mask] = names
+        return set(names)
+
+
+def _generated(base: type[Any]) -> list[Any]:
+    """Classes deriving from ``base`` defined in the generated module, in a stable order."""
+    return sorted(
+        (
+            obj
+            for obj in vars(types).values()
+            if isinstance(obj, type) and issubclass(obj, base) and obj.__module__ == types.__name__
+        ),
+        key=lambda obj: obj.__name__,
+    )
+
+
+_PLANS_BY_TAG = [_Plan(cls, tag) for tag, cls in enumerate(_generated(BaseModel))]
+_PLANS = {plan.cls: plan for plan in _PLANS_BY_TAG}
+_ENUM_MEMBERS: list[enum.Enum] = [member for cls in _generated(enum.Enum) for member in cls]
+_ENUM_TAGS: dict[type[enum.Enum], dict[enum.Enum, int]] = {}
+for _index, _member in enumerate(_ENUM_MEMBERS):
+    _ENUM_TAGS.setdefault(type(_member), {})[_member] = _index
+
+
+def default_backend() -> Backend:
+    """Return ``"msgpack"`` when the ``msgpack`` package is installed, else ``"json"``."""
+    return "msgpack" if importlib.util.find_spec("msgpack") is not None else "json"
+
+
+def encode(model: BaseModel, *, backend: Backend | None = None) -> bytes:
+    """Encode a generated model to bytes."""
+    return _pack(_encode_value(model), backend)
+
+
+def encode_many(models: Iterable[BaseModel], *, backend: Backend | None = None) -> bytes:
+    """Encode a sequence of generated models (for example a stream's events) as one payload."""
+    return _pack([_LIST, *[_encode_value(model) for model in models]], backend)
+
+
+def _pack(tree: Any, backend: Backend | None) -> bytes:
+    backend = backend or default_backend()
+    if backend == "msgpack":
+        import msgpack
+
+        payload: bytes = msgpack.packb(tree, use_bin_type=True)
+    else:
+        payload = pydantic_core.to_json(tree)
+    return MAGIC + bytes((FORMAT_VERSION,)) + _BACKEND_CODES[backend] + SPEC_TAG + payload
+
+
+@overload
+def decode(data: bytes, model: type[ModelT]) -> ModelT: ...
+@overload
+def decode(data: bytes, model: None = None) -> BaseModel: ...
+def decode(data: bytes, model: type[BaseModel] | None = None) -> BaseModel:
+    """Decode bytes written by :func:`encode`; ``model`` checks the type of the result."""
+    result = _decode_value(_unpack(data))
+    if not isinstance(result, BaseModel) or (model is not None and not isinstance(result, model)):
+        expected = "a model" if model is None else model.__name__
+        raise TypeError(f"Payload holds {type(result).__name__}, expected {expected}")
+    return result
+
+
+def decode_many(data: bytes) -> list[BaseModel]:
+    """Decode bytes written by :func:`encode_many`."""
+    result = _decode_value(_unpack(data))
+    if not isinstance(result, list):
+        raise TypeError(f"Payload holds {type(result).__name__}, expected a list of models")
+    return result
+
+
+def _unpack(data: bytes) -> Any:
+    if data[: len(MAGIC)] != MAGIC or data[len(MAGIC)] != FORMAT_VERSION:
+        raise ValueError("Not an encoded OpenResponses payload")
+    if data[len(MAGIC) + 2 : _HEADER_SIZE] != SPEC_TAG:
+        raise ValueError("Payload was encoded for a different OpenResponses spec version")
+    code = data[len(MAGIC) + 1 : len(MAGIC) + 2]
+    payload = data[_HEADER_SIZE:]
+    if code == b"m":
+        import msgpack
+
+        return msgpack.unpackb(payload, use_list=True, raw=False)
+    if code == b"j":
+        return pydantic_core.from_json(payload)
+    raise ValueError(f"Unknown payload backend {code!r}")
+
+
+def _encode_value(value: Any) -> Any:
+    cls = type(value)
+    if cls is str or cls is int or cls is float or cls is bool or value is None:
+        return value
+    plan = _PLANS.get(cls)
+    if plan is not None:
+        fields = value.__dict__
+        encoded = [
+            plan.tag,
+            plan.mask(value.__pydantic_fields_set__),
+            *[_encode_value(fields[name]) for name in plan.names],
+        ]
+        while encoded[-1] is None and len(encoded) > 2:
+            encoded.pop()
+        return encoded
+    if cls is list or cls is tuple:
+        items = [_encode_value(item) for item in value]
+        scalars = all(type(item) is not list and type(item) is not dict for item in items)
+        return [_SCALARS if scalars else _LIST, *items]
+    if cls is dict:
+        return {key: _encode_value(item) for key, item in value.items()}
+    members = _ENUM_TAGS.get(cls)
+    if members is not None:
+        return [_ENUM, members[value]]
+    raise TypeError(f"Cannot encode {cls.__name__}; only generated OpenResponses models are supported")
+
+
+def _decode_value(value: Any) -> Any:
+    cls = type(value)
+    if cls is list:
+        tag = value[0]
+        if tag >= 0:
+            return _decode_model(_PLANS_BY_TAG[tag], value)
+        if tag == _ENUM:
+            return _ENUM_MEMBERS[value[1]]
+        if tag == _SCALARS:
+            return value[1:]
+        return [_decode_value(item) for item in value[1:]]
+    if cls is dict:
+        return {key: _decode_value(item) for key, item in value.items()}
+    return value
+
+
+def _decode_model(plan: _Plan, encoded: list[Any]) -> BaseModel:
+    names = plan.names
+    fields = {}
+    for index, name in enumerate(names, 2):
+        if index < len(encoded):
+            item = encoded[index]
+            if type(item) is list or type(item) is dict:
+                item = _decode_value(item)
+            fields[name] = item
+        else:
+            fields[name] = None
+    model = plan.cls.__new__(plan.cls)
+    object.__setattr__(model, "__dict__", fields)
+    object.__setattr__(model, "__pydantic_fields_set__", plan.fields_set(encoded[1]))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
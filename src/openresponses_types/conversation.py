@@ -0,0 +1,96 @@
+"""Indexed container for conversation items.
+
+Matching a function call to its output by ``call_id`` with a linear scan is
+quadratic over a long tool-using session. :class:`Conversation` keeps dictionaries
+from ``call_id`` and ``id`` to items, updates them as items are appended, and
+answers lookups such as :meth:`Conversation.output_for` and
+:meth:`Conversation.pending_calls` without scanning the history.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import TypeAlias
+
+from openresponses_types.history import InputItem, OutputItem
+from openresponses_types.types import (
+    FunctionCall,
+    FunctionCallItemParam,
+    FunctionCallOutput,
+    FunctionCallOutputItemParam,
+    ResponseResource,
+)
+
+ConversationItem: TypeAlias = InputItem | OutputItem
+"""Any input or output item that can be stored in a :class:`Conversation`."""
+
+CallItem: TypeAlias = FunctionCall | FunctionCallItemParam
+OutputForCall: TypeAlias = FunctionCallOutput | FunctionCallOutputItemParam
+
+
+class Conversation:
+    """Append-only list of conversation items with ``id`` and ``call_id`` indexes."""
+
+    def __init__(self, items: Iterable[ConversationItem] = ()) -> None:
+        self._items: list[ConversationItem] = []
+        self._by_id: dict[str, ConversationItem] = {}
+        self._calls: dict[str, CallItem] = {}
+        self._outputs: dict[str, OutputForCall] = {}
+        self._pending: dict[str, CallItem] = {}
+        self.extend(items)
+
+    def append(self, item: ConversationItem) -> None:
+        """Append ``item`` and update the indexes."""
+        self._items.append(item)
+        item_id = getattr(item, "id", None)
+        if item_id is not None:
+            self._by_id[item_id] = item
+        if isinstance(item, FunctionCall | FunctionCallItemParam):
+            self._calls[item.call_id] = item
+            if item.call_id not in self._outputs:
+                self._pending[item.call_id] = item
+        elif isinstance(item, FunctionCallOutput | FunctionCallOutputItemParam):
+            self._outputs[item.call_id] = item
+            self._pending.pop(item.call_id, None)
+
+    def extend(self, items: Iterable[ConversationItem]) -> None:
+        """Append several items."""
+        for item in items:
+            self.append(item)
+
+    def add_response(self, response: ResponseResource) -> None:
+        """Append all output items of ``response``."""
+        self.extend(response.output)
+
+    def get(self, item_id: str) -> ConversationItem | None:
+        """Return the item with the given ``id``, if any."""
+        return self._by_id.get(item_id)
+
+    def call_for(self, call_id: str) -> CallItem | None:
+        """Return the function call with the given ``call_id``, if any."""
+        return self._calls.get(call_id)
+
+    def output_for(self, call_id: str) -> OutputForCall | None:
+        """Return the function call output for ``call_id``, if it has been appended."""
+        return self._outputs.get(call_id)
+
+    def pending_calls(self) -> list[CallItem]:
+        """Return the function calls that have no output yet, in call order."""
+        return list(self._pending.values())
+
+    def has_pending_calls(self) -> bool:
+        """Return whether any function call is still waiting for its output."""
+        return bool(self._pending)
+
+    def items(self) -> list[ConversationItem]:
+        """Return a copy of all items in append order."""
+        return list(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[ConversationItem]:
+        return iter(self._items)
+
+    def __getitem__(self, index: int) -> ConversationItem:
+        return self._items[index]
@@ -0,0 +1,290 @@
+"""Route streaming events from many concurrent responses to per-stream state.
+
+A proxy handling thousands of streams on one event loop feeds every parsed event to
+a :class:`StreamDemultiplexer` together with a key identifying its stream (for
+example the upstream connection). Events are routed to a compact, slot-based
+:class:`StreamState` by ``output_index`` (falling back to ``item_id``), and the
+``response.id`` of the lifecycle events is indexed for lookups. A stream is freed
+as soon as its terminal event (``response.completed``, ``response.failed``,
+``response.incomplete`` or ``error``) arrives, and an optional memory ceiling
+evicts the least recently active streams, so memory scales with active streams
+rather than with history.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from pydantic import BaseModel
+
+from openresponses_types.streaming import TERMINAL_EVENTS, StreamingEvent
+from openresponses_types.types import (
+    ErrorPayload,
+    ErrorStreamingEvent,
+    ResponseCompletedStreamingEvent,
+    ResponseCreatedStreamingEvent,
+    ResponseFailedStreamingEvent,
+    ResponseFunctionCallArgumentsDeltaStreamingEvent,
+    ResponseFunctionCallArgumentsDoneStreamingEvent,
+    ResponseIncompleteStreamingEvent,
+    ResponseInProgressStreamingEvent,
+    ResponseOutputItemAddedStreamingEvent,
+    ResponseOutputItemDoneStreamingEvent,
+    ResponseOutputTextDeltaStreamingEvent,
+    ResponseOutputTextDoneStreamingEvent,
+    ResponseQueuedStreamingEvent,
+    ResponseReasoningDeltaStreamingEvent,
+    ResponseReasoningDoneStreamingEvent,
+    ResponseReasoningSummaryDeltaStreamingEvent,
+    ResponseReasoningSummaryDoneStreamingEvent,
+    ResponseRefusalDeltaStreamingEvent,
+    ResponseRefusalDoneStreamingEvent,
+    ResponseResource,
+)
+
+# Approximate fixed costs used for the memory ceiling, in bytes.
+_STREAM_OVERHEAD = 256
+_ITEM_OVERHEAD = 128
+
+_LIFECYCLE_EVENTS = (
+    ResponseCreatedStreamingEvent,
+    ResponseQueuedStreamingEvent,
+    ResponseInProgressStreamingEvent,
+    ResponseCompletedStreamingEvent,
+    ResponseFailedStreamingEvent,
+    ResponseIncompleteStreamingEvent,
+)
+_FINAL_EVENTS: tuple[type[BaseModel], ...] = (*TERMINAL_EVENTS, ErrorStreamingEvent)
+_CONTENT_DELTAS = (
+    ResponseOutputTextDeltaStreamingEvent,
+    ResponseRefusalDeltaStreamingEvent,
+    ResponseReasoningDeltaStreamingEvent,
+)
+
+
+class ItemState:
+    """Accumulated state of one output item of a stream."""
+
+    __slots__ = ("item_id", "item_type", "output_index", "content", "summary", "arguments", "done")
+
+    def __init__(self, output_index: int, item_id: str | None = None, item_type: str | None = None) -> None:
+        self.output_index = output_index
+        self.item_id = item_id
+        self.item_type = item_type
+        self.content: dict[int, list[str]] = {}
+        self.summary: dict[int, list[str]] = {}
+        self.arguments: list[str] = []
+        self.done = False
+
+    def text(self, content_index: int = 0) -> str:
+        """Return the text (or refusal/reasoning text) accumulated for a content part."""
+        return "".join(self.content.get(content_index, ()))
+
+    def summary_text(self, summary_index: int = 0) -> str:
+        """Return the reasoning summary text accumulated for a summary part."""
+        return "".join(self.summary.get(summary_index, ()))
+
+    def arguments_text(self) -> str:
+        """Return the function call arguments accumulated so far."""
+        return "".join(self.arguments)
+
+
+class StreamState:
+    """Per-stream record: lifecycle status, latest response snapshot and output items."""
+
+    __slots__ = (
+        "key",
+        "response_id",
+        "status",
+        "sequence_number",
+        "response",
+        "response_size",
+        "error",
+        "items",
+        "finished",
+        "size",
+    )
+
+    def __init__(self, key: Hashable) -> None:
+        self.key = key
+        self.response_id: str | None = None
+        self.status: str | None = None
+        self.sequence_number = -1
+        self.response: ResponseResource | None = None
+        self.response_size = 0
+        self.error: ErrorPayload | None = None
+        self.items: list[ItemState | None] = []
+        self.finished = False
+        self.size = _STREAM_OVERHEAD
+
+    def item(self, output_index: int) -> ItemState | None:
+        """Return the state of the output item at ``output_index``, if seen."""
+        if 0 <= output_index < len(self.items):
+            return self.items[output_index]
+        return None
+
+
+class StreamDemultiplexer:
+    """Route streaming events to per-stream state with an optional memory ceiling.
+
+    ``max_bytes`` bounds the approximate memory held by all active streams (fixed
+    record overhead, the JSON length of the latest response snapshot and the
+    accumulated delta text) and ``max_streams`` bounds their
+    number; when either is exceeded the least recently active stream is evicted and
+    passed to ``on_evict``. The snapshot of a terminal event is released with its
+    stream and is not measured.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        max_streams: int | None = None,
+        on_evict: Callable[[StreamState], None] | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.max_streams = max_streams
+        self._on_evict = on_evict
+        self._streams: OrderedDict[Hashable, StreamState] = OrderedDict()
+        self._by_response_id: dict[str, Hashable] = {}
+        self._total_size = 0
+
+    @property
+    def active_streams(self) -> int:
+        """Number of streams currently held."""
+        return len(self._streams)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate memory held by all active streams."""
+        return self._total_size
+
+    def get(self, key: Hashable) -> StreamState | None:
+        """Return the state of an active stream."""
+        return self._streams.get(key)
+
+    def find_response(self, response_id: str) -> StreamState | None:
+        """Return the state of the active stream carrying ``response_id``."""
+        key = self._by_response_id.get(response_id)
+        return None if key is None else self._streams.get(key)
+
+    def feed(self, key: Hashable, event: StreamingEvent, *, size: int | None = None) -> StreamState:
+        """Apply ``event`` to the stream identified by ``key`` and return its state.
+
+        ``size`` is the byte length of the JSON payload ``event`` was parsed from
+        (such as ``len(data)`` of its SSE frame); given, it stands in for the size of
+        the response snapshot of a lifecycle event, which is otherwise serialized to
+        measure it. When ``event`` ends the stream the returned state has
+        ``finished`` set and has already been released by the demultiplexer.
+        """
+        state = self._streams.get(key)
+        if state is None:
+            state = self._streams[key] = StreamState(key)
+            self._total_size += state.size
+        else:
+            self._streams.move_to_end(key)
+        before = state.size
+        state.sequence_number = event.sequence_number
+        self._apply(state, event)
+        final = isinstance(event, _FINAL_EVENTS)
+        if isinstance(event, _LIFECYCLE_EVENTS) and not final:
+            if size is None:
+                size = len(event.response.__pydantic_serializer__.to_json(event.response))
+            state.size += size - state.response_size
+            state.response_size = size
+        self._total_size += state.size - before
+
+        if final:
+            state.finished = True
+            self._release(state)
+        else:
+            self._enforce_limits(current=key)
+        return state
+
+    def close(self, key: Hashable) -> StreamState | None:
+        """Release the stream identified by ``key`` (for example on disconnect)."""
+        state = self._streams.get(key)
+        if state is not None:
+            self._release(state)
+        return state
+
+    def _apply(self, state: StreamState, event: StreamingEvent) -> None:
+        if isinstance(event, _LIFECYCLE_EVENTS):
+            response = event.response
+            if state.response_id is None:
+                state.response_id = response.id
+                self._by_response_id[response.id] = state.key
+            state.status = response.status
+            state.response = response
+        elif isinstance(event, _CONTENT_DELTAS):
+            item = self._item(state, event.output_index, event.item_id)
+            item.content.setdefault(event.content_index, []).append(event.delta)
+            state.size += len(event.delta)
+        elif isinstance(event, ResponseFunctionCallArgumentsDeltaStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            item.arguments.append(event.delta)
+            state.size += len(event.delta)
+        elif isinstance(event, ResponseReasoningSummaryDeltaStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            item.summary.setdefault(event.summary_index, []).append(event.delta)
+            state.size += len(event.delta)
+        elif isinstance(event, ResponseOutputTextDoneStreamingEvent | ResponseReasoningDoneStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            state.size += _replace(item.content, event.content_index, event.text)
+        elif isinstance(event, ResponseRefusalDoneStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            state.size += _replace(item.content, event.content_index, event.refusal)
+        elif isinstance(event, ResponseReasoningSummaryDoneStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            state.size += _replace(item.summary, event.summary_index, event.text)
+        elif isinstance(event, ResponseFunctionCallArgumentsDoneStreamingEvent):
+            item = self._item(state, event.output_index, event.item_id)
+            state.size += len(event.arguments) - sum(map(len, item.arguments))
+            item.arguments = [event.arguments]
+        elif isinstance(event, ResponseOutputItemAddedStreamingEvent | ResponseOutputItemDoneStreamingEvent):
+            added = event.item
+            item = self._item(state, event.output_index, None if added is None else added.id)
+            if added is not None:
+                item.item_type = added.type
+            item.done = isinstance(event, ResponseOutputItemDoneStreamingEvent)
+        elif isinstance(event, ErrorStreamingEvent):
+            state.error = event.error
+            state.status = "failed"
+
+    def _item(self, state: StreamState, output_index: int, item_id: str | None) -> ItemState:
+        item = state.item(output_index)
+        if item is None:
+            if output_index >= len(state.items):
+                state.items.extend([None] * (output_index + 1 - len(state.items)))
+            item = state.items[output_index] = ItemState(output_index, item_id)
+            state.size += _ITEM_OVERHEAD
+        elif item.item_id is None:
+            item.item_id = item_id
+        return item
+
+    def _release(self, state: StreamState) -> None:
+        if self._streams.pop(state.key, None) is None:
+            return
+        self._total_size -= state.size
+        if state.response_id is not None:
+            self._by_response_id.pop(state.response_id, None)
+
+    def _enforce_limits(self, current: Hashable) -> None:
+        while len(self._streams) > 1 and (
+            (self.max_bytes is not None and self._total_size > self.max_bytes)
+            or (self.max_streams is not None and len(self._streams) > self.max_streams)
+        ):
+            oldest = next(iter(self._streams.values()))
+            if oldest.key == current:
+                break
+            self._release(oldest)
+            if self._on_evict is not None:
+                self._on_evict(oldest)
+
+
+def _replace(parts: dict[int, list[str]], index: int, text: str) -> int:
+    """Replace accumulated chunks with the final ``text``; return the size change."""
+    previous = sum(map(len, parts.get(index, ())))
+    parts[index] = [text]
+    return len(text) - previous
@@ -0,0 +1,344 @@
+"""Server-side emitter producing pre-encoded server-sent event frames.
+
+A server streaming a response calls high-level methods on
+:class:`ResponseStreamEmitter` (:meth:`~ResponseStreamEmitter.start_message`,
+:meth:`~ResponseStreamEmitter.text_delta`,
+:meth:`~ResponseStreamEmitter.start_function_call`,
+:meth:`~ResponseStreamEmitter.function_args_delta`,
+:meth:`~ResponseStreamEmitter.complete`) and the emitter writes the corresponding
+``event:``/``data:`` frames into a reusable byte buffer, assigning
+``sequence_number``, ``output_index`` and ``content_index`` itself.
+
+Lifecycle and item events are rare and are dumped from their models. Delta events
+are hot: their static JSON fragments are encoded once per event type and item, so
+each delta only escapes its text. The frames are byte-for-byte what dumping the
+corresponding event model would produce.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Sequence
+from json.encoder import encode_basestring
+
+import pydantic_core
+from pydantic import BaseModel
+
+from openresponses_types.types import (
+    Error,
+    FunctionCall,
+    FunctionCallStatus,
+    Item2,
+    Item3,
+    Item62,
+    Item63,
+    LogProb,
+    Message,
+    MessageRole,
+    MessageStatus,
+    OutputTextContent,
+    ResponseCompletedStreamingEvent,
+    ResponseContentPartAddedStreamingEvent,
+    ResponseContentPartDoneStreamingEvent,
+    ResponseCreatedStreamingEvent,
+    ResponseFailedStreamingEvent,
+    ResponseFunctionCallArgumentsDoneStreamingEvent,
+    ResponseInProgressStreamingEvent,
+    ResponseOutputItemAddedStreamingEvent,
+    ResponseOutputItemDoneStreamingEvent,
+    ResponseOutputTextDoneStreamingEvent,
+    ResponseResource,
+    Type37,
+    Type39,
+    Type40,
+    Type41,
+    Type43,
+    Type44,
+    Type47,
+    Type48,
+    Type49,
+    Type50,
+    Type58,
+    Type59,
+    Usage,
+)
+
+
+def _delta_head(event_type: str) -> bytes:
+    return f'event: {event_type}\ndata: {{"type":"{event_type}","sequence_number":'.encode()
+
+
+_TEXT_DELTA_HEAD = _delta_head(Type49.response_output_text_delta.value)
+_ARGS_DELTA_HEAD = _delta_head(Type58.response_function_call_arguments_delta.value)
+_NO_LOGPROBS_TAIL = b',"logprobs":[],"obfuscation":null}\n\n'
+_LOGPROBS_HEAD = b',"logprobs":'
+_OBFUSCATION_TAIL = b',"obfuscation":null}\n\n'
+
+
+class _OpenItem:
+    """An output item between its ``added`` and ``done`` events."""
+
+    __slots__ = ("item_id", "output_index", "call_id", "name", "delta_prefix", "chunks", "logprobs")
+
+    def __init__(self, item_id: str, output_index: int, delta_prefix: bytes, call_id: str = "", name: str = "") -> None:
+        self.item_id = item_id
+        self.output_index = output_index
+        self.call_id = call_id
+        self.name = name
+        self.delta_prefix = delta_prefix
+        self.chunks: list[str] = []
+        self.logprobs: list[LogProb] = []
+
+
+class ResponseStreamEmitter:
+    """State machine writing the SSE frames of one streamed response into a buffer.
+
+    ``response`` is the initial snapshot (usually with ``status="in_progress"`` and
+    no output); later lifecycle events are copies updated with the status, output
+    items and usage. Frames accumulate in :attr:`buffer`; call :meth:`take` to get
+    the pending bytes and reuse the buffer. Calls out of order raise ``RuntimeError``.
+    """
+
+    def __init__(self, response: ResponseResource, *, buffer: bytearray | None = None) -> None:
+        self.buffer = bytearray() if buffer is None else buffer
+        self.sequence_number = 0
+        self.output: list[Message | FunctionCall] = []
+        self._response = response
+        self._message: _OpenItem | None = None
+        self._call: _OpenItem | None = None
+        self._started = False
+        self._finished = False
+
+    @property
+    def response_id(self) -> str:
+        """ID of the response being streamed."""
+        return self._response.id
+
+    def take(self) -> bytes:
+        """Return the frames written so far and empty the buffer."""
+        data = bytes(self.buffer)
+        del self.buffer[:]
+        return data
+
+    def start(self) -> None:
+        """Emit ``response.created`` and ``response.in_progress``."""
+        if self._started:
+            raise RuntimeError("Response stream already started")
+        self._started = True
+        response = self._response
+        self._emit(ResponseCreatedStreamingEvent(type=Type37.response_created, sequence_number=0, response=response))
+        self._emit(
+            ResponseInProgressStreamingEvent(type=Type39.response_in_progress, sequence_number=0, response=response)
+        )
+
+    def start_message(self, item_id: str | None = None) -> str:
+        """Open an assistant message with one ``output_text`` part; return its item ID."""
+        self._begin_item()
+        item_id = item_id or f"msg_{uuid.uuid4().hex}"
+        output_index = len(self.output)
+        prefix = f',"item_id":{encode_basestring(item_id)},"output_index":{output_index},"content_index":0,"delta":'
+        self._message = _OpenItem(item_id, output_index, prefix.encode())
+        self._emit(
+            ResponseOutputItemAddedStreamingEvent(
+                type=Type43.response_output_item_added,
+                sequence_number=0,
+                output_index=output_index,
+                item=Item2(
+                    type="message", id=item_id, status=MessageStatus.in_progress, role=MessageRole.assistant, content=[]
+                ),
+            )
+        )
+        self._emit(
+            ResponseContentPartAddedStreamingEvent(
+                type=Type47.response_content_part_added,
+                sequence_number=0,
+                item_id=item_id,
+                output_index=output_index,
+                content_index=0,
+                part=OutputTextContent(type="output_text", text="", annotations=[], logprobs=[]),
+            )
+        )
+        return item_id
+
+    def text_delta(self, text: str, logprobs: Sequence[LogProb] | None = None) -> None:
+        """Emit a ``response.output_text.delta`` for the open message."""
+        message = self._message
+        if message is None:
+            raise RuntimeError("text_delta() requires an open message; call start_message() first")
+        message.chunks.append(text)
+        buffer = self.buffer
+        buffer += _TEXT_DELTA_HEAD
+        buffer += b"%d" % self.sequence_number
+        buffer += message.delta_prefix
+        buffer += encode_basestring(text).encode()
+        if logprobs:
+            message.logprobs.extend(logprobs)
+            buffer += _LOGPROBS_HEAD
+            buffer += pydantic_core.to_json(list(logprobs))
+            buffer += _OBFUSCATION_TAIL
+        else:
+            buffer += _NO_LOGPROBS_TAIL
+        self.sequence_number += 1
+
+    def start_function_call(self, name: str, call_id: str | None = None, item_id: str | None = None) -> str:
+        """Open a ``function_call`` item; return its item ID."""
+        self._begin_item()
+        item_id = item_id or f"fc_{uuid.uuid4().hex}"
+        call_id = call_id or f"call_{uuid.uuid4().hex}"
+        output_index = len(self.output)
+        prefix = f',"item_id":{encode_basestring(item_id)},"output_index":{output_index},"delta":'
+        self._call = _OpenItem(item_id, output_index, prefix.encode(), call_id, name)
+        self._emit(
+            ResponseOutputItemAddedStreamingEvent(
+                type=Type43.response_output_item_added,
+                sequence_number=0,
+                output_index=output_index,
+                item=Item3(
+                    type="function_call",
+                    id=item_id,
+                    call_id=call_id,
+                    name=name,
+                    arguments="",
+                    status=FunctionCallStatus.in_progress,
+                ),
+            )
+        )
+        return item_id
+
+    def function_args_delta(self, arguments: str) -> None:
+        """Emit a ``response.function_call_arguments.delta`` for the open function call."""
+        call = self._call
+        if call is None:
+            raise RuntimeError("function_args_delta() requires an open function call")
+        call.chunks.append(arguments)
+        buffer = self.buffer
+        buffer += _ARGS_DELTA_HEAD
+        buffer += b"%d" % self.sequence_number
+        buffer += call.delta_prefix
+        buffer += encode_basestring(arguments).encode()
+        buffer += _OBFUSCATION_TAIL
+        self.sequence_number += 1
+
+    def end_item(self) -> None:
+        """Close the open message or function call, emitting its ``done`` events."""
+        if self._message is not None:
+            self._end_message(self._message)
+        elif self._call is not None:
+            self._end_call(self._call)
+
+    def complete(self, usage: Usage | None = None) -> None:
+        """Close any open item and emit ``response.completed``."""
+        self._finish()
+        response = self._snapshot("completed", usage=usage, completed_at=int(time.time()))
+        self._emit(
+            ResponseCompletedStreamingEvent(type=Type40.response_completed, sequence_number=0, response=response)
+        )
+
+    def fail(self, error: Error, usage: Usage | None = None) -> None:
+        """Close any open item and emit ``response.failed`` carrying ``error``."""
+        self._finish()
+        response = self._snapshot("failed", usage=usage, error=error)
+        self._emit(ResponseFailedStreamingEvent(type=Type41.response_failed, sequence_number=0, response=response))
+
+    def _begin_item(self) -> None:
+        if self._finished:
+            raise RuntimeError("Response stream already finished")
+        if not self._started:
+            self.start()
+        self.end_item()
+
+    def _finish(self) -> None:
+        if self._finished:
+            raise RuntimeError("Response stream already finished")
+        if not self._started:
+            self.start()
+        self.end_item()
+        self._finished = True
+
+    def _end_message(self, message: _OpenItem) -> None:
+        self._message = None
+        text = "".join(message.chunks)
+        self._emit(
+            ResponseOutputTextDoneStreamingEvent(
+                type=Type50.response_output_text_done,
+                sequence_number=0,
+                item_id=message.item_id,
+                output_index=message.output_index,
+                content_index=0,
+                text=text,
+                logprobs=message.logprobs,
+            )
+        )
+        part = OutputTextContent(type="output_text", text=text, annotations=[], logprobs=message.logprobs)
+        self._emit(
+            ResponseContentPartDoneStreamingEvent(
+                type=Type48.response_content_part_done,
+                sequence_number=0,
+                item_id=message.item_id,
+                output_index=message.output_index,
+                content_index=0,
+                part=part,
+            )
+        )
+        self._emit(
+            ResponseOutputItemDoneStreamingEvent(
+                type=Type44.response_output_item_done,
+                sequence_number=0,
+                output_index=message.output_index,
+                item=Item62(
+                    type="message",
+                    id=message.item_id,
+                    status=MessageStatus.completed,
+                    role=MessageRole.assistant,
+                    content=[part],
+                ),
+            )
+        )
+        self.output.append(
+            Message(
+                type="message",
+                id=message.item_id,
+                status=MessageStatus.completed,
+                role=MessageRole.assistant,
+                content=[part],
+            )
+        )
+
+    def _end_call(self, call: _OpenItem) -> None:
+        self._call = None
+        arguments = "".join(call.chunks)
+        self._emit(
+            ResponseFunctionCallArgumentsDoneStreamingEvent(
+                type=Type59.response_function_call_arguments_done,
+                sequence_number=0,
+                item_id=call.item_id,
+                output_index=call.output_index,
+                arguments=arguments,
+            )
+        )
+        values = {"id": call.item_id, "call_id": call.call_id, "name": call.name, "arguments": arguments}
+        self._emit(
+            ResponseOutputItemDoneStreamingEvent(
+                type=Type44.response_output_item_done,
+                sequence_number=0,
+                output_index=call.output_index,
+                item=Item63(type="function_call", status=FunctionCallStatus.completed, **values),
+            )
+        )
+        self.output.append(FunctionCall(type="function_call", status=FunctionCallStatus.completed, **values))
+
+    def _snapshot(self, status: str, **update: object) -> ResponseResource:
+        return self._response.model_copy(update={"status": status, "output": list(self.output), **update})
+
+    def _emit(self, event: BaseModel) -> None:
+        # Item and lifecycle events are built with a placeholder sequence number.
+        event.sequence_number = self.sequence_number  # type: ignore[attr-defined]
+        self.sequence_number += 1
+        event_type: str = str(event.type)  # type: ignore[attr-defined]
+        buffer = self.buffer
+        buffer += b"event: "
+        buffer += event_type.encode()
+        buffer += b"\ndata: "
+        buffer += event.__pydantic_serializer__.to_json(event)
+        buffer += b"\n\n"
@@ -0,0 +1,111 @@
+"""Immutable-style updates of generated models with structural sharing.
+
+``model_copy(update=..., deep=True)`` copies the whole tree, and a shallow
+``model_copy`` shares the lists that a caller is about to change. :func:`evolve`
+returns a new model in which only the objects on the updated paths are copied
+(each one shallowly); every other sub-object is shared with the original::
+
+    response = evolve(response, {"status": "completed", "usage": usage})
+    response = evolve(response, {"output[3].content[0].text": text})
+    response = evolve(response, output=[*response.output, item])
+
+The cost is proportional to the depth of the paths (plus the length of each list
+on them), not to the size of the model. As with ``model_copy(update=...)``, the
+new values are not validated. Because sub-objects are shared, treat both the
+original and the result as read-only.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, RootModel
+
+from openresponses_types.partial_json import JSONPath
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_STEP = re.compile(r"\.?([A-Za-z_][A-Za-z0-9_]*)|\[(-?[0-9]+)\]")
+
+
+class _Leaf:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+def evolve(model: ModelT, updates: Mapping[str | JSONPath, Any] | None = None, /, **fields: Any) -> ModelT:
+    """Return a copy of ``model`` with the values at the given paths replaced.
+
+    ``updates`` maps paths to new values: a path is either a string of field names
+    and list indexes (``"output[3].content[0].text"``) or a tuple of keys and
+    indexes (``("metadata", "tenant")``), which also reaches ``dict`` keys. Keyword
+    arguments update top-level fields. Root models are traversed transparently.
+    """
+    tree: dict[str | int, Any] = {}
+    for path, value in [*(updates or {}).items(), *fields.items()]:
+        steps = _steps(path) if isinstance(path, str) else tuple(path)
+        if not steps:
+            raise ValueError("Empty update path")
+        node = tree
+        for step in steps[:-1]:
+            child = node.setdefault(step, {})
+            if isinstance(child, _Leaf):
+                raise ValueError(f"Conflicting updates at {path!r}")
+            node = child
+        if steps[-1] in node:
+            raise ValueError(f"Conflicting updates at {path!r}")
+        node[steps[-1]] = _Leaf(value)
+    result: ModelT = _apply(model, tree)
+    return result
+
+
+def _steps(path: str) -> JSONPath:
+    steps: list[str | int] = []
+    pos = 0
+    while pos < len(path):
+        match = _STEP.match(path, pos)
+        if match is None or (pos == 0 and path.startswith(".")):
+            raise ValueError(f"Invalid update path {path!r}")
+        name, index = match.groups()
+        steps.append(name if name is not None else int(index))
+        pos = match.end()
+    return tuple(steps)
+
+
+def _apply(value: Any, tree: dict[str | int, Any]) -> Any:
+    """Return a shallow copy of ``value`` with the updates in ``tree`` applied below it."""
+    if isinstance(value, RootModel) and "root" not in tree:
+        return _copy_model(value, {"root": _apply(value.root, tree)})
+    if isinstance(value, BaseModel):
+        fields = type(value).model_fields
+        changes = {}
+        for name, child in tree.items():
+            if name not in fields:
+                raise ValueError(f"{type(value).__name__} has no field {name!r}")
+            assert isinstance(name, str)
+            changes[name] = _resolve(getattr(value, name), child)
+        return _copy_model(value, changes)
+    if isinstance(value, list | dict):
+        source: Any = value
+        copy = source.copy()
+        for key, child in tree.items():
+            copy[key] = _resolve(source[key] if isinstance(child, dict) else None, child)
+        return copy
+    raise TypeError(f"Cannot update inside a {type(value).__name__}")
+
+
+def _resolve(current: Any, child: Any) -> Any:
+    return child.value if isinstance(child, _Leaf) else _apply(current, child)
+
+
+def _copy_model(model: ModelT, changes: dict[str, Any]) -> ModelT:
+    copy = type(model).__new__(type(model))
+    object.__setattr__(copy, "__dict__", {**model.__dict__, **changes})
+    object.__setattr__(copy, "__pydantic_fields_set__", model.__pydantic_fields_set__ | changes.keys())
+    object.__setattr__(copy, "__pydantic_extra__", model.__pydantic_extra__)
+    object.__setattr__(copy, "__pydantic_private__", model.__pydantic_private__)
+    return copy
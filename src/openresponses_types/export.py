@@ -0,0 +1,208 @@
+"""Columnar export of response collections for analytics.
+
+:class:`ResponseColumns` flattens many ``ResponseResource`` objects, or their raw
+JSON (``bytes``/``str``/decoded dicts, read without model validation), into one
+typed column per metric: status, model, timestamps, latency, the ``Usage`` token
+counts and the number of function calls. Columns are stdlib :class:`array.array`
+buffers, so aggregations can be vectorized; :meth:`ResponseColumns.to_numpy` wraps
+them as NumPy arrays without copying and :meth:`ResponseColumns.to_arrow` /
+:meth:`ResponseColumns.write_parquet` build an Arrow table. NumPy and PyArrow are
+optional (``pip install openresponses-types[numpy]`` / ``[arrow]``).
+
+A buffer cannot grow while another object views it, so the columns are frozen
+once exported without copying: :meth:`ResponseColumns.add` then raises
+``BufferError``. Pass ``copy=True`` to keep adding responses after an export.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Any, TypeAlias
+
+import pydantic_core
+
+from openresponses_types.types import FunctionCall, ResponseResource
+
+ResponseLike: TypeAlias = ResponseResource | Mapping[str, Any] | str | bytes
+"""A response as a model, a decoded JSON object or raw JSON text."""
+
+NUMERIC_COLUMNS: dict[str, str] = {
+    "created_at": "q",
+    "completed_at": "d",
+    "latency": "d",
+    "has_usage": "b",
+    "input_tokens": "q",
+    "output_tokens": "q",
+    "total_tokens": "q",
+    "cached_tokens": "q",
+    "reasoning_tokens": "q",
+    "tool_calls": "q",
+}
+"""Numeric columns and their :mod:`array` type codes (``completed_at`` and ``latency`` are NaN when missing)."""
+
+STRING_COLUMNS = ("id", "model", "status")
+"""Columns holding strings."""
+
+_NUMPY_DTYPES = {"q": "int64", "d": "float64", "b": "int8"}
+
+
+class ResponseColumns:
+    """Accumulate responses into typed columns.
+
+    Token columns are ``0`` for responses without ``usage``; ``has_usage`` tells them
+    apart. ``tool_calls`` counts the ``function_call`` items of ``output``. ``frozen``
+    becomes true when the columns are exported without copying.
+    """
+
+    def __init__(self, responses: Iterable[ResponseLike] = ()) -> None:
+        self.numeric: dict[str, array[Any]] = {name: array(code) for name, code in NUMERIC_COLUMNS.items()}
+        self.strings: dict[str, list[str]] = {name: [] for name in STRING_COLUMNS}
+        self.frozen = False
+        self.extend(responses)
+
+    def __len__(self) -> int:
+        return len(self.strings["id"])
+
+    def extend(self, responses: Iterable[ResponseLike]) -> None:
+        """Add many responses."""
+        for response in responses:
+            self.add(response)
+
+    def add(self, response: ResponseLike) -> None:
+        """Add one response, raising ``BufferError`` if the columns were exported without copying.
+
+        A response with a value of the wrong type raises and leaves the columns as
+        they were.
+        """
+        if self.frozen:
+            raise BufferError("columns were exported without copying; export with copy=True to keep adding responses")
+        if isinstance(response, ResponseResource):
+            usage = response.usage
+            tokens = (
+                None
+                if usage is None
+                else (
+                    usage.input_tokens,
+                    usage.output_tokens,
+                    usage.total_tokens,
+                    usage.input_tokens_details.cached_tokens,
+                    usage.output_tokens_details.reasoning_tokens,
+                )
+            )
+            tool_calls = sum(isinstance(item, FunctionCall) for item in response.output)
+            self._append(
+                response.id,
+                response.model,
+                response.status,
+                response.created_at,
+                response.completed_at,
+                tokens,
+                tool_calls,
+            )
+            return
+        data: Any = pydantic_core.from_json(response) if isinstance(response, str | bytes) else response
+        usage_data = data.get("usage")
+        tokens = (
+            None
+            if usage_data is None
+            else (
+                usage_data["input_tokens"],
+                usage_data["output_tokens"],
+                usage_data["total_tokens"],
+                usage_data["input_tokens_details"]["cached_tokens"],
+                usage_data["output_tokens_details"]["reasoning_tokens"],
+            )
+        )
+        tool_calls = sum(item.get("type") == "function_call" for item in data.get("output") or ())
+        self._append(
+            data["id"], data["model"], data["status"], data["created_at"], data.get("completed_at"), tokens, tool_calls
+        )
+
+    def _append(
+        self,
+        response_id: str,
+        model: str,
+        status: str,
+        created_at: int,
+        completed_at: int | None,
+        tokens: tuple[int, int, int, int, int] | None,
+        tool_calls: int,
+    ) -> None:
+        strings, numeric = self.strings, self.numeric
+        rows = len(self)
+        try:
+            strings["id"].append(response_id)
+            strings["model"].append(model)
+            strings["status"].append(status)
+            numeric["created_at"].append(created_at)
+            if completed_at is None:
+                numeric["completed_at"].append(math.nan)
+                numeric["latency"].append(math.nan)
+            else:
+                numeric["completed_at"].append(completed_at)
+                numeric["latency"].append(completed_at - created_at)
+            numeric["has_usage"].append(tokens is not None)
+            input_tokens, output_tokens, total_tokens, cached_tokens, reasoning_tokens = tokens or (0, 0, 0, 0, 0)
+            numeric["input_tokens"].append(input_tokens)
+            numeric["output_tokens"].append(output_tokens)
+            numeric["total_tokens"].append(total_tokens)
+            numeric["cached_tokens"].append(cached_tokens)
+            numeric["reasoning_tokens"].append(reasoning_tokens)
+            numeric["tool_calls"].append(tool_calls)
+        except Exception:
+            # Drop the part of the row appended before the error, keeping the columns aligned.
+            for column in (*strings.values(), *numeric.values()):
+                del column[rows:]
+            raise
+
+    def columns(self) -> dict[str, array[Any] | list[str]]:
+        """Return all columns, string columns first, without copying."""
+        return {**self.strings, **self.numeric}
+
+    def to_numpy(self, *, copy: bool = False) -> dict[str, Any]:
+        """Return the columns as NumPy arrays.
+
+        Numeric columns share memory with this object (which freezes it) unless
+        ``copy`` is true.
+        """
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError("to_numpy() requires numpy: pip install openresponses-types[numpy]") from exc
+        result: dict[str, Any] = {name: numpy.array(values, dtype=object) for name, values in self.strings.items()}
+        for name, values in self.numeric.items():
+            column = numpy.frombuffer(values, dtype=_NUMPY_DTYPES[values.typecode])
+            result[name] = column.copy() if copy else column
+        self.frozen = self.frozen or not copy
+        return result
+
+    def to_arrow(self, *, copy: bool = False) -> Any:
+        """Return the columns as a ``pyarrow.Table``.
+
+        Numeric columns share memory with this object (which freezes it) unless
+        ``copy`` is true.
+        """
+        table = self._table(copy)
+        self.frozen = self.frozen or not copy
+        return table
+
+    def write_parquet(self, path: str, **options: Any) -> None:
+        """Write the columns to a Parquet file; ``options`` go to ``pyarrow.parquet.write_table``."""
+        table = self._table(copy=False)
+        import pyarrow.parquet
+
+        pyarrow.parquet.write_table(table, path, **options)
+
+    def _table(self, copy: bool) -> Any:
+        try:
+            import pyarrow
+        except ImportError as exc:
+            raise ImportError("to_arrow() requires pyarrow: pip install openresponses-types[arrow]") from exc
+        types = {"q": pyarrow.int64(), "d": pyarrow.float64(), "b": pyarrow.int8()}
+        arrays = {name: pyarrow.array(values, type=pyarrow.string()) for name, values in self.strings.items()}
+        for name, values in self.numeric.items():
+            buffer = pyarrow.py_buffer(values.tobytes() if copy else values)
+            arrays[name] = pyarrow.Array.from_buffers(types[values.typecode], len(values), [None, buffer])
+        return pyarrow.table(arrays)
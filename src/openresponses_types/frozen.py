@@ -0,0 +1,149 @@
+"""Immutable, hashable snapshots of OpenResponses models.
+
+The generated models are mutable and carry ``dict``/``list`` fields (for example
+``FunctionTool.parameters`` or ``JsonSchemaResponseFormatParam.schema_``), so they
+cannot be used as dictionary keys. :func:`freeze` converts a model into a
+:class:`FrozenModel` whose nested containers are immutable and whose hash is
+computed once, making it suitable as a key for LRU caches of tool definitions,
+text formats and reasoning settings.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from typing import Any, Generic, NoReturn, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class FrozenDict(Mapping[Any, Any]):
+    """Read-only mapping whose hash is computed once at construction."""
+
+    __slots__ = ("_data", "_hash")
+
+    _data: dict[Any, Any]
+    _hash: int
+
+    def __init__(self, data: Mapping[Any, Any]) -> None:
+        frozen = {key: freeze_value(value) for key, value in data.items()}
+        object.__setattr__(self, "_data", frozen)
+        object.__setattr__(self, "_hash", hash(frozenset(frozen.items())))
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._hash == other._hash and self._data == other._data
+        return NotImplemented
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({self._data!r})"
+
+
+class FrozenModel(Generic[ModelT]):
+    """Immutable, hashable snapshot of a Pydantic model.
+
+    Field values are exposed as attributes, with nested models frozen recursively,
+    lists converted to tuples and dicts to :class:`FrozenDict`. Two snapshots are
+    equal when they were taken from the same model class with equal field values.
+    Use :meth:`thaw` to get a regular (mutable) model instance back.
+    """
+
+    __slots__ = ("_model_type", "_values", "_fields_set", "_hash")
+
+    _model_type: type[ModelT]
+    _values: dict[str, Any]
+    _fields_set: frozenset[str]
+    _hash: int
+
+    def __init__(self, model: ModelT) -> None:
+        model_type = type(model)
+        values = {name: freeze_value(getattr(model, name)) for name in model_type.model_fields}
+        object.__setattr__(self, "_model_type", model_type)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_fields_set", frozenset(model.model_fields_set))
+        object.__setattr__(self, "_hash", hash((model_type, tuple(values.items()))))
+
+    @property
+    def model_type(self) -> type[ModelT]:
+        """The model class this snapshot was taken from."""
+        return self._model_type
+
+    def thaw(self) -> ModelT:
+        """Build a new mutable model instance from this snapshot without re-validation."""
+        values = {name: thaw_value(value) for name, value in self._values.items()}
+        return self._model_type.model_construct(_fields_set=set(self._fields_set), **values)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError(f"{self._model_type.__name__!r} has no field {name!r}") from None
+
+    def __setattr__(self, name: str, value: Any) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> NoReturn:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenModel):
+            return self._hash == other._hash and self._model_type is other._model_type and self._values == other._values
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self._values.items())
+        return f"Frozen{self._model_type.__name__}({fields})"
+
+
+def freeze(model: ModelT) -> FrozenModel[ModelT]:
+    """Return an immutable, hashable snapshot of ``model``."""
+    return FrozenModel(model)
+
+
+def freeze_value(value: Any) -> Any:
+    """Recursively convert models, dicts, lists and sets into hashable equivalents."""
+    if isinstance(value, FrozenModel | FrozenDict):
+        return value
+    if isinstance(value, BaseModel):
+        return FrozenModel(value)
+    if isinstance(value, Mapping):
+        return FrozenDict(value)
+    if isinstance(value, list | tuple):
+        return tuple(freeze_value(item) for item in value)
+    if isinstance(value, set | frozenset):
+        return frozenset(freeze_value(item) for item in value)
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """Inverse of :func:`freeze_value`: rebuild models, dicts and lists."""
+    if isinstance(value, FrozenModel):
+        return value.thaw()
+    if isinstance(value, FrozenDict):
+        return {key: thaw_value(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_value(item) for item in value]
+    if isinstance(value, frozenset):
+        return {thaw_value(item) for item in value}
+    return value
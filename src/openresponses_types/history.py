@@ -0,0 +1,249 @@
+"""Convert ``ResponseResource.output`` items into input items for the next turn.
+
+Continuing a conversation means turning the output items of a response into the
+matching ``*ItemParam`` models for ``CreateResponseBody.input``. The converters in
+this module map fields directly and build the param models with
+a minimal constructor: the source items were already validated, so there is no
+``model_dump``/``model_validate`` round trip.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any, TypeAlias, TypeVar
+
+from pydantic import BaseModel
+
+from openresponses_types.types import (
+    AssistantMessageItemParam,
+    Content2,
+    Content4,
+    DeveloperMessageItemParam,
+    FunctionCall,
+    FunctionCallItemParam,
+    FunctionCallOutput,
+    FunctionCallOutputItemParam,
+    FunctionCallOutputStatusEnum,
+    FunctionCallStatus,
+    ImageUrl,
+    InputFileContent,
+    InputFileContentParam,
+    InputImageContent,
+    InputImageContentParamAutoParam,
+    InputTextContent,
+    InputTextContentParam,
+    ItemReferenceParam,
+    Message,
+    MessageRole,
+    Output,
+    OutputTextContent,
+    OutputTextContentParam,
+    ReasoningBody,
+    ReasoningItemParam,
+    ReasoningSummaryContentParam,
+    RefusalContent,
+    RefusalContentParam,
+    ResponseResource,
+    Role,
+    Role1,
+    Role2,
+    Role3,
+    SystemMessageItemParam,
+    TextContent,
+    Type1,
+    Type9,
+    UrlCitationParam,
+    UserMessageItemParam,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+InputItem: TypeAlias = (
+    ItemReferenceParam
+    | ReasoningItemParam
+    | UserMessageItemParam
+    | SystemMessageItemParam
+    | DeveloperMessageItemParam
+    | AssistantMessageItemParam
+    | FunctionCallItemParam
+    | FunctionCallOutputItemParam
+)
+"""An item accepted in ``CreateResponseBody.input``."""
+
+OutputItem: TypeAlias = Message | FunctionCall | FunctionCallOutput | ReasoningBody
+"""An item found in ``ResponseResource.output``."""
+
+
+_CALL_STATUS = {status: FunctionCallStatus(status.value) for status in FunctionCallOutputStatusEnum}
+
+
+def function_call_to_param(item: FunctionCall) -> FunctionCallItemParam:
+    """Convert a ``FunctionCall`` output item into a ``FunctionCallItemParam``."""
+    return _build(
+        FunctionCallItemParam,
+        id=item.id,
+        call_id=item.call_id,
+        type="function_call",
+        name=item.name,
+        arguments=item.arguments,
+        status=item.status,
+    )
+
+
+def function_call_output_to_param(item: FunctionCallOutput) -> FunctionCallOutputItemParam:
+    """Convert a ``FunctionCallOutput`` item into a ``FunctionCallOutputItemParam``."""
+    output: Any
+    if isinstance(item.output, str):
+        output = _build(Output, root=item.output)
+    else:
+        output = [_input_part(part) for part in item.output]
+    return _build(
+        FunctionCallOutputItemParam,
+        id=item.id,
+        call_id=item.call_id,
+        type="function_call_output",
+        output=output,
+        status=_CALL_STATUS[item.status],
+    )
+
+
+def message_to_param(
+    item: Message,
+) -> AssistantMessageItemParam | UserMessageItemParam | SystemMessageItemParam | DeveloperMessageItemParam:
+    """Convert a ``Message`` into the input message param matching its role."""
+    status = str(item.status)
+    if item.role == MessageRole.assistant:
+        return _build(
+            AssistantMessageItemParam,
+            id=item.id,
+            type="message",
+            role=Role3.assistant,
+            content=[_assistant_part(part) for part in item.content],
+            status=status,
+        )
+    if item.role == MessageRole.user:
+        return _build(
+            UserMessageItemParam,
+            id=item.id,
+            type="message",
+            role=Role.user,
+            content=[_input_part(part) for part in item.content],
+            status=status,
+        )
+    if item.role == MessageRole.system:
+        return _build(
+            SystemMessageItemParam,
+            id=item.id,
+            type="message",
+            role=Role1.system,
+            content=[_build(Content2, root=_input_text_part(part)) for part in item.content],
+            status=status,
+        )
+    return _build(
+        DeveloperMessageItemParam,
+        id=item.id,
+        type="message",
+        role=Role2.developer,
+        content=[_build(Content4, root=_input_text_part(part)) for part in item.content],
+        status=status,
+    )
+
+
+def reasoning_to_param(item: ReasoningBody) -> ReasoningItemParam:
+    """Convert a ``ReasoningBody`` into a ``ReasoningItemParam``.
+
+    Only the summary and encrypted content are carried over; the input schema has
+    no field for raw reasoning content.
+    """
+    summary = []
+    for part in item.summary:
+        if not hasattr(part, "text"):
+            raise ValueError(f"Cannot convert reasoning summary part of type {part.type!r}")
+        summary.append(_build(ReasoningSummaryContentParam, type=Type1.summary_text, text=part.text))
+    return _build(
+        ReasoningItemParam,
+        id=item.id,
+        type="reasoning",
+        summary=summary,
+        content=None,
+        encrypted_content=item.encrypted_content,
+    )
+
+
+_CONVERTERS: dict[type[BaseModel], Callable[[Any], InputItem]] = {
+    Message: message_to_param,
+    FunctionCall: function_call_to_param,
+    FunctionCallOutput: function_call_output_to_param,
+    ReasoningBody: reasoning_to_param,
+}
+
+
+def to_input_item(item: OutputItem) -> InputItem:
+    """Convert a single output item (including streaming ``Item*`` subclasses) into an input item."""
+    for cls in type(item).__mro__:
+        converter = _CONVERTERS.get(cls)
+        if converter is not None:
+            return converter(item)
+    raise TypeError(f"Cannot convert {type(item).__name__} to an input item")
+
+
+def to_input_items(items: Iterable[OutputItem]) -> list[InputItem]:
+    """Convert a sequence of output items into input items."""
+    return [to_input_item(item) for item in items]
+
+
+def response_to_input(response: ResponseResource) -> list[InputItem]:
+    """Convert all output items of ``response`` into input items for the next request."""
+    return to_input_items(response.output)
+
+
+def _input_text_part(part: Any) -> InputTextContentParam:
+    if isinstance(part, InputTextContent | TextContent | OutputTextContent):
+        return _build(InputTextContentParam, type="input_text", text=part.text)
+    raise ValueError(f"Cannot convert content part of type {part.type!r} to input_text")
+
+
+def _input_part(part: Any) -> InputTextContentParam | InputImageContentParamAutoParam | InputFileContentParam:
+    if isinstance(part, InputImageContent):
+        image_url = _build(ImageUrl, root=part.image_url) if part.image_url is not None else None
+        return _build(InputImageContentParamAutoParam, type="input_image", image_url=image_url, detail=part.detail)
+    if isinstance(part, InputFileContent):
+        return _build(
+            InputFileContentParam, type="input_file", filename=part.filename, file_data=None, file_url=part.file_url
+        )
+    return _input_text_part(part)
+
+
+def _assistant_part(part: Any) -> OutputTextContentParam | RefusalContentParam:
+    if isinstance(part, OutputTextContent):
+        annotations = [
+            _build(
+                UrlCitationParam,
+                type=Type9.url_citation,
+                start_index=annotation.root.start_index,
+                end_index=annotation.root.end_index,
+                url=annotation.root.url,
+                title=annotation.root.title,
+            )
+            for annotation in part.annotations
+        ]
+        return _build(OutputTextContentParam, type="output_text", text=part.text, annotations=annotations)
+    if isinstance(part, TextContent):
+        return _build(OutputTextContentParam, type="output_text", text=part.text, annotations=None)
+    if isinstance(part, RefusalContent):
+        return _build(RefusalContentParam, type="refusal", refusal=part.refusal)
+    raise ValueError(f"Cannot convert content part of type {part.type!r} to assistant content")
+
+
+def _build(cls: type[ModelT], **values: Any) -> ModelT:
+    """Instantiate ``cls`` from already-valid values for *every* field.
+
+    Equivalent to ``cls.model_construct(**values)`` without the per-field default
+    handling.
+    """
+    model = cls.__new__(cls)
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", set(values))
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return model
@@ -0,0 +1,122 @@
+"""Share repeated strings and tool schemas between held models.
+
+A process keeping thousands of ``ResponseResource`` objects stores the same
+``model``, ``status``, ``service_tier``, ``instructions``, tool names,
+descriptions and ``parameters`` schemas once per response. pydantic-core already
+reuses short strings (up to 64 characters) while parsing JSON, but not longer
+texts, dict-valued schemas or models validated from Python objects.
+:class:`InternTable` replaces the low-cardinality fields of ``ResponseResource``,
+``Message``, ``FunctionCall`` and ``FunctionTool`` with canonical instances from a
+size-capped LRU table, in place; :func:`parse_response` parses and interns in one
+step.
+
+Interned schemas are shared ``dict`` objects: treat interned models as read-only.
+Unique identifiers such as ``id`` and ``call_id`` are left alone.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, RootModel
+
+from openresponses_types._cache import CacheInfo, LRUCache
+from openresponses_types.types import (
+    FunctionCall,
+    FunctionTool,
+    JsonSchemaResponseFormat,
+    Message,
+    ResponseResource,
+)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_RESPONSE_FIELDS = ("status", "model", "instructions", "service_tier", "prompt_cache_key", "safety_identifier")
+
+
+class InternTable:
+    """Bounded table of canonical strings and schemas.
+
+    ``maxsize`` caps the number of strings and of schemas kept (least recently used
+    entries are dropped); strings longer than ``max_length`` are not interned.
+    A table can be shared by threads interning different models.
+    """
+
+    def __init__(self, maxsize: int = 65536, *, max_length: int = 65536) -> None:
+        self.max_length = max_length
+        self._strings: LRUCache[str, str] = LRUCache(maxsize)
+        self._schemas: LRUCache[str, dict[str, Any]] = LRUCache(maxsize)
+
+    def string(self, value: str | None) -> str | None:
+        """Return the canonical instance of ``value``."""
+        if value is None or len(value) > self.max_length:
+            return value
+        canonical = self._strings.get(value)
+        if canonical is None:
+            self._strings.put(value, value)
+            return value
+        return canonical
+
+    def schema(self, value: dict[str, Any] | None) -> dict[str, Any] | None:
+        """Return the canonical (shared) instance of a JSON Schema ``dict``."""
+        if value is None:
+            return None
+        key = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        canonical = self._schemas.get(key)
+        if canonical is None:
+            self._schemas.put(key, value)
+            return value
+        return canonical
+
+    def intern(self, model: ModelT) -> ModelT:
+        """Intern the known fields of ``model`` (and its output items and tools) in place."""
+        if isinstance(model, RootModel):
+            self.intern(model.root)
+        elif isinstance(model, ResponseResource):
+            self._intern_response(model)
+        elif isinstance(model, Message):
+            self._intern_message(model)
+        elif isinstance(model, FunctionCall):
+            self._set(model, "name")
+        elif isinstance(model, FunctionTool):
+            self._intern_tool(model)
+        return model
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss statistics of the string table."""
+        return self._strings.info()
+
+    def _set(self, model: BaseModel, *names: str) -> None:
+        fields = model.__dict__
+        string = self.string
+        for name in names:
+            value = fields[name]
+            if type(value) is str:
+                fields[name] = string(value)
+
+    def _intern_response(self, response: ResponseResource) -> None:
+        self._set(response, *_RESPONSE_FIELDS)
+        if response.metadata:
+            string = self.string
+            response.__dict__["metadata"] = {string(key): string(value) for key, value in response.metadata.items()}
+        text_format = response.text.format
+        if isinstance(text_format, JsonSchemaResponseFormat):
+            self._set(text_format, "name", "description")
+        for tool in response.tools:
+            self._intern_tool(tool.root)
+        for item in response.output:
+            self.intern(item)
+
+    def _intern_message(self, message: Message) -> None:
+        for part in message.content:
+            self._set(part, "type")
+
+    def _intern_tool(self, tool: FunctionTool) -> None:
+        self._set(tool, "name", "description")
+        tool.__dict__["parameters"] = self.schema(tool.parameters)
+
+
+def parse_response(data: str | bytes, table: InternTable) -> ResponseResource:
+    """Parse a ``ResponseResource`` from JSON and intern its known fields with ``table``."""
+    return table.intern(ResponseResource.model_validate_json(data))
@@ -0,0 +1,332 @@
+"""Reject oversized request bodies before parsing them.
+
+The schema caps text fields at 10 MiB, image URLs at 20 MiB, file data at 32 MiB
+and some lists and maps at a number of entries, but validation only sees these
+limits after the whole body has been decoded into Python objects.
+:func:`check_limits` scans the raw JSON bytes once, looks up the
+``Field(max_length=...)`` constraint of each value's field in a generated model
+and returns a :class:`~openresponses_types.rejection.Rejection` as soon as a
+string or container exceeds its limit, or the body exceeds the configured caps::
+
+    rejection = check_limits(body, CreateResponseBody, max_bytes=64 << 20, max_items=10_000)
+    if rejection is not None:
+        return reject(413, rejection.code, rejection.path)
+
+String values are measured in place (as bytes of the raw JSON, counting escapes
+and multi-byte characters exactly only when the byte length is over the limit),
+so they are never decoded. Only object keys are decoded. Limits are read from the
+``max_length`` of the constraints pydantic keeps in each field's metadata.
+
+The check is not a validator: it returns ``None`` for bodies that are malformed
+in any other way. A key is held to the limit of the field of that name in every
+model that may appear at its position, even if the model that ends up matching
+would ignore the key as an unknown field.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import types
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+from pydantic.fields import FieldInfo
+
+from openresponses_types._cache import LRUCache
+from openresponses_types.rejection import Rejection
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+# A key without escapes and its colon, and the delimiter after a value, each with the whitespace around them.
+_KEY = re.compile(rb'"([^"\\]*)"[ \t\r\n]*:[ \t\r\n]*')
+_DELIMITER = re.compile(rb"[ \t\r\n]*(?:(,)|([}\]]))[ \t\r\n]*")
+_SCALAR = re.compile(rb"[^,:{}\[\]\"\s]+")
+# The longest JSON text of one character: a surrogate pair escape such as "\ud83d\ude00".
+_MAX_BYTES_PER_ESCAPED_CHAR = 12
+# The escapes of the high half of a surrogate pair (\ud800-\udbff), in lower case.
+_HIGH_SURROGATES = (b"\\ud8", b"\\ud9", b"\\uda", b"\\udb")
+# Every byte but the UTF-8 continuation bytes, which do not start a character.
+_LEADING_BYTES = bytes(byte for byte in range(256) if not 0x80 <= byte < 0xC0)
+# Types whose values are never JSON strings; any type not listed here or handled below may accept one.
+_NON_STRING = (bool, int, float, type(None))
+# Types that allow any JSON below them.
+_OPEN = (Any, object, dict, list)
+
+_SHAPES: LRUCache[type[BaseModel], _Shape] = LRUCache(64)
+
+
+class _Shape:
+    """The limits that apply at one position of a model's JSON, given the types that may appear there."""
+
+    __slots__ = ("candidates", "string", "size", "_children", "_item")
+
+    def __init__(self, candidates: list[tuple[Any, int | None]]) -> None:
+        self.candidates = candidates
+        self.string = _limit(candidates, lambda kind: kind is str, _accepts_string)
+        self.size = _limit(candidates, _is_container, lambda kind: kind in _OPEN)
+        self._children: dict[str, _Shape] = {}
+        self._item: _Shape | None = None
+
+    def child(self, key: str) -> _Shape:
+        """Return the shape of the value at ``key`` of an object at this position."""
+        shape = self._children.get(key)
+        if shape is None:
+            candidates: list[tuple[Any, int | None]] = []
+            for kind, _ in self.candidates:
+                if kind in _OPEN:
+                    return _ANY
+                if get_origin(kind) is dict:
+                    candidates += _flatten(get_args(kind)[1])
+                elif isinstance(kind, type) and issubclass(kind, BaseModel):
+                    for name, field in kind.model_fields.items():
+                        if (field.alias or name) == key:
+                            candidates += _flatten(field.annotation, field.metadata)
+            shape = _Shape(candidates) if candidates else _ANY
+            self._children[key] = shape
+        return shape
+
+    def item(self) -> _Shape:
+        """Return the shape of the items of an array at this position."""
+        if self._item is None:
+            candidates: list[tuple[Any, int | None]] = []
+            for kind, _ in self.candidates:
+                if kind in _OPEN:
+                    self._item = _ANY
+                    return _ANY
+                if get_origin(kind) is list:
+                    candidates += _flatten(get_args(kind)[0])
+            self._item = _Shape(candidates) if candidates else _ANY
+        return self._item
+
+
+def _flatten(
+    annotation: Any, metadata: list[Any] | tuple[Any, ...] = (), limit: int | None = None
+) -> list[tuple[Any, int | None]]:
+    """Return the types a value of ``annotation`` may have, each with its ``max_length``."""
+    for item in metadata:
+        for constraint in item.metadata if isinstance(item, FieldInfo) else [item]:
+            max_length = getattr(constraint, "max_length", None)
+            if isinstance(max_length, int):
+                limit = max_length
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _flatten(get_args(annotation)[0], get_args(annotation)[1:], limit)
+    if origin is Union or origin is types.UnionType:
+        return [member for arg in get_args(annotation) for member in _flatten(arg, (), limit)]
+    if isinstance(annotation, type) and issubclass(annotation, RootModel):
+        root = annotation.model_fields["root"]
+        return _flatten(root.annotation, root.metadata, limit)
+    return [(annotation, limit)]
+
+
+def _is_container(kind: Any) -> bool:
+    return get_origin(kind) in (list, dict) or isinstance(kind, type) and issubclass(kind, BaseModel)
+
+
+def _accepts_string(kind: Any) -> bool:
+    """Return whether a string of any length may be valid for ``kind`` (literals and enums included)."""
+    if kind in _NON_STRING or get_origin(kind) in (list, dict):
+        return False
+    return not (isinstance(kind, type) and issubclass(kind, BaseModel))
+
+
+def _limit(candidates: list[tuple[Any, int | None]], limited: Any, unlimited: Any) -> int | None:
+    """Return the largest limit of the ``limited`` candidates, or ``None`` if any of them is unbounded."""
+    limits = []
+    for kind, limit in candidates:
+        if limited(kind):
+            if limit is None:
+                return None
+            limits.append(limit)
+        elif unlimited(kind):
+            return None
+    return max(limits) if limits else None
+
+
+_ANY = _Shape([(Any, None)])
+
+
+def check_limits(
+    data: str | bytes,
+    model: type[BaseModel],
+    *,
+    max_bytes: int | None = None,
+    max_items: int | None = None,
+    max_depth: int | None = None,
+) -> Rejection | None:
+    """Return a :class:`Rejection` if ``data`` exceeds a length limit of ``model`` or a cap, else ``None``.
+
+    Codes are ``string_too_long`` and ``too_long`` for the schema's limits, and
+    ``body_too_large`` (``max_bytes`` bytes), ``too_many_items`` (``max_items``
+    entries in one array or object) and ``too_deep`` (``max_depth`` nested
+    containers) for the caps. A body that is not valid JSON is rejected with
+    ``json_invalid`` if the scan runs into the error.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+    if max_bytes is not None and len(data) > max_bytes:
+        return Rejection("body_too_large", (), None)
+    root = _SHAPES.get(model)
+    if root is None:
+        root = _Shape(_flatten(model))
+        _SHAPES.put(model, root)
+    return _Scanner(data, max_items, max_depth).scan(root)
+
+
+class _Invalid(Exception):
+    """Raised when the scanned bytes are not valid JSON."""
+
+
+class _Scanner:
+    __slots__ = ("data", "max_items", "max_depth", "path", "ascii")
+
+    def __init__(self, data: bytes, max_items: int | None, max_depth: int | None) -> None:
+        self.data = data
+        self.max_items = max_items
+        self.max_depth = max_depth
+        self.path: list[str | int] = []
+        self.ascii: bool | None = None
+
+    def reject(self, code: str) -> Rejection:
+        field = next((step for step in reversed(self.path) if isinstance(step, str)), None)
+        return Rejection(code, tuple(self.path), field)
+
+    def scan(self, root: _Shape) -> Rejection | None:
+        try:
+            return self._scan(root)
+        except (_Invalid, IndexError):
+            return self.reject("json_invalid")
+
+    def _scan(self, root: _Shape) -> Rejection | None:
+        """Walk the document with an explicit stack of open containers (shape, closing byte, entry count)."""
+        data = self.data
+        path = self.path
+        stack: list[tuple[_Shape, int, list[int]]] = []
+        shape = root
+        pos = self.space(0)
+        while True:
+            first = data[pos]
+            if first == ord('"'):
+                end = self.string(pos)
+                if shape.string is not None and self.too_long(pos + 1, end - 1, shape.string):
+                    return self.reject("string_too_long")
+                pos = end
+            elif first in b"{[":
+                if self.max_depth is not None and len(stack) >= self.max_depth:
+                    return self.reject("too_deep")
+                close = ord("}") if first == ord("{") else ord("]")
+                pos = self.space(pos + 1)
+                if data[pos] != close:
+                    stack.append((shape, close, [1]))
+                    pos, shape = self.entry(pos, shape, close)
+                    continue
+                pos += 1
+            else:
+                match = _SCALAR.match(data, pos)
+                if match is None:
+                    raise _Invalid
+                pos = match.end()
+            while stack:
+                match = _DELIMITER.match(data, pos)
+                if match is None:
+                    raise _Invalid
+                parent, close, count = stack[-1]
+                if match.lastindex == 2:
+                    if data[match.start(2)] != close:
+                        raise _Invalid
+                    stack.pop()
+                    path.pop()
+                    pos = match.end()
+                    continue
+                count[0] += 1
+                path.pop()
+                if parent.size is not None and count[0] > parent.size:
+                    return self.reject("too_long")
+                if self.max_items is not None and count[0] > self.max_items:
+                    return self.reject("too_many_items")
+                pos, shape = self.entry(match.end(), parent, close, count[0] - 1)
+                break
+            else:
+                if self.space(pos) != len(data):
+                    raise _Invalid
+                return None
+
+    def entry(self, pos: int, parent: _Shape, close: int, index: int = 0) -> tuple[int, _Shape]:
+        """Read the key of an object entry (or note an array index); return the value's position and shape."""
+        if close == ord("]"):
+            self.path.append(index)
+            return pos, parent.item()
+        data = self.data
+        match = _KEY.match(data, pos)
+        if match is not None:
+            key = match.group(1).decode()
+            pos = match.end()
+        else:
+            if data[pos] != ord('"'):
+                raise _Invalid
+            end = self.string(pos)
+            key = json.loads(data[pos:end])
+            pos = self.space(end)
+            if data[pos] != ord(":"):
+                raise _Invalid
+            pos = self.space(pos + 1)
+        self.path.append(key)
+        return pos, parent.child(key)
+
+    def space(self, pos: int) -> int:
+        match = _WHITESPACE.match(self.data, pos)
+        assert match is not None
+        return match.end()
+
+    def string(self, pos: int) -> int:
+        """Return the position after the string starting at ``pos``."""
+        data = self.data
+        end = data.find(b'"', pos + 1)
+        while end != -1:
+            escapes = end - 1
+            while data[escapes] == ord("\\"):
+                escapes -= 1
+            if (end - escapes) % 2:
+                return end + 1
+            end = data.find(b'"', end + 1)
+        raise _Invalid
+
+    def too_long(self, start: int, end: int, limit: int) -> bool:
+        """Return whether the JSON string contents ``data[start:end]`` decode to more than ``limit`` characters."""
+        size = end - start
+        if size <= limit:
+            return False
+        data = self.data
+        if data.find(b"\\", start, end) == -1:
+            if self.ascii is None:
+                self.ascii = data.isascii()
+            if self.ascii or size > limit * 4:
+                return True
+        elif size > limit * _MAX_BYTES_PER_ESCAPED_CHAR:
+            return True
+        return _characters(data[start:end]) > limit
+
+
+def _characters(text: bytes) -> int:
+    """Return the number of characters the contents of a valid JSON string decode to, without decoding them.
+
+    Escaped backslashes are removed first, so that every remaining backslash
+    starts an escape. Each high surrogate escape is assumed to be followed by a low
+    one, the pair decoding to one character: pydantic rejects lone surrogates.
+    """
+    rest = text.replace(b"\\\\", b"")
+    escaped_backslashes = (len(text) - len(rest)) // 2
+    surrogate_pairs = 0
+    if b"\\ud" in rest or b"\\uD" in rest:
+        lowered = rest.lower()
+        surrogate_pairs = sum(lowered.count(escape) for escape in _HIGH_SURROGATES)
+    continuation_bytes = len(rest.translate(None, _LEADING_BYTES))
+    # Each remaining escape takes two bytes (six for \uXXXX) and decodes to one character.
+    return (
+        escaped_backslashes
+        + len(rest)
+        - rest.count(b"\\")
+        - 4 * rest.count(b"\\u")
+        - surrogate_pairs
+        - continuation_bytes
+    )
@@ -0,0 +1,566 @@
+"""Local in-process OpenResponses server for offline load and latency testing.
+
+:class:`MockResponsesServer` is a small asyncio HTTP/1.1 server (stdlib only) that
+accepts ``POST .../responses`` with a ``CreateResponseBody``. It answers with a
+synthetic ``ResponseResource``, or, when ``stream`` is true, with a realistic
+server-sent event sequence: ``response.created``, ``response.in_progress``, the
+output item and content part events, N ``response.output_text.delta`` events and
+``response.completed``. Delta size, event rate, logprobs and payload size are
+configurable. Malformed requests are answered with a 400 error payload and
+failures to generate a response with a 500 one (or, once a stream has started,
+with an ``error`` event).
+
+Run it standalone with ``python -m openresponses_types.mock_server --port 8080``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import itertools
+import time
+from collections.abc import Iterator
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from openresponses_types.history import OutputItem
+from openresponses_types.types import (
+    CreateResponseBody,
+    ErrorPayload,
+    ErrorStreamingEvent,
+    FunctionTool,
+    InputTokensDetails,
+    Item2,
+    Item5,
+    Item62,
+    Item65,
+    LogProb,
+    Message,
+    MessageRole,
+    MessageStatus,
+    Object,
+    OutputTextContent,
+    OutputTokensDetails,
+    Reasoning,
+    ReasoningBody,
+    ReasoningTextContent,
+    ResponseCompletedStreamingEvent,
+    ResponseContentPartAddedStreamingEvent,
+    ResponseContentPartDoneStreamingEvent,
+    ResponseCreatedStreamingEvent,
+    ResponseInProgressStreamingEvent,
+    ResponseOutputItemAddedStreamingEvent,
+    ResponseOutputItemDoneStreamingEvent,
+    ResponseOutputTextDeltaStreamingEvent,
+    ResponseOutputTextDoneStreamingEvent,
+    ResponseReasoningDeltaStreamingEvent,
+    ResponseReasoningDoneStreamingEvent,
+    ResponseResource,
+    TextField,
+    TextResponseFormat,
+    Tool,
+    ToolChoiceValueEnum,
+    TopLogProb,
+    TruncationEnum,
+    Type31,
+    Type34,
+    Type37,
+    Type39,
+    Type40,
+    Type43,
+    Type44,
+    Type47,
+    Type48,
+    Type49,
+    Type50,
+    Type53,
+    Type54,
+    Type60,
+    Usage,
+)
+
+_FILLER = "The quick brown fox jumps over the lazy dog. "
+_ids = itertools.count(1)
+
+
+def make_text(n_chars: int) -> str:
+    """Return ``n_chars`` characters of filler text."""
+    repeats = n_chars // len(_FILLER) + 1
+    return (_FILLER * repeats)[:n_chars]
+
+
+def encode_sse(event: BaseModel) -> bytes:
+    """Encode a streaming event model as an SSE frame."""
+    event_type = getattr(event, "type", "message")
+    return b"event: " + str(event_type).encode() + b"\ndata: " + event.model_dump_json().encode() + b"\n\n"
+
+
+def build_response(
+    body: CreateResponseBody,
+    *,
+    response_id: str,
+    status: str,
+    output: list[OutputItem],
+    usage: Usage | None = None,
+    created_at: int | None = None,
+) -> ResponseResource:
+    """Build a synthetic ``ResponseResource`` echoing the request's settings."""
+    created = int(time.time()) if created_at is None else created_at
+    tool_choice = body.tool_choice if isinstance(body.tool_choice, ToolChoiceValueEnum) else ToolChoiceValueEnum.auto
+    return ResponseResource(
+        id=response_id,
+        object=Object.response,
+        created_at=created,
+        completed_at=created if status == "completed" else None,
+        status=status,
+        incomplete_details=None,
+        model=body.model or "mock-model",
+        previous_response_id=body.previous_response_id,
+        instructions=body.instructions,
+        output=output,
+        error=None,
+        tools=[
+            Tool(
+                FunctionTool(
+                    type=Type31.function,
+                    name=tool.root.name,
+                    description=tool.root.description,
+                    parameters=None,
+                    strict=tool.root.strict,
+                )
+            )
+            for tool in body.tools or []
+        ],
+        tool_choice=tool_choice,
+        truncation=body.truncation or TruncationEnum.disabled,
+        parallel_tool_calls=body.parallel_tool_calls is not False,
+        text=TextField(format=TextResponseFormat(type=Type34.text)),
+        top_p=1.0 if body.top_p is None else body.top_p,
+        presence_penalty=body.presence_penalty or 0.0,
+        frequency_penalty=body.frequency_penalty or 0.0,
+        top_logprobs=0 if body.top_logprobs is None else body.top_logprobs.root,
+        temperature=1.0 if body.temperature is None else body.temperature,
+        reasoning=Reasoning(effort=body.reasoning.effort, summary=body.reasoning.summary) if body.reasoning else None,
+        usage=usage,
+        max_output_tokens=body.max_output_tokens.root if body.max_output_tokens else None,
+        max_tool_calls=body.max_tool_calls.root if body.max_tool_calls else None,
+        store=bool(body.store),
+        background=bool(body.background),
+        service_tier=body.service_tier or "default",
+        metadata=body.metadata.root if body.metadata else {},
+        safety_identifier=body.safety_identifier.root if body.safety_identifier else None,
+        prompt_cache_key=body.prompt_cache_key.root if body.prompt_cache_key else None,
+    )
+
+
+def stream_events(
+    body: CreateResponseBody,
+    *,
+    output_chars: int = 1024,
+    delta_size: int = 4,
+    reasoning_chars: int = 0,
+    top_logprobs: int | None = None,
+    response_id: str | None = None,
+) -> Iterator[BaseModel]:
+    """Yield the streaming events of one synthetic response.
+
+    ``top_logprobs=None`` omits logprobs; an integer attaches one ``LogProb`` per
+    delta with that many alternatives. ``reasoning_chars`` adds a reasoning item,
+    streamed as ``response.reasoning.delta`` events, before the message.
+    """
+    serial = next(_ids)
+    response_id = response_id or f"resp_mock_{serial}"
+    created_at = int(time.time())
+    sequence = itertools.count()
+    output: list[OutputItem] = []
+
+    def response(status: str, usage: Usage | None = None) -> ResponseResource:
+        return build_response(
+            body, response_id=response_id, status=status, output=list(output), usage=usage, created_at=created_at
+        )
+
+    yield ResponseCreatedStreamingEvent(
+        type=Type37.response_created, sequence_number=next(sequence), response=response("in_progress")
+    )
+    yield ResponseInProgressStreamingEvent(
+        type=Type39.response_in_progress, sequence_number=next(sequence), response=response("in_progress")
+    )
+
+    if reasoning_chars:
+        reasoning_id = f"rs_mock_{serial}"
+        reasoning_text = make_text(reasoning_chars)
+        output_index = len(output)
+        yield ResponseOutputItemAddedStreamingEvent(
+            type=Type43.response_output_item_added,
+            sequence_number=next(sequence),
+            output_index=output_index,
+            item=Item5(type="reasoning", id=reasoning_id, summary=[], content=[]),
+        )
+        for start in range(0, reasoning_chars, delta_size):
+            yield ResponseReasoningDeltaStreamingEvent(
+                type=Type53.response_reasoning_delta,
+                sequence_number=next(sequence),
+                item_id=reasoning_id,
+                output_index=output_index,
+                content_index=0,
+                delta=reasoning_text[start : start + delta_size],
+            )
+        yield ResponseReasoningDoneStreamingEvent(
+            type=Type54.response_reasoning_done,
+            sequence_number=next(sequence),
+            item_id=reasoning_id,
+            output_index=output_index,
+            content_index=0,
+            text=reasoning_text,
+        )
+        content: list[Any] = [ReasoningTextContent(type="reasoning_text", text=reasoning_text)]
+        yield ResponseOutputItemDoneStreamingEvent(
+            type=Type44.response_output_item_done,
+            sequence_number=next(sequence),
+            output_index=output_index,
+            item=Item65(type="reasoning", id=reasoning_id, summary=[], content=content),
+        )
+        output.append(ReasoningBody(type="reasoning", id=reasoning_id, summary=[], content=content))
+
+    message_id = f"msg_mock_{serial}"
+    text = make_text(output_chars)
+    output_index = len(output)
+    yield ResponseOutputItemAddedStreamingEvent(
+        type=Type43.response_output_item_added,
+        sequence_number=next(sequence),
+        output_index=output_index,
+        item=Item2(
+            type="message", id=message_id, status=MessageStatus.in_progress, role=MessageRole.assistant, content=[]
+        ),
+    )
+    yield ResponseContentPartAddedStreamingEvent(
+        type=Type47.response_content_part_added,
+        sequence_number=next(sequence),
+        item_id=message_id,
+        output_index=output_index,
+        content_index=0,
+        part=OutputTextContent(type="output_text", text="", annotations=[], logprobs=[]),
+    )
+    all_logprobs: list[LogProb] = []
+    for start in range(0, output_chars, delta_size):
+        delta = text[start : start + delta_size]
+        logprobs = [] if top_logprobs is None else [_logprob(delta, top_logprobs)]
+        all_logprobs.extend(logprobs)
+        yield ResponseOutputTextDeltaStreamingEvent(
+            type=Type49.response_output_text_delta,
+            sequence_number=next(sequence),
+            item_id=message_id,
+            output_index=output_index,
+            content_index=0,
+            delta=delta,
+            logprobs=logprobs,
+        )
+    yield ResponseOutputTextDoneStreamingEvent(
+        type=Type50.response_output_text_done,
+        sequence_number=next(sequence),
+        item_id=message_id,
+        output_index=output_index,
+        content_index=0,
+        text=text,
+        logprobs=all_logprobs,
+    )
+    part = OutputTextContent(type="output_text", text=text, annotations=[], logprobs=all_logprobs)
+    yield ResponseContentPartDoneStreamingEvent(
+        type=Type48.response_content_part_done,
+        sequence_number=next(sequence),
+        item_id=message_id,
+        output_index=output_index,
+        content_index=0,
+        part=part,
+    )
+    yield ResponseOutputItemDoneStreamingEvent(
+        type=Type44.response_output_item_done,
+        sequence_number=next(sequence),
+        output_index=output_index,
+        item=Item62(
+            type="message", id=message_id, status=MessageStatus.completed, role=MessageRole.assistant, content=[part]
+        ),
+    )
+    output.append(
+        Message(
+            type="message", id=message_id, status=MessageStatus.completed, role=MessageRole.assistant, content=[part]
+        )
+    )
+
+    usage = _usage(body, output_chars, delta_size, reasoning_chars)
+    yield ResponseCompletedStreamingEvent(
+        type=Type40.response_completed, sequence_number=next(sequence), response=response("completed", usage)
+    )
+
+
+def completed_response(
+    body: CreateResponseBody,
+    *,
+    output_chars: int = 1024,
+    delta_size: int = 4,
+    reasoning_chars: int = 0,
+    top_logprobs: int | None = None,
+    response_id: str | None = None,
+) -> ResponseResource:
+    """Return the response of the final event of :func:`stream_events`, without building the events."""
+    serial = next(_ids)
+    output: list[OutputItem] = []
+    if reasoning_chars:
+        content: list[Any] = [ReasoningTextContent(type="reasoning_text", text=make_text(reasoning_chars))]
+        output.append(ReasoningBody(type="reasoning", id=f"rs_mock_{serial}", summary=[], content=content))
+    text = make_text(output_chars)
+    logprobs = (
+        []
+        if top_logprobs is None
+        else [_logprob(text[start : start + delta_size], top_logprobs) for start in range(0, output_chars, delta_size)]
+    )
+    part = OutputTextContent(type="output_text", text=text, annotations=[], logprobs=logprobs)
+    output.append(
+        Message(
+            type="message",
+            id=f"msg_mock_{serial}",
+            status=MessageStatus.completed,
+            role=MessageRole.assistant,
+            content=[part],
+        )
+    )
+    return build_response(
+        body,
+        response_id=response_id or f"resp_mock_{serial}",
+        status="completed",
+        output=output,
+        usage=_usage(body, output_chars, delta_size, reasoning_chars),
+    )
+
+
+def _usage(body: CreateResponseBody, output_chars: int, delta_size: int, reasoning_chars: int) -> Usage:
+    """Return the usage of a synthetic response, counting one output token per delta."""
+    output_tokens = -(-output_chars // delta_size) + -(-reasoning_chars // delta_size)
+    input_tokens = len(body.model_dump_json(exclude_none=True)) // 4
+    return Usage(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        total_tokens=input_tokens + output_tokens,
+        input_tokens_details=InputTokensDetails(cached_tokens=0),
+        output_tokens_details=OutputTokensDetails(reasoning_tokens=-(-reasoning_chars // delta_size)),
+    )
+
+
+def _guarded(events: Iterator[BaseModel]) -> Iterator[BaseModel]:
+    """Yield ``events``, ending with an ``error`` event if generating them fails."""
+    sequence_number = 0
+    try:
+        for event in events:
+            sequence_number = getattr(event, "sequence_number", sequence_number) + 1
+            yield event
+    except Exception as exc:
+        yield ErrorStreamingEvent(type=Type60.error, sequence_number=sequence_number, error=_server_error(exc))
+
+
+def _server_error(exc: Exception) -> ErrorPayload:
+    return ErrorPayload(type="server_error", code=None, message=f"{type(exc).__name__}: {exc}", param=None)
+
+
+def _logprob(token: str, top_logprobs: int) -> LogProb:
+    token_bytes = list(token.encode())
+    return LogProb(
+        token=token,
+        logprob=-0.25,
+        bytes=token_bytes,
+        top_logprobs=[TopLogProb(token=token, logprob=-0.25 - rank, bytes=token_bytes) for rank in range(top_logprobs)],
+    )
+
+
+class MockResponsesServer:
+    """Asyncio HTTP server that serves synthetic OpenResponses responses.
+
+    Use as an async context manager; ``port=0`` picks a free port, available as
+    :attr:`port` and :attr:`url` once started. ``events_per_second`` throttles the
+    stream (``None`` sends as fast as the socket allows).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        output_chars: int = 1024,
+        delta_size: int = 4,
+        reasoning_chars: int = 0,
+        top_logprobs: int | None = None,
+        events_per_second: float | None = None,
+    ) -> None:
+        if delta_size < 1:
+            raise ValueError("delta_size must be at least 1")
+        self.host = host
+        self.port = port
+        self.output_chars = output_chars
+        self.delta_size = delta_size
+        self.reasoning_chars = reasoning_chars
+        self.top_logprobs = top_logprobs
+        self.events_per_second = events_per_second
+        self.requests_served = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        """The URL to POST ``CreateResponseBody`` payloads to."""
+        return f"http://{self.host}:{self.port}/v1/responses"
+
+    async def start(self) -> None:
+        """Start listening; resolves :attr:`port` when it was 0."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening and wait for the server to shut down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def serve_forever(self) -> None:
+        """Start (if needed) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def __aenter__(self) -> MockResponsesServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers: dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                    content_length = int(headers.get("content-length", "0"))
+                except ValueError:
+                    await self._send_error(writer, 400, "invalid_request_error", "Malformed HTTP request")
+                    break
+                payload = await reader.readexactly(content_length)
+                await self._dispatch(method, path, payload, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(self, method: str, path: str, payload: bytes, writer: asyncio.StreamWriter) -> None:
+        if not path.split("?", 1)[0].rstrip("/").endswith("/responses"):
+            await self._send_error(writer, 404, "not_found", f"No route for {path}")
+            return
+        if method != "POST":
+            await self._send_error(writer, 405, "method_not_allowed", f"{method} is not supported")
+            return
+        try:
+            body = CreateResponseBody.model_validate_json(payload)
+        except ValidationError as exc:
+            await self._send_error(writer, 400, "invalid_request_error", str(exc))
+            return
+
+        self.requests_served += 1
+        options: dict[str, Any] = {
+            "output_chars": self.output_chars,
+            "delta_size": self.delta_size,
+            "reasoning_chars": self.reasoning_chars,
+            "top_logprobs": self.top_logprobs,
+        }
+        if not body.stream:
+            try:
+                response = completed_response(body, **options)
+            except Exception as exc:
+                await self._send_error(writer, 500, "server_error", _server_error(exc).message)
+                return
+            self._send(writer, 200, "application/json", response.model_dump_json().encode())
+            await writer.drain()
+            return
+
+        events = _guarded(stream_events(body, **options))
+        first = next(events)
+        if isinstance(first, ErrorStreamingEvent):
+            await self._send_error(writer, 500, "server_error", first.error.message)
+            return
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        delay = None if self.events_per_second is None else 1.0 / self.events_per_second
+        for event in itertools.chain([first], events):
+            frame = encode_sse(event)
+            writer.write(f"{len(frame):x}\r\n".encode() + frame + b"\r\n")
+            await writer.drain()
+            if delay is not None:
+                await asyncio.sleep(delay)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int, error_type: str, message: str) -> None:
+        error = ErrorPayload(type=error_type, code=None, message=message, param=None)
+        self._send(writer, status, "application/json", b'{"error":' + error.model_dump_json().encode() + b"}")
+        await writer.drain()
+
+    @staticmethod
+    def _send(writer: asyncio.StreamWriter, status: int, content_type: str, payload: bytes) -> None:
+        reason = {
+            200: "OK",
+            400: "Bad Request",
+            404: "Not Found",
+            405: "Method Not Allowed",
+            500: "Internal Server Error",
+        }[status]
+        head = f"HTTP/1.1 {status} {reason}\r\nContent-Type: {content_type}\r\nContent-Length: {len(payload)}\r\n\r\n"
+        writer.write(head.encode() + payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local mock OpenResponses server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--output-chars", type=int, default=1024, help="Length of the generated output text")
+    parser.add_argument("--delta-size", type=int, default=4, help="Characters per output_text.delta event")
+    parser.add_argument("--reasoning-chars", type=int, default=0, help="Length of streamed reasoning text")
+    parser.add_argument("--top-logprobs", type=int, default=None, help="Attach logprobs with N alternatives")
+    parser.add_argument("--events-per-second", type=float, default=None, help="Throttle streamed events")
+    args = parser.parse_args()
+
+    server = MockResponsesServer(
+        args.host,
+        args.port,
+        output_chars=args.output_chars,
+        delta_size=args.delta_size,
+        reasoning_chars=args.reasoning_chars,
+        top_logprobs=args.top_logprobs,
+        events_per_second=args.events_per_second,
+    )
+
+    async def run() -> None:
+        await server.start()
+        print(f"Serving mock OpenResponses API on {server.url}")
+        await server.serve_forever()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Incremental JSON parsing of streamed function call arguments.
+
+``response.function_call_arguments.delta`` events carry fragments of the
+``FunctionCall.arguments`` JSON string. :class:`PartialJSONParser` consumes those
+fragments as they arrive, in time linear in each fragment, and keeps a live
+partial value: containers are visible as soon as they open and scalars as soon as
+they complete, and ``on_key`` fires with the path of every completed value, so a
+caller can act on ``path`` or ``query`` before the arguments are done.
+
+:class:`FunctionArgumentsTracker` attaches one parser to each function call item of
+a stream.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Callable
+from typing import Any, NoReturn, TypeAlias
+
+from openresponses_types.streaming import StreamingEvent
+from openresponses_types.types import (
+    FunctionCall,
+    ResponseFunctionCallArgumentsDeltaStreamingEvent,
+    ResponseFunctionCallArgumentsDoneStreamingEvent,
+    ResponseOutputItemAddedStreamingEvent,
+    ResponseOutputItemDoneStreamingEvent,
+)
+
+JSONPath: TypeAlias = tuple[str | int, ...]
+"""Keys and indexes leading from the root to a value."""
+
+KeyCallback: TypeAlias = Callable[[JSONPath, Any], None]
+
+# Parser modes.
+_VALUE = 0
+_STRING = 1
+_NUMBER = 2
+_LITERAL = 3
+_AFTER_VALUE = 4
+_KEY = 5
+_COLON = 6
+_DONE = 7
+
+_WHITESPACE = " \t\r\n"
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER_CHARS = re.compile(r"[0-9eE.+\-]*")
+_NUMBER_SYNTAX = re.compile(r"-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][+-]?[0-9]+)?")
+_LITERALS = {"t": ("true", True), "f": ("false", False), "n": ("null", None)}
+
+
+class _Frame:
+    __slots__ = ("container", "key", "empty")
+
+    def __init__(self, container: dict[str, Any] | list[Any]) -> None:
+        self.container = container
+        self.key: str | int | None = None if isinstance(container, dict) else 0
+        self.empty = True
+
+
+class PartialJSONParser:
+    """Streaming JSON parser that keeps its state between chunks.
+
+    :meth:`feed` each fragment in order; :attr:`value` is the partial value parsed so
+    far (``None`` until the root value starts) and :attr:`done` tells whether it is
+    complete. ``on_key(path, value)`` is called whenever a value inside the root
+    (object member or array element, at any depth) completes, and once with the
+    empty path for the root itself. Malformed input raises ``ValueError``.
+    """
+
+    def __init__(self, on_key: KeyCallback | None = None) -> None:
+        self.on_key = on_key
+        self.value: Any = None
+        self._stack: list[_Frame] = []
+        self._mode = _VALUE
+        self._parts: list[str] = []
+        self._is_key = False
+        self._escape = False
+        self._offset = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the root value is complete."""
+        return self._mode == _DONE
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next fragment of the JSON text."""
+        index, length = 0, len(chunk)
+        while index < length:
+            mode = self._mode
+            if mode == _STRING:
+                index = self._scan_string(chunk, index)
+                continue
+            if mode == _NUMBER:
+                end = _NUMBER_CHARS.match(chunk, index).end()  # type: ignore[union-attr]
+                self._parts.append(chunk[index:end])
+                index = end
+                if end < length:
+                    self._end_number()
+                continue
+            char = chunk[index]
+            if mode == _LITERAL:
+                self._parts.append(char)
+                index += 1
+                self._check_literal()
+                continue
+            index += 1
+            if char in _WHITESPACE:
+                continue
+            if mode == _VALUE:
+                self._start_value(char, index - 1)
+            elif mode == _AFTER_VALUE:
+                self._after_value(char, index - 1)
+            elif mode == _KEY:
+                if char == '"':
+                    self._mode, self._is_key = _STRING, True
+                elif char == "}" and self._stack[-1].empty:
+                    self._close_container()
+                else:
+                    self._error(char, index - 1)
+            elif mode == _COLON:
+                if char != ":":
+                    self._error(char, index - 1)
+                self._mode = _VALUE
+            else:
+                self._error(char, index - 1)
+        self._offset += length
+
+    def close(self) -> Any:
+        """Finish parsing at end of input and return the complete value."""
+        if self._mode == _NUMBER:
+            self._end_number()
+        if self._mode != _DONE:
+            raise ValueError("Incomplete JSON value")
+        return self.value
+
+    def _error(self, char: str, index: int) -> NoReturn:
+        raise ValueError(f"Unexpected {char!r} at offset {self._offset + index}")
+
+    def _start_value(self, char: str, index: int) -> None:
+        if char == "{" or char == "[":
+            container: dict[str, Any] | list[Any] = {} if char == "{" else []
+            self._attach(container)
+            self._stack.append(_Frame(container))
+            self._mode = _KEY if char == "{" else _VALUE
+        elif char == '"':
+            self._mode, self._is_key = _STRING, False
+        elif char == "-" or "0" <= char <= "9":
+            self._mode = _NUMBER
+            self._parts.append(char)
+        elif char in _LITERALS:
+            self._mode = _LITERAL
+            self._parts.append(char)
+        elif char == "]" and self._stack and self._stack[-1].empty and isinstance(self._stack[-1].container, list):
+            self._close_container()
+        else:
+            self._error(char, index)
+
+    def _after_value(self, char: str, index: int) -> None:
+        if not self._stack:
+            self._error(char, index)
+        frame = self._stack[-1]
+        is_dict = isinstance(frame.container, dict)
+        if char == ",":
+            self._mode = _KEY if is_dict else _VALUE
+        elif char == ("}" if is_dict else "]"):
+            self._close_container()
+        else:
+            self._error(char, index)
+
+    def _scan_string(self, chunk: str, index: int) -> int:
+        parts = self._parts
+        if self._escape:
+            parts.append(chunk[index])
+            self._escape = False
+            index += 1
+        while True:
+            match = _STRING_SPECIAL.search(chunk, index)
+            if match is None:
+                parts.append(chunk[index:])
+                return len(chunk)
+            end = match.start()
+            if chunk[end] == '"':
+                parts.append(chunk[index:end])
+                self._end_string()
+                return end + 1
+            if end + 1 < len(chunk):
+                parts.append(chunk[index : end + 2])
+                index = end + 2
+            else:
+                parts.append(chunk[index:])
+                self._escape = True
+                return len(chunk)
+
+    def _end_string(self) -> None:
+        raw = "".join(self._parts)
+        self._parts.clear()
+        text: str = json.loads(f'"{raw}"') if "\\" in raw else raw
+        if self._is_key:
+            self._stack[-1].key = text
+            self._mode = _COLON
+        else:
+            self._attach(text)
+            self._complete(text)
+
+    def _end_number(self) -> None:
+        raw = "".join(self._parts)
+        self._parts.clear()
+        match = _NUMBER_SYNTAX.fullmatch(raw)
+        if match is None:
+            raise ValueError(f"Invalid number {raw!r}")
+        number = float(raw) if match.group(1) or match.group(2) else int(raw)
+        self._attach(number)
+        self._complete(number)
+
+    def _check_literal(self) -> None:
+        raw = "".join(self._parts)
+        literal, value = _LITERALS[raw[0]]
+        if not literal.startswith(raw):
+            raise ValueError(f"Invalid literal {raw!r}")
+        if raw == literal:
+            self._parts.clear()
+            self._attach(value)
+            self._complete(value)
+
+    def _attach(self, value: Any) -> None:
+        if not self._stack:
+            self.value = value
+            return
+        frame = self._stack[-1]
+        frame.empty = False
+        if isinstance(frame.container, dict):
+            frame.container[frame.key] = value  # type: ignore[index]
+        else:
+            frame.container.append(value)
+
+    def _close_container(self) -> None:
+        frame = self._stack.pop()
+        self._complete(frame.container)
+
+    def _complete(self, value: Any) -> None:
+        """Fire ``on_key`` for a completed value and advance the enclosing container."""
+        if self.on_key is not None:
+            self.on_key(tuple(frame.key for frame in self._stack), value)  # type: ignore[misc]
+        if not self._stack:
+            self._mode = _DONE
+            return
+        frame = self._stack[-1]
+        if isinstance(frame.container, list):
+            frame.key = len(frame.container)
+        self._mode = _AFTER_VALUE
+
+
+class PartialFunctionCall:
+    """A function call item whose arguments are being streamed."""
+
+    __slots__ = ("item_id", "call_id", "name", "parser")
+
+    def __init__(self, item_id: str, call_id: str, name: str, parser: PartialJSONParser) -> None:
+        self.item_id = item_id
+        self.call_id = call_id
+        self.name = name
+        self.parser = parser
+
+    @property
+    def arguments(self) -> Any:
+        """The partially parsed arguments."""
+        return self.parser.value
+
+
+class FunctionArgumentsTracker:
+    """Attach a :class:`PartialJSONParser` to each function call item of a stream.
+
+    Feed every streaming event; ``on_key(call, path, value)`` is called as argument
+    values complete. Calls are released on ``response.output_item.done``.
+    """
+
+    def __init__(self, on_key: Callable[[PartialFunctionCall, JSONPath, Any], None] | None = None) -> None:
+        self.on_key = on_key
+        self._calls: dict[str, PartialFunctionCall] = {}
+
+    def get(self, item_id: str) -> PartialFunctionCall | None:
+        """Return the function call being streamed under ``item_id``."""
+        return self._calls.get(item_id)
+
+    def feed(self, event: StreamingEvent) -> PartialFunctionCall | None:
+        """Apply ``event`` and return the function call it concerns, if any."""
+        if isinstance(event, ResponseFunctionCallArgumentsDeltaStreamingEvent):
+            call = self._calls.get(event.item_id)
+            if call is not None:
+                call.parser.feed(event.delta)
+            return call
+        if isinstance(event, ResponseFunctionCallArgumentsDoneStreamingEvent):
+            call = self._calls.get(event.item_id)
+            if call is not None:
+                call.parser.close()
+            return call
+        if isinstance(event, ResponseOutputItemAddedStreamingEvent) and isinstance(event.item, FunctionCall):
+            item = event.item
+            call = PartialFunctionCall(item.id, item.call_id, item.name, PartialJSONParser())
+            if self.on_key is not None:
+                on_key = self.on_key
+                call.parser.on_key = lambda path, value: on_key(call, path, value)
+            if item.arguments:
+                call.parser.feed(item.arguments)
+            self._calls[item.id] = call
+            return call
+        if isinstance(event, ResponseOutputItemDoneStreamingEvent) and isinstance(event.item, FunctionCall):
+            return self._calls.pop(event.item.id, None)
+        return None
@@ -0,0 +1,270 @@
+"""Read a few fields from raw JSON without validating the whole model.
+
+Routers and proxies often only need ``model``, ``stream`` or
+``previous_response_id`` of a ``CreateResponseBody``, or ``response.usage`` of a
+``response.completed`` event. :func:`peek` scans the JSON bytes, descends only
+into the objects and arrays on a requested path, skips every other value without
+decoding it and stops as soon as all requested paths have been found. Only the
+requested values are decoded, optionally validated against the type of the
+matching field of a generated model. Skipping a large array or object in Python
+is slower than parsing it natively, so when a skipped value turns out to be large
+the whole document is parsed with ``pydantic_core.from_json`` instead::
+
+    peek(body, ["model", "stream"], model=CreateResponseBody)
+    peek(data, ["response.usage"], model=ResponseCompletedStreamingEvent)
+
+Skipped values are not checked, so malformed JSON outside the requested paths
+may go unnoticed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import types
+from collections.abc import Iterable
+from typing import Annotated, Any, NoReturn, TypeAlias, Union, get_args, get_origin
+
+import pydantic_core
+from pydantic import BaseModel, RootModel, TypeAdapter
+
+from openresponses_types._cache import LRUCache
+from openresponses_types.partial_json import JSONPath
+
+PathLike: TypeAlias = str | JSONPath
+"""A path as a tuple of keys and indexes, or as a dotted string (``"response.usage"``, ``"input.0.role"``)."""
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]*")
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# Everything up to and including the next bracket outside a string.
+_NEXT_BRACKET = re.compile(rb'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*[{}\[\]]', re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\]\s]+")
+_OPEN = frozenset(b"{[")
+# Brackets skipped in Python before a large value hands the document to the native parser.
+_SKIP_BRACKETS = 16
+
+_ADAPTERS: LRUCache[tuple[type[BaseModel], JSONPath], TypeAdapter[Any]] = LRUCache(256)
+
+
+class _Node:
+    __slots__ = ("children", "paths", "adapter")
+
+    def __init__(self) -> None:
+        self.children: dict[str | int, _Node] = {}
+        self.paths: list[PathLike] = []
+        self.adapter: TypeAdapter[Any] | None = None
+
+
+class _Done(Exception):
+    """Raised to stop scanning once every path has been found."""
+
+
+class _Fallback(Exception):
+    """Raised when a skipped value is large enough that parsing everything natively is faster."""
+
+
+def peek(data: str | bytes, paths: Iterable[PathLike], *, model: type[BaseModel] | None = None) -> dict[PathLike, Any]:
+    """Return the values at ``paths`` in the JSON object ``data``, keyed by the paths as given.
+
+    Paths that are not present are left out. With ``model``, each value is
+    validated against the type of the field it sits in (raising
+    ``pydantic.ValidationError``); otherwise it is returned as decoded JSON.
+    Raises ``ValueError`` if the scanned part of ``data`` is not valid JSON, or if
+    a path does not lead to a field of ``model``.
+    """
+    root = _Node()
+    pending = 0
+    for path in paths:
+        steps = _steps(path)
+        node = root
+        for step in steps:
+            node = node.children.setdefault(step, _Node())
+        if not node.paths:
+            pending += 1
+            if model is not None:
+                node.adapter = _adapter(model, steps)
+        node.paths.append(path)
+
+    scanner = _Scanner(data.encode() if isinstance(data, str) else data, pending)
+    if pending:
+        try:
+            start = scanner.space(0)
+            if scanner.data[start : start + 1] != b"{":
+                scanner.error(start, "expected an object")
+            scanner.container(start, root)
+        except _Done:
+            pass
+        except _Fallback:
+            scanner.collect(pydantic_core.from_json(scanner.data), root)
+    return scanner.found
+
+
+def _steps(path: PathLike) -> JSONPath:
+    if isinstance(path, str):
+        return tuple(int(step) if step.isdigit() else step for step in path.split("."))
+    return tuple(path)
+
+
+def _adapter(model: type[BaseModel], steps: JSONPath) -> TypeAdapter[Any]:
+    """Return a cached adapter for the type of the field at ``steps`` in ``model``."""
+    key = (model, steps)
+    adapter = _ADAPTERS.get(key)
+    if adapter is None:
+        annotation: Any = model
+        for step in steps:
+            annotation = _field_type(annotation, step, model, steps)
+        adapter = TypeAdapter(annotation)
+        _ADAPTERS.put(key, adapter)
+    return adapter
+
+
+def _field_type(annotation: Any, step: str | int, model: type[BaseModel], steps: JSONPath) -> Any:
+    """Return the type of ``step`` in a value of type ``annotation``; a union if members disagree."""
+    candidates: list[Any] = []
+    for member in _members(annotation):
+        if isinstance(step, int):
+            if get_origin(member) is list:
+                candidates.append(get_args(member)[0])
+        elif isinstance(member, type) and issubclass(member, BaseModel):
+            for name, field in member.model_fields.items():
+                if (field.alias or name) == step:
+                    candidates.append(
+                        Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+                    )
+    if not candidates:
+        raise ValueError(f"{model.__name__} has no field at path {steps!r}")
+    unique = list(dict.fromkeys(candidates))
+    return unique[0] if len(unique) == 1 else Union[tuple(unique)]  # noqa: UP007
+
+
+def _members(annotation: Any) -> list[Any]:
+    """Flatten ``Annotated``, unions and root models into the candidate types of a value."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _members(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        return [member for arg in get_args(annotation) for member in _members(arg)]
+    if isinstance(annotation, type) and issubclass(annotation, RootModel):
+        return [annotation, *_members(annotation.model_fields["root"].annotation)]
+    return [annotation]
+
+
+class _Scanner:
+    __slots__ = ("data", "pending", "found")
+
+    def __init__(self, data: bytes, pending: int) -> None:
+        self.data = data
+        self.pending = pending
+        self.found: dict[PathLike, Any] = {}
+
+    def space(self, pos: int) -> int:
+        match = _WHITESPACE.match(self.data, pos)
+        assert match is not None
+        return match.end()
+
+    def error(self, pos: int, message: str) -> NoReturn:
+        raise ValueError(f"Invalid JSON at byte {pos}: {message}")
+
+    def container(self, pos: int, node: _Node) -> int:
+        """Scan the object or array at ``pos`` for the children of ``node``; return the end position."""
+        data = self.data
+        is_object = data[pos] == ord("{")
+        close = ord("}") if is_object else ord("]")
+        index = 0
+        pos = self.space(pos + 1)
+        if pos < len(data) and data[pos] == close:
+            return pos + 1
+        while True:
+            if is_object:
+                if data[pos : pos + 1] != b'"':
+                    self.error(pos, "expected a key")
+                end = self.string(pos)
+                raw = data[pos + 1 : end - 1]
+                key: str | int = json.loads(data[pos:end]) if b"\\" in raw else raw.decode()
+                pos = self.space(end)
+                if data[pos : pos + 1] != b":":
+                    self.error(pos, "expected ':'")
+                pos = self.space(pos + 1)
+            else:
+                key = index
+                index += 1
+            child = node.children.get(key)
+            if child is None:
+                pos = self.skip(pos)
+            else:
+                start = pos
+                nested = child.children and data[pos : pos + 1] in (b"{", b"[")
+                pos = self.container(pos, child) if nested else self.skip(pos)
+                if child.paths:
+                    self.record(child, data[start:pos])
+            pos = self.space(pos)
+            if pos >= len(data):
+                self.error(pos, "unexpected end of data")
+            if data[pos] == close:
+                return pos + 1
+            if data[pos] != ord(","):
+                self.error(pos, "expected ',' or a closing bracket")
+            pos = self.space(pos + 1)
+
+    def record(self, node: _Node, raw: bytes) -> None:
+        if node.adapter is not None:
+            value = node.adapter.validate_json(raw)
+        else:
+            try:
+                value = pydantic_core.from_json(raw)
+            except ValueError as exc:
+                raise ValueError(f"Invalid JSON value at {node.paths[0]!r}: {exc}") from exc
+        self.store(node, value)
+        if not self.pending:
+            raise _Done
+
+    def collect(self, value: Any, node: _Node) -> None:
+        """Store the values of the paths below ``node`` not found yet from the decoded ``value``."""
+        for key, child in node.children.items():
+            if isinstance(value, dict):
+                if key not in value:
+                    continue
+                item = value[key]
+            elif isinstance(value, list) and isinstance(key, int) and key < len(value):
+                item = value[key]
+            else:
+                continue
+            if child.paths and child.paths[0] not in self.found:
+                self.store(child, item if child.adapter is None else child.adapter.validate_python(item))
+            self.collect(item, child)
+
+    def store(self, node: _Node, value: Any) -> None:
+        for path in node.paths:
+            self.found[path] = value
+        self.pending -= 1
+
+    def string(self, pos: int) -> int:
+        """Return the position after the string starting at ``pos``."""
+        match = _STRING_TAIL.match(self.data, pos + 1)
+        if match is None:
+            self.error(pos, "unterminated string")
+        return match.end()
+
+    def skip(self, pos: int) -> int:
+        """Return the position after the value starting at ``pos``, without decoding it."""
+        data = self.data
+        if pos >= len(data):
+            self.error(pos, "expected a value")
+        first = data[pos]
+        if first == ord('"'):
+            return self.string(pos)
+        if first not in _OPEN:
+            match = _SCALAR.match(data, pos)
+            if match is None:
+                self.error(pos, "expected a value")
+            return match.end()
+        depth = 0
+        for _ in range(_SKIP_BRACKETS):
+            match = _NEXT_BRACKET.match(data, pos)
+            if match is None:
+                self.error(pos, "unexpected end of data")
+            pos = match.end()
+            depth += 1 if data[pos - 1] in _OPEN else -1
+            if not depth:
+                return pos
+        raise _Fallback
@@ -0,0 +1,188 @@
+"""Cheap rejection of invalid payloads.
+
+When most of the traffic reaching a validator is malformed (probes, clients on an
+old schema, fuzzers), the cost of ``model_validate_json`` is dominated by error
+collection rather than parsing: pydantic tries every member of a union, keeps the
+errors of each one and reports every failing item of a list, so a single bad
+``input`` item can produce hundreds of errors. :func:`validate_or_reject`
+validates with a variant of the model's schema that reports a plain union as one
+``union_mismatch`` error and stops a list or dict at its first invalid item, and
+returns a compact :class:`Rejection` instead of raising::
+
+    result = validate_or_reject(body, CreateResponseBody)
+    if isinstance(result, Rejection):
+        return reject(400, result.code, result.path)
+
+Valid input produces the same model instances as ``model_validate_json``. The
+rejection points at the union or list item that failed rather than at the deepest
+mismatch inside it. Unions with a list member (such as ``input``, a string or a
+list of items) are not collapsed, so that a bad item keeps its index in the path.
+
+``fail_fast`` needs pydantic-core 2.20 (pydantic 2.8); with older versions lists
+and dicts are validated in full, which is slower but reports the same first error.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, NamedTuple, TypeVar
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import SchemaError, SchemaValidator, core_schema
+
+from openresponses_types._cache import LRUCache
+from openresponses_types.partial_json import JSONPath
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_FAIL_FAST = frozenset({"list", "dict", "set", "frozenset", "tuple"})
+# Schema keys holding plain data (which may look like a schema) rather than schemas.
+_DATA = frozenset({"default", "metadata", "expected", "config"})
+# Schemas wrapping the schema that decides which JSON type a value has.
+_WRAPPERS = frozenset({"nullable", "default", "function-after", "function-before"})
+# The label of the members of the unions that are not collapsed, removed from error paths.
+_MEMBER = "\x00member"
+
+_VALIDATORS: LRUCache[type[BaseModel], SchemaValidator] = LRUCache(64)
+
+
+class Rejection(NamedTuple):
+    """The first validation error of a rejected payload."""
+
+    code: str
+    """The pydantic error type, e.g. ``missing``, ``string_type`` or ``union_mismatch``."""
+    path: JSONPath
+    """Keys and indexes leading to the invalid value; empty for the payload itself."""
+    field: str | None
+    """The last key in ``path``, or ``None`` if there is none."""
+
+
+def validate_or_reject(data: Any, model: type[ModelT]) -> ModelT | Rejection:
+    """Validate ``data`` as ``model``, returning a :class:`Rejection` if it is invalid.
+
+    ``str`` and ``bytes`` are parsed as JSON (invalid JSON is rejected with code
+    ``json_invalid``); any other value is validated as a Python object.
+    """
+    validator = _validator(model)
+    try:
+        if isinstance(data, str | bytes):
+            result: ModelT = validator.validate_json(data)
+        else:
+            result = validator.validate_python(data)
+    except ValidationError as exc:
+        code, path = _first_error(exc.errors(include_url=False, include_context=False, include_input=False))
+        field = next((step for step in reversed(path) if isinstance(step, str)), None)
+        return Rejection(code, path, field)
+    return result
+
+
+def _first_error(errors: list[Any]) -> tuple[str, JSONPath]:
+    """Return the code and path of the first error, looking into uncollapsed unions.
+
+    Of the errors of one such union, the first that is not a plain type mismatch of
+    a member is reported (the list member's error for a list, say); if every member
+    mismatches, the union is reported as ``union_mismatch``.
+    """
+    error = errors[0]
+    path = tuple(error["loc"])
+    start = 0
+    while _MEMBER in path[start:]:
+        start = path.index(_MEMBER, start) + 1
+        group = [other for other in errors if tuple(other["loc"][:start]) == path[:start]]
+        errors = [other for other in group if len(other["loc"]) > start or not other["type"].endswith("_type")]
+        if not errors:
+            return "union_mismatch", _strip(path[: start - 1])
+        error = errors[0]
+        path = tuple(error["loc"])
+    return error["type"], _strip(path)
+
+
+def _strip(path: JSONPath) -> JSONPath:
+    return tuple(step for step in path if step != _MEMBER)
+
+
+def _validator(model: type[BaseModel]) -> SchemaValidator:
+    validator = _VALIDATORS.get(model)
+    if validator is None:
+        validator = SchemaValidator(_compact(model.__pydantic_core_schema__), model.model_config)  # type: ignore[arg-type]
+        _VALIDATORS.put(model, validator)
+    return validator
+
+
+def _compact(schema: Any) -> Any:
+    """Return a copy of ``schema`` with collapsed union errors and fail-fast containers.
+
+    Model schemas are rebuilt around their field schemas: pydantic-core would
+    otherwise reuse each model's own validator, ignoring the changes below it.
+    """
+    if isinstance(schema, list):
+        return [_compact(item) for item in schema]
+    if not isinstance(schema, dict):
+        return schema
+    schema = {key: value if key in _DATA else _compact(value) for key, value in schema.items()}
+    kind = schema.get("type")
+    if not isinstance(kind, str):  # a mapping of field names, one of which may be "type"
+        return schema
+    if kind == "union" and any(_is_array(choice) for choice in schema["choices"]):
+        schema["choices"] = [
+            (choice[0] if isinstance(choice, tuple) else choice, _MEMBER) for choice in schema["choices"]
+        ]
+    elif kind == "union":
+        schema["custom_error_type"] = "union_mismatch"
+        schema["custom_error_message"] = "Input does not match any member of the union"
+    elif kind in _FAIL_FAST and _HAS_FAIL_FAST:
+        schema["fail_fast"] = True
+    elif kind == "model" and _plain(schema):
+        rebuilt = core_schema.no_info_after_validator_function(_builder(schema), schema["schema"])
+        if "ref" in schema:
+            rebuilt["ref"] = schema["ref"]
+        return rebuilt
+    return schema
+
+
+def _is_array(schema: Any) -> bool:
+    """Return whether a (compacted) union member validates JSON arrays."""
+    schema = schema[0] if isinstance(schema, tuple) else schema
+    kind = schema.get("type")
+    if kind in _WRAPPERS:
+        return _is_array(schema["schema"])
+    return kind in _FAIL_FAST - {"dict"}
+
+
+def _plain(schema: dict[str, Any]) -> bool:
+    """Return whether a model schema can be rebuilt without changing its behaviour."""
+    return not (schema.get("post_init") or schema.get("custom_init") or set(schema.get("config", {})) - {"title"})
+
+
+def _builder(schema: dict[str, Any]) -> Callable[[Any], BaseModel]:
+    cls = schema["cls"]
+    root_model = schema.get("root_model", False)
+
+    def build(value: Any) -> BaseModel:
+        if root_model:
+            fields, extra, fields_set = {"root": value}, None, {"root"}
+        else:
+            fields, extra, fields_set = value
+        instance: BaseModel = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", fields)
+        object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(instance, "__pydantic_extra__", extra)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    return build
+
+
+def _has_fail_fast() -> bool:
+    """Return whether the installed pydantic-core stops containers at their first invalid item."""
+    try:
+        validator = SchemaValidator({"type": "list", "items_schema": {"type": "int"}, "fail_fast": True})
+        validator.validate_python(["a", "b"])
+    except SchemaError:
+        return False
+    except ValidationError as exc:
+        return exc.error_count() == 1
+    return False
+
+
+_HAS_FAIL_FAST = _has_fail_fast()
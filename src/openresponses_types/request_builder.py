@@ -0,0 +1,96 @@
+"""Serialize ``CreateResponseBody`` with cached JSON fragments for repeated prefixes.
+
+In agent loops every turn resends the same ``tools`` and the earlier ``input``
+items. :class:`RequestBuilder` caches the JSON bytes of each tool and input item
+and splices them into the outgoing body, so only items that were not seen on a
+previous turn are serialized.
+
+Regular model instances are cached by identity: the builder assumes an item is
+not mutated after it has been serialized once. Snapshots produced by
+:func:`openresponses_types.frozen.freeze` are cached by content instead.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from pydantic import BaseModel, RootModel
+
+from openresponses_types._cache import CacheInfo, LRUCache
+from openresponses_types.frozen import FrozenModel
+from openresponses_types.types import CreateResponseBody
+
+_SPLICED_FIELDS = ("input", "tools")
+
+
+class RequestBuilder:
+    """Build ``CreateResponseBody`` JSON, reusing the bytes of previously seen items.
+
+    The output is equivalent to ``body.model_dump_json(by_alias=True, exclude_none=...)``
+    except that ``input`` and ``tools`` are emitted last.
+    """
+
+    def __init__(self, maxsize: int = 4096, *, exclude_none: bool = True) -> None:
+        self.exclude_none = exclude_none
+        self._by_identity: LRUCache[int, tuple[weakref.ref[Any], bytes]] = LRUCache(maxsize)
+        self._by_content: LRUCache[FrozenModel[Any], bytes] = LRUCache(maxsize)
+
+    def fragment(self, item: BaseModel | FrozenModel[Any]) -> bytes:
+        """Return the JSON bytes of a single tool or input item, from cache when possible."""
+        if isinstance(item, FrozenModel):
+            cached = self._by_content.get(item)
+            if cached is None:
+                cached = self._dump(item.thaw())
+                self._by_content.put(item, cached)
+            return cached
+
+        if isinstance(item, RootModel) and isinstance(item.root, BaseModel):
+            item = item.root
+        key = id(item)
+        entry = self._by_identity.get(key)
+        if entry is not None and entry[0]() is item:
+            return entry[1]
+        encoded = self._dump(item)
+        self._by_identity.put(key, (weakref.ref(item), encoded))
+        return encoded
+
+    def build(self, body: CreateResponseBody) -> bytes:
+        """Serialize ``body`` to JSON bytes, splicing cached ``input`` and ``tools`` fragments."""
+        head = body.model_dump_json(by_alias=True, exclude_none=self.exclude_none, exclude=set(_SPLICED_FIELDS))
+        members = [head[1:-1].encode()] if len(head) > 2 else []
+        for name in _SPLICED_FIELDS:
+            value = getattr(body, name)
+            if value is None:
+                if self.exclude_none:
+                    continue
+                encoded = b"null"
+            elif isinstance(value, list):
+                encoded = b"[" + b",".join([self.fragment(item) for item in value]) + b"]"
+            else:
+                encoded = self._dump(value)
+            members.append(b'"' + name.encode() + b'":' + encoded)
+        return b"{" + b",".join(members) + b"}"
+
+    def cache_info(self) -> CacheInfo:
+        """Return the combined statistics of the fragment caches (by identity and by content).
+
+        ``maxsize`` and ``currsize`` are the sums over both caches, each holding up to
+        the ``maxsize`` given to the builder.
+        """
+        by_identity = self._by_identity.info()
+        by_content = self._by_content.info()
+        return CacheInfo(
+            by_identity.hits + by_content.hits,
+            by_identity.misses + by_content.misses,
+            by_identity.maxsize + by_content.maxsize,
+            by_identity.currsize + by_content.currsize,
+        )
+
+    def clear(self) -> None:
+        """Drop all cached fragments."""
+        self._by_identity.clear()
+        self._by_content.clear()
+
+    def _dump(self, model: BaseModel) -> bytes:
+        return model.model_dump_json(by_alias=True, exclude_none=self.exclude_none).encode()
@@ -0,0 +1,101 @@
+"""Prebuilt JSON Schemas of the generated models.
+
+``model_json_schema()`` walks the whole model graph on every call, and each new
+worker process pays that cost again, which adds up for ``CreateResponseBody``,
+``ResponseResource`` and the streaming events. ``scripts/generate_types.py``
+writes the schema of every public model in :mod:`openresponses_types.types` to
+the package data directory ``_json_schemas`` (one compact JSON file per model,
+next to the ``__spec_hash__`` and the pydantic minor version they were built
+with). :func:`json_schema_bytes` reads a file on first use and keeps the bytes,
+ready to be served as is; :func:`json_schema` returns them decoded::
+
+    body = json_schema_bytes(CreateResponseBody)  # e.g. for an HTTP response
+    schema = json_schema("ResponseResource")
+
+If the files were built from a different spec than the installed models or with a
+different pydantic minor version (whose JSON Schema output may differ; patch
+releases do not change it), or are missing, the schemas are generated with
+``model_json_schema()`` instead.
+"""
+
+from __future__ import annotations
+
+import json
+from importlib import resources
+from typing import Any
+
+import pydantic
+from pydantic import BaseModel
+
+from openresponses_types import __spec_hash__, types
+from openresponses_types._cache import LRUCache
+
+_DIRECTORY = resources.files("openresponses_types") / "_json_schemas"
+_HASH_FILE = "spec.sha256"
+_PYDANTIC_FILE = "pydantic.version"
+
+_SCHEMAS: LRUCache[str, bytes] = LRUCache(256)
+_fresh: bool | None = None
+
+
+def public_models() -> dict[str, type[BaseModel]]:
+    """Return the models defined in :mod:`openresponses_types.types`, by name, in definition order."""
+    return {
+        name: value
+        for name, value in vars(types).items()
+        if isinstance(value, type)
+        and issubclass(value, BaseModel)
+        and value.__module__ == types.__name__
+        and not name.startswith("_")
+    }
+
+
+def json_schema_bytes(model: type[BaseModel] | str) -> bytes:
+    """Return the JSON Schema of a public model (or model name) as compact JSON bytes.
+
+    The result equals ``model_json_schema()`` of the model. Raises ``KeyError``
+    for a name or class that is not a public model of
+    :mod:`openresponses_types.types`.
+    """
+    name = model if isinstance(model, str) else model.__name__
+    data = _SCHEMAS.get(name)
+    if data is None:
+        cls = public_models()[name]
+        if not isinstance(model, str) and model is not cls:
+            raise KeyError(name)
+        data = _read(name) if _artifacts_fresh() else None
+        if data is None:
+            data = json.dumps(cls.model_json_schema(), separators=(",", ":")).encode()
+        _SCHEMAS.put(name, data)
+    return data
+
+
+def json_schema(model: type[BaseModel] | str) -> dict[str, Any]:
+    """Return the JSON Schema of a public model (or model name) as a new ``dict``."""
+    schema: dict[str, Any] = json.loads(json_schema_bytes(model))
+    return schema
+
+
+def schema_version() -> str:
+    """Return the part of the installed pydantic version that the JSON Schema output depends on, e.g. ``2.14``."""
+    return ".".join(pydantic.VERSION.split(".")[:2])
+
+
+def _read(name: str) -> bytes | None:
+    try:
+        return (_DIRECTORY / f"{name}.json").read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _artifacts_fresh() -> bool:
+    """Return whether the prebuilt files were generated from the installed spec and pydantic minor version."""
+    global _fresh
+    if _fresh is None:
+        try:
+            _fresh = (_DIRECTORY / _HASH_FILE).read_text().strip() == __spec_hash__ and (
+                _DIRECTORY / _PYDANTIC_FILE
+            ).read_text().strip() == schema_version()
+        except FileNotFoundError:
+            _fresh = False
+    return _fresh
@@ -0,0 +1,1386 @@
+"""Auto-generated strict-mode Pydantic models from OpenResponses OpenAPI specification.
+
+DO NOT EDIT THIS FILE MANUALLY.
+
+Every model of ``openresponses_types.types`` with ``strict=True``: no coercions
+(``"3"`` is not an ``int``), so validation of exact JSON is cheaper and stricter.
+Enum classes are shared with ``openresponses_types.types``; in Python (not JSON)
+input, enum-valued fields require enum members. ``to_strict()`` and ``to_lax()``
+convert between the two namespaces without revalidating.
+
+This file is generated by: scripts/generate_types.py
+Source: https://raw.githubusercontent.com/openresponses/openresponses/main/public/openapi/openapi.json
+Spec Version: 2.3.0
+Spec Hash: 915047617fddd639c691fe1e00d5ba6917b7187d7abc62adf074fd7c823bad7f
+
+To regenerate:
+    uv run python scripts/generate_types.py --force
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any, Literal
+
+from pydantic import BaseModel, Field, RootModel
+
+from openresponses_types import types as _lax
+from openresponses_types.types import (
+    FunctionCallOutputStatusEnum,
+    FunctionCallStatus,
+    ImageDetail,
+    IncludeEnum,
+    MessageRole,
+    MessageStatus,
+    Object,
+    ReasoningEffortEnum,
+    ReasoningSummaryEnum,
+    Role,
+    Role1,
+    Role2,
+    Role3,
+    ServiceTierEnum,
+    ToolChoice3,
+    ToolChoiceValueEnum,
+    TruncationEnum,
+    Type1,
+    Type9,
+    Type15,
+    Type17,
+    Type19,
+    Type31,
+    Type33,
+    Type34,
+    Type35,
+    Type36,
+    Type37,
+    Type38,
+    Type39,
+    Type40,
+    Type41,
+    Type42,
+    Type43,
+    Type44,
+    Type45,
+    Type46,
+    Type47,
+    Type48,
+    Type49,
+    Type50,
+    Type51,
+    Type52,
+    Type53,
+    Type54,
+    Type55,
+    Type56,
+    Type57,
+    Type58,
+    Type59,
+    Type60,
+    Type62,
+    VerbosityEnum,
+)
+
+
+class ItemReferenceParam(BaseModel, strict=True):
+    type: Literal["item_reference"] | None
+    id: Annotated[str, Field(description="The ID of the item to reference.")]
+
+
+class ReasoningSummaryContentParam(BaseModel, strict=True):
+    type: Annotated[Type1, Field(description="The content type. Always `summary_text`.")]
+    text: Annotated[str, Field(description="The reasoning summary text.", max_length=10485760)]
+
+
+class ReasoningItemParam(BaseModel, strict=True):
+    id: str | None = None
+    type: Annotated[Literal["reasoning"], Field(description="The item type. Always `reasoning`.")]
+    summary: Annotated[
+        list[ReasoningSummaryContentParam],
+        Field(description="Reasoning summary content associated with this item."),
+    ]
+    content: None = None
+    encrypted_content: str | None = None
+
+
+class InputTextContentParam(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_text"],
+        Field(description="The type of the input item. Always `input_text`."),
+    ]
+    text: Annotated[str, Field(description="The text input to the model.", max_length=10485760)]
+
+
+class ImageUrl(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="The URL of the image to be sent to the model. A fully qualified URL or base64 encoded image in a data URL.",
+            max_length=20971520,
+        ),
+    ]
+
+
+class FileData(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="The base64-encoded data of the file to be sent to the model.",
+            max_length=33554432,
+        ),
+    ]
+
+
+class InputFileContentParam(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_file"],
+        Field(description="The type of the input item. Always `input_file`."),
+    ]
+    filename: str | None = None
+    file_data: FileData | None = None
+    file_url: str | None = None
+
+
+class Content1(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(description="The message content, as a single string.", max_length=10485760),
+    ]
+
+
+class Content2(RootModel[InputTextContentParam], strict=True):
+    root: InputTextContentParam
+
+
+class Content3(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(description="The message content, as a single string.", max_length=10485760),
+    ]
+
+
+class SystemMessageItemParam(BaseModel, strict=True):
+    id: str | None = None
+    type: Annotated[Literal["message"], Field(description="The item type. Always `message`.")]
+    role: Annotated[Role1, Field(description="The message role. Always `system`.")]
+    content: Annotated[
+        list[Content2] | Content3,
+        Field(description="The message content, as an array of content parts."),
+    ]
+    status: str | None = None
+
+
+class Content4(RootModel[InputTextContentParam], strict=True):
+    root: InputTextContentParam
+
+
+class Content5(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(description="The message content, as a single string.", max_length=10485760),
+    ]
+
+
+class DeveloperMessageItemParam(BaseModel, strict=True):
+    id: str | None = None
+    type: Annotated[Literal["message"], Field(description="The item type. Always `message`.")]
+    role: Annotated[Role2, Field(description="The message role. Always `developer`.")]
+    content: Annotated[
+        list[Content4] | Content5,
+        Field(description="The message content, as an array of content parts."),
+    ]
+    status: str | None = None
+
+
+class UrlCitationParam(BaseModel, strict=True):
+    type: Annotated[Type9, Field(description="The citation type. Always `url_citation`.")]
+    start_index: Annotated[
+        int,
+        Field(
+            description="The index of the first character of the citation in the message.",
+            ge=0,
+        ),
+    ]
+    end_index: Annotated[
+        int,
+        Field(
+            description="The index of the last character of the citation in the message.",
+            ge=0,
+        ),
+    ]
+    url: Annotated[str, Field(description="The URL of the cited resource.")]
+    title: Annotated[str, Field(description="The title of the cited resource.")]
+
+
+class OutputTextContentParam(BaseModel, strict=True):
+    type: Annotated[
+        Literal["output_text"],
+        Field(description="The content type. Always `output_text`."),
+    ]
+    text: Annotated[str, Field(description="The text content.", max_length=10485760)]
+    annotations: Annotated[
+        list[UrlCitationParam] | None,
+        Field(description="Citations associated with the text content."),
+    ] = None
+
+
+class RefusalContentParam(BaseModel, strict=True):
+    type: Annotated[Literal["refusal"], Field(description="The content type. Always `refusal`.")]
+    refusal: Annotated[str, Field(description="The refusal text.", max_length=10485760)]
+
+
+class Content7(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(description="The message content, as a single string.", max_length=10485760),
+    ]
+
+
+class AssistantMessageItemParam(BaseModel, strict=True):
+    id: str | None = None
+    type: Annotated[Literal["message"], Field(description="The item type. Always `message`.")]
+    role: Annotated[Role3, Field(description="The role of the message author. Always `assistant`.")]
+    content: Annotated[
+        list[
+            Annotated[
+                OutputTextContentParam | RefusalContentParam,
+                Field(),
+            ]
+        ]
+        | Content7,
+        Field(description="The message content, as an array of content parts."),
+    ]
+    status: str | None = None
+
+
+class Output(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="A JSON string of the output of the function tool call.",
+            max_length=10485760,
+        ),
+    ]
+
+
+class EmptyModelParam(BaseModel, strict=True):
+    pass
+
+
+class FunctionToolParam(BaseModel, strict=True):
+    name: Annotated[str, Field(max_length=64, min_length=1, pattern="^[a-zA-Z0-9_-]+$")]
+    description: str | None = None
+    parameters: EmptyModelParam | None = None
+    strict: bool | None = None
+    type: Type15
+
+
+class ResponsesToolParam(RootModel[FunctionToolParam], strict=True):
+    root: FunctionToolParam
+
+
+class SpecificFunctionParam(BaseModel, strict=True):
+    type: Annotated[Type15, Field(description="The tool to call. Always `function`.")]
+    name: Annotated[str, Field(description="The name of the function tool to call.")]
+
+
+class SpecificToolChoiceParam(RootModel[SpecificFunctionParam], strict=True):
+    root: SpecificFunctionParam
+
+
+class AllowedToolsParam(BaseModel, strict=True):
+    type: Annotated[Type17, Field(description="The tool choice type. Always `allowed_tools`.")]
+    tools: Annotated[
+        list[SpecificToolChoiceParam],
+        Field(
+            description="The list of tools that are permitted for this request.",
+            max_length=128,
+            min_length=1,
+        ),
+    ]
+    mode: ToolChoiceValueEnum | None = None
+
+
+class ToolChoiceParam(RootModel[SpecificToolChoiceParam | ToolChoiceValueEnum | AllowedToolsParam], strict=True):
+    root: Annotated[
+        SpecificToolChoiceParam | ToolChoiceValueEnum | AllowedToolsParam,
+        Field(description="Controls which tool the model should use, if any."),
+    ]
+
+
+class MetadataParam(RootModel[dict[str, str]], strict=True):
+    root: Annotated[dict[str, str], Field(max_length=512)]
+
+
+class StreamOptionsParam(BaseModel, strict=True):
+    include_obfuscation: Annotated[
+        bool | None,
+        Field(description="Whether to obfuscate sensitive information in streamed output. Defaults to `true`."),
+    ] = None
+
+
+class ReasoningParam(BaseModel, strict=True):
+    effort: ReasoningEffortEnum | None = None
+    summary: ReasoningSummaryEnum | None = None
+
+
+class Input(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="Context to provide to the model for the scope of this request. May either be a string or an array of input items. If a string is provided, it is interpreted as a user message.",
+            max_length=10485760,
+        ),
+    ]
+
+
+class ToolChoice1(BaseModel, strict=True):
+    pass
+
+
+class ToolChoice2(ToolChoice1, strict=True):
+    pass
+
+
+class ToolChoice4(AllowedToolsParam, ToolChoice1, strict=True):
+    pass
+
+
+class MaxOutputTokens(RootModel[int], strict=True):
+    root: Annotated[
+        int,
+        Field(
+            description="The maximum number of tokens the model may generate for this response.",
+            ge=16,
+        ),
+    ]
+
+
+class MaxToolCalls(RootModel[int], strict=True):
+    root: Annotated[
+        int,
+        Field(
+            description="The maximum number of tool calls the model may make while generating the response.",
+            ge=1,
+        ),
+    ]
+
+
+class SafetyIdentifier(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="A stable identifier used for safety monitoring and abuse detection.",
+            max_length=64,
+        ),
+    ]
+
+
+class PromptCacheKey(RootModel[str], strict=True):
+    root: Annotated[
+        str,
+        Field(
+            description="A key to use when reading from or writing to the prompt cache.",
+            max_length=64,
+        ),
+    ]
+
+
+class TopLogprobs(RootModel[int], strict=True):
+    root: Annotated[
+        int,
+        Field(
+            description="The number of most likely tokens to return at each position, along with their log probabilities.",
+            ge=0,
+            le=20,
+        ),
+    ]
+
+
+class IncompleteDetails(BaseModel, strict=True):
+    reason: Annotated[str, Field(description="The reason the response could not be completed.")]
+
+
+class InputTextContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_text"],
+        Field(description="The type of the input item. Always `input_text`."),
+    ]
+    text: Annotated[str, Field(description="The text input to the model.")]
+
+
+class UrlCitationBody(BaseModel, strict=True):
+    type: Annotated[
+        Type19,
+        Field(description="The type of the URL citation. Always `url_citation`."),
+    ]
+    url: Annotated[str, Field(description="The URL of the web resource.")]
+    start_index: Annotated[
+        int,
+        Field(description="The index of the first character of the URL citation in the message."),
+    ]
+    end_index: Annotated[
+        int,
+        Field(description="The index of the last character of the URL citation in the message."),
+    ]
+    title: Annotated[str, Field(description="The title of the web resource.")]
+
+
+class Annotation(RootModel[UrlCitationBody], strict=True):
+    root: Annotated[
+        UrlCitationBody,
+        Field(
+            description="An annotation that applies to a span of output text.",
+        ),
+    ]
+
+
+class TopLogProb(BaseModel, strict=True):
+    token: str
+    logprob: float
+    bytes: list[int]
+
+
+class LogProb(BaseModel, strict=True):
+    token: str
+    logprob: float
+    bytes: list[int]
+    top_logprobs: list[TopLogProb]
+
+
+class OutputTextContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["output_text"],
+        Field(description="The type of the output text. Always `output_text`."),
+    ]
+    text: Annotated[str, Field(description="The text output from the model.")]
+    annotations: Annotated[list[Annotation], Field(description="The annotations of the text output.")]
+    logprobs: list[LogProb]
+
+
+class TextContent(BaseModel, strict=True):
+    type: Literal["text"]
+    text: str
+
+
+class SummaryTextContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["summary_text"],
+        Field(description="The type of the object. Always `summary_text`."),
+    ]
+    text: Annotated[
+        str,
+        Field(description="A summary of the reasoning output from the model so far."),
+    ]
+
+
+class ReasoningTextContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["reasoning_text"],
+        Field(description="The type of the reasoning text. Always `reasoning_text`."),
+    ]
+    text: Annotated[str, Field(description="The reasoning text from the model.")]
+
+
+class RefusalContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["refusal"],
+        Field(description="The type of the refusal. Always `refusal`."),
+    ]
+    refusal: Annotated[str, Field(description="The refusal explanation from the model.")]
+
+
+class InputImageContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_image"],
+        Field(description="The type of the input item. Always `input_image`."),
+    ]
+    image_url: str | None
+    detail: ImageDetail
+
+
+class InputFileContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_file"],
+        Field(description="The type of the input item. Always `input_file`."),
+    ]
+    filename: Annotated[str | None, Field(description="The name of the file to be sent to the model.")] = None
+    file_url: Annotated[str | None, Field(description="The URL of the file to be sent to the model.")] = None
+
+
+class FunctionCall(BaseModel, strict=True):
+    type: Annotated[
+        Literal["function_call"],
+        Field(description="The type of the item. Always `function_call`."),
+    ]
+    id: Annotated[str, Field(description="The unique ID of the function call item.")]
+    call_id: Annotated[
+        str,
+        Field(description="The unique ID of the function tool call that was generated."),
+    ]
+    name: Annotated[str, Field(description="The name of the function that was called.")]
+    arguments: Annotated[str, Field(description="The arguments JSON string that was generated.")]
+    status: FunctionCallStatus
+
+
+class FunctionCallOutput(BaseModel, strict=True):
+    type: Annotated[
+        Literal["function_call_output"],
+        Field(description="The type of the function tool call output. Always `function_call_output`."),
+    ]
+    id: Annotated[
+        str,
+        Field(
+            description="The unique ID of the function tool call output. Populated when this item is returned via API."
+        ),
+    ]
+    call_id: Annotated[
+        str,
+        Field(description="The unique ID of the function tool call generated by the model."),
+    ]
+    output: (
+        str
+        | list[
+            Annotated[
+                InputTextContent | InputImageContent | InputFileContent,
+                Field(),
+            ]
+        ]
+    )
+    status: FunctionCallOutputStatusEnum
+
+
+class ReasoningBody(BaseModel, strict=True):
+    type: Annotated[
+        Literal["reasoning"],
+        Field(description="The type of the item. Always `reasoning`."),
+    ]
+    id: Annotated[str, Field(description="The unique ID of the reasoning item.")]
+    content: Annotated[
+        list[
+            Annotated[
+                InputTextContent
+                | OutputTextContent
+                | TextContent
+                | SummaryTextContent
+                | ReasoningTextContent
+                | RefusalContent
+                | InputImageContent
+                | InputFileContent,
+                Field(),
+            ]
+        ]
+        | None,
+        Field(description="The reasoning content that was generated."),
+    ] = None
+    summary: Annotated[
+        list[
+            Annotated[
+                InputTextContent
+                | OutputTextContent
+                | TextContent
+                | SummaryTextContent
+                | ReasoningTextContent
+                | RefusalContent
+                | InputImageContent
+                | InputFileContent,
+                Field(),
+            ]
+        ],
+        Field(description="The reasoning summary content that was generated."),
+    ]
+    encrypted_content: Annotated[
+        str | None,
+        Field(description="The encrypted reasoning content that was generated."),
+    ] = None
+
+
+class Error(BaseModel, strict=True):
+    code: Annotated[str, Field(description="A machine-readable error code that was returned.")]
+    message: Annotated[
+        str,
+        Field(description="A human-readable description of the error that was returned."),
+    ]
+
+
+class FunctionTool(BaseModel, strict=True):
+    type: Annotated[Type31, Field(description="The type of the function tool. Always `function`.")]
+    name: Annotated[str, Field(description="The name of the function to call.")]
+    description: str | None
+    parameters: dict[str, Any] | None
+    strict: bool | None
+
+
+class Tool(RootModel[FunctionTool], strict=True):
+    root: Annotated[
+        FunctionTool,
+        Field(
+            description="A tool that can be used to generate a response.",
+        ),
+    ]
+
+
+class FunctionToolChoice(BaseModel, strict=True):
+    type: Type31
+    name: str | None = None
+
+
+class AllowedToolChoice(BaseModel, strict=True):
+    type: Type33
+    tools: list[FunctionToolChoice]
+    mode: ToolChoiceValueEnum
+
+
+class TextResponseFormat(BaseModel, strict=True):
+    type: Type34
+
+
+class JsonObjectResponseFormat(BaseModel, strict=True):
+    type: Type35
+
+
+class JsonSchemaResponseFormat(BaseModel, strict=True):
+    type: Type36
+    name: str
+    description: str | None
+    schema_: Annotated[None, Field(alias="schema")]
+    strict: bool
+
+
+class TextField(BaseModel, strict=True):
+    format: TextResponseFormat | JsonObjectResponseFormat | JsonSchemaResponseFormat
+    verbosity: VerbosityEnum | None = None
+
+
+class Reasoning(BaseModel, strict=True):
+    effort: ReasoningEffortEnum | None
+    summary: ReasoningSummaryEnum | None
+
+
+class InputTokensDetails(BaseModel, strict=True):
+    cached_tokens: Annotated[
+        int,
+        Field(description="The number of input tokens that were served from cache."),
+    ]
+
+
+class OutputTokensDetails(BaseModel, strict=True):
+    reasoning_tokens: Annotated[
+        int,
+        Field(description="The number of output tokens that were attributed to reasoning."),
+    ]
+
+
+class Usage(BaseModel, strict=True):
+    input_tokens: Annotated[
+        int,
+        Field(description="The number of input tokens that were used to generate the response."),
+    ]
+    output_tokens: Annotated[
+        int,
+        Field(description="The number of output tokens that were generated by the model."),
+    ]
+    total_tokens: Annotated[int, Field(description="The total number of tokens that were used.")]
+    input_tokens_details: InputTokensDetails
+    output_tokens_details: OutputTokensDetails
+
+
+class Item1(BaseModel, strict=True):
+    pass
+
+
+class Item3(FunctionCall, Item1, strict=True):
+    pass
+
+
+class Item4(FunctionCallOutput, Item1, strict=True):
+    pass
+
+
+class Item5(ReasoningBody, Item1, strict=True):
+    pass
+
+
+class Item61(BaseModel, strict=True):
+    pass
+
+
+class Item63(FunctionCall, Item61, strict=True):
+    pass
+
+
+class Item64(FunctionCallOutput, Item61, strict=True):
+    pass
+
+
+class Item65(ReasoningBody, Item61, strict=True):
+    pass
+
+
+class ResponseReasoningSummaryPartAddedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type45,
+        Field(description="The type of the event, always `response.reasoning_summary_part.added`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    summary_index: Annotated[int, Field(description="The index of the summary part that was added.")]
+    part: Annotated[
+        InputTextContent
+        | OutputTextContent
+        | TextContent
+        | SummaryTextContent
+        | ReasoningTextContent
+        | RefusalContent
+        | InputImageContent
+        | InputFileContent,
+        Field(
+            description="A content part that makes up an input or output item.",
+        ),
+    ]
+
+
+class ResponseReasoningSummaryPartDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type46,
+        Field(description="The type of the event, always `response.reasoning_summary_part.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    summary_index: Annotated[int, Field(description="The index of the summary part that was completed.")]
+    part: Annotated[
+        InputTextContent
+        | OutputTextContent
+        | TextContent
+        | SummaryTextContent
+        | ReasoningTextContent
+        | RefusalContent
+        | InputImageContent
+        | InputFileContent,
+        Field(
+            description="A content part that makes up an input or output item.",
+        ),
+    ]
+
+
+class ResponseContentPartAddedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type47,
+        Field(description="The type of the event, always `response.content_part.added`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the content part that was added.")]
+    part: Annotated[
+        InputTextContent
+        | OutputTextContent
+        | TextContent
+        | SummaryTextContent
+        | ReasoningTextContent
+        | RefusalContent
+        | InputImageContent
+        | InputFileContent,
+        Field(
+            description="A content part that makes up an input or output item.",
+        ),
+    ]
+
+
+class ResponseContentPartDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type48,
+        Field(description="The type of the event, always `response.content_part.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the content part that was completed.")]
+    part: Annotated[
+        InputTextContent
+        | OutputTextContent
+        | TextContent
+        | SummaryTextContent
+        | ReasoningTextContent
+        | RefusalContent
+        | InputImageContent
+        | InputFileContent,
+        Field(
+            description="A content part that makes up an input or output item.",
+        ),
+    ]
+
+
+class ResponseOutputTextDeltaStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type49,
+        Field(description="The type of the event, always `response.output_text.delta`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the content part that was updated.")]
+    delta: Annotated[str, Field(description="The text delta that was appended.")]
+    logprobs: Annotated[
+        list[LogProb],
+        Field(description="The token log probabilities that were emitted with the delta, if any."),
+    ]
+    obfuscation: Annotated[
+        str | None,
+        Field(description="An obfuscation string that was added to pad the event payload."),
+    ] = None
+
+
+class ResponseOutputTextDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type50,
+        Field(description="The type of the event, always `response.output_text.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the content part that was completed.")]
+    text: Annotated[str, Field(description="The final text that was emitted.")]
+    logprobs: Annotated[
+        list[LogProb],
+        Field(description="The token log probabilities that were emitted with the final text, if any."),
+    ]
+
+
+class ResponseRefusalDeltaStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type51,
+        Field(description="The type of the event, always `response.refusal.delta`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the refusal content that was updated.")]
+    delta: Annotated[str, Field(description="The refusal text delta that was appended.")]
+
+
+class ResponseRefusalDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type52,
+        Field(description="The type of the event, always `response.refusal.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the refusal content that was completed.")]
+    refusal: Annotated[str, Field(description="The final refusal text that was emitted.")]
+
+
+class ResponseReasoningDeltaStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type53,
+        Field(description="The type of the event, always `response.reasoning.delta`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the reasoning content that was updated.")]
+    delta: Annotated[str, Field(description="The reasoning text delta that was appended.")]
+    obfuscation: Annotated[
+        str | None,
+        Field(description="An obfuscation string that was added to pad the event payload."),
+    ] = None
+
+
+class ResponseReasoningDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type54,
+        Field(description="The type of the event, always `response.reasoning.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the reasoning content that was completed.")]
+    text: Annotated[str, Field(description="The final reasoning text that was emitted.")]
+
+
+class ResponseReasoningSummaryDeltaStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type55,
+        Field(description="The type of the event, always `response.reasoning_summary.delta`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    summary_index: Annotated[int, Field(description="The index of the summary content that was updated.")]
+    delta: Annotated[str, Field(description="The summary text delta that was appended.")]
+    obfuscation: Annotated[
+        str | None,
+        Field(description="An obfuscation string that was added to pad the event payload."),
+    ] = None
+
+
+class ResponseReasoningSummaryDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type56,
+        Field(description="The type of the event, always `response.reasoning_summary.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    summary_index: Annotated[int, Field(description="The index of the summary content that was completed.")]
+    text: Annotated[str, Field(description="The final summary text that was emitted.")]
+
+
+class Annotation11(BaseModel, strict=True):
+    pass
+
+
+class Annotation12(UrlCitationBody, Annotation11, strict=True):
+    pass
+
+
+class ResponseOutputTextAnnotationAddedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type57,
+        Field(description="The type of the event, always `response.output_text.annotation.added`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    content_index: Annotated[int, Field(description="The index of the output text content that was updated.")]
+    annotation_index: Annotated[int, Field(description="The index of the annotation that was added.")]
+    annotation: Annotation12 | None
+
+
+class ResponseFunctionCallArgumentsDeltaStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type58,
+        Field(description="The type of the event, always `response.function_call_arguments.delta`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the tool call item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    delta: Annotated[str, Field(description="The arguments delta that was appended.")]
+    obfuscation: Annotated[
+        str | None,
+        Field(description="An obfuscation string that was added to pad the event payload."),
+    ] = None
+
+
+class ResponseFunctionCallArgumentsDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type59,
+        Field(description="The type of the event, always `response.function_call_arguments.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    item_id: Annotated[str, Field(description="The ID of the tool call item that was updated.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was updated.")]
+    arguments: Annotated[str, Field(description="The final arguments string that was emitted.")]
+
+
+class ErrorPayload(BaseModel, strict=True):
+    type: Annotated[str, Field(description="The error type that was emitted.")]
+    code: str | None
+    message: Annotated[str, Field(description="The human-readable error message that was emitted.")]
+    param: str | None
+    headers: Annotated[
+        dict[str, str] | None,
+        Field(description="The response headers that were emitted with the error, if any."),
+    ] = None
+
+
+class ErrorStreamingEvent(BaseModel, strict=True):
+    type: Annotated[Type60, Field(description="The type of the event, always `error`.")]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    error: ErrorPayload
+
+
+class InputVideoContent(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_video"],
+        Field(description="The type of the input content. Always `input_video`."),
+    ]
+    video_url: Annotated[str, Field(description="A base64 or remote url that resolves to a video file.")]
+
+
+class JsonSchemaResponseFormatParam(BaseModel, strict=True):
+    type: Annotated[
+        Type62 | None,
+        Field(description="The type of response format being defined. Always `json_schema`."),
+    ] = None
+    description: Annotated[
+        str | None,
+        Field(
+            description="A description of what the response format is for, used by the model to\ndetermine how to respond in the format.\n"
+        ),
+    ] = None
+    name: Annotated[
+        str | None,
+        Field(
+            description="The name of the response format. Must be a-z, A-Z, 0-9, or contain\nunderscores and dashes, with a maximum length of 64.\n"
+        ),
+    ] = None
+    schema_: Annotated[
+        dict[str, Any] | None,
+        Field(
+            alias="schema",
+            description="The schema for the response format, described as a JSON Schema object.\n",
+            title="JSON schema",
+        ),
+    ] = None
+    strict: bool | None = None
+
+
+class InputImageContentParamAutoParam(BaseModel, strict=True):
+    type: Annotated[
+        Literal["input_image"],
+        Field(description="The type of the input item. Always `input_image`."),
+    ]
+    image_url: ImageUrl | None = None
+    detail: ImageDetail | None = None
+
+
+class UserMessageItemParam(BaseModel, strict=True):
+    id: str | None = None
+    type: Annotated[Literal["message"], Field(description="The item type. Always `message`.")]
+    role: Annotated[Role, Field(description="The message role. Always `user`.")]
+    content: Annotated[
+        list[
+            Annotated[
+                InputTextContentParam | InputImageContentParamAutoParam | InputFileContentParam,
+                Field(),
+            ]
+        ]
+        | Content1,
+        Field(description="The message content, as an array of content parts."),
+    ]
+    status: str | None = None
+
+
+class FunctionCallItemParam(BaseModel, strict=True):
+    id: str | None = None
+    call_id: Annotated[
+        str,
+        Field(
+            description="The unique ID of the function tool call generated by the model.",
+            max_length=64,
+            min_length=1,
+        ),
+    ]
+    type: Annotated[
+        Literal["function_call"],
+        Field(description="The item type. Always `function_call`."),
+    ]
+    name: Annotated[
+        str,
+        Field(
+            description="The name of the function to call.",
+            max_length=64,
+            min_length=1,
+            pattern="^[a-zA-Z0-9_-]+$",
+        ),
+    ]
+    arguments: Annotated[str, Field(description="The function arguments as a JSON string.")]
+    status: FunctionCallStatus | None = None
+
+
+class FunctionCallOutputItemParam(BaseModel, strict=True):
+    id: str | None = None
+    call_id: Annotated[
+        str,
+        Field(
+            description="The unique ID of the function tool call generated by the model.",
+            max_length=64,
+            min_length=1,
+        ),
+    ]
+    type: Annotated[
+        Literal["function_call_output"],
+        Field(description="The type of the function tool call output. Always `function_call_output`."),
+    ]
+    output: Annotated[
+        Output
+        | list[
+            Annotated[
+                InputTextContentParam | InputImageContentParamAutoParam | InputFileContentParam | InputVideoContent,
+                Field(),
+            ]
+        ],
+        Field(description="Text, image, or file output of the function tool call."),
+    ]
+    status: FunctionCallStatus | None = None
+
+
+class TextParam(BaseModel, strict=True):
+    format: Annotated[
+        TextResponseFormat | JsonSchemaResponseFormatParam | None,
+        Field(description="The format configuration for text output."),
+    ] = None
+    verbosity: VerbosityEnum | None = None
+
+
+class CreateResponseBody(BaseModel, strict=True):
+    model: str | None = None
+    input: (
+        Input
+        | list[
+            Annotated[
+                ItemReferenceParam
+                | ReasoningItemParam
+                | UserMessageItemParam
+                | SystemMessageItemParam
+                | DeveloperMessageItemParam
+                | AssistantMessageItemParam
+                | FunctionCallItemParam
+                | FunctionCallOutputItemParam,
+                Field(),
+            ]
+        ]
+        | None
+    ) = None
+    previous_response_id: str | None = None
+    include: list[IncludeEnum] | None = None
+    tools: list[ResponsesToolParam] | None = None
+    tool_choice: ToolChoice2 | ToolChoice3 | ToolChoice4 | None = None
+    metadata: MetadataParam | None = None
+    text: TextParam | None = None
+    temperature: float | None = None
+    top_p: float | None = None
+    presence_penalty: float | None = None
+    frequency_penalty: float | None = None
+    parallel_tool_calls: bool | None = None
+    stream: Annotated[
+        bool | None,
+        Field(description="Whether to stream response events as server-sent events."),
+    ] = None
+    stream_options: StreamOptionsParam | None = None
+    background: Annotated[
+        bool | None,
+        Field(description="Whether to run the request in the background and return immediately."),
+    ] = None
+    max_output_tokens: MaxOutputTokens | None = None
+    max_tool_calls: MaxToolCalls | None = None
+    reasoning: ReasoningParam | None = None
+    safety_identifier: SafetyIdentifier | None = None
+    prompt_cache_key: PromptCacheKey | None = None
+    truncation: TruncationEnum | None = None
+    instructions: str | None = None
+    store: Annotated[
+        bool | None,
+        Field(description="Whether to store the response so it can be retrieved later."),
+    ] = None
+    service_tier: ServiceTierEnum | None = None
+    top_logprobs: TopLogprobs | None = None
+
+
+class Message(BaseModel, strict=True):
+    type: Annotated[
+        Literal["message"],
+        Field(description="The type of the message. Always set to `message`."),
+    ]
+    id: Annotated[str, Field(description="The unique ID of the message.")]
+    status: MessageStatus
+    role: MessageRole
+    content: Annotated[
+        list[
+            Annotated[
+                InputTextContent
+                | OutputTextContent
+                | TextContent
+                | SummaryTextContent
+                | ReasoningTextContent
+                | RefusalContent
+                | InputImageContent
+                | InputFileContent
+                | InputVideoContent,
+                Field(),
+            ]
+        ],
+        Field(description="The content of the message"),
+    ]
+
+
+class ResponseResource(BaseModel, strict=True):
+    id: Annotated[str, Field(description="The unique ID of the response that was created.")]
+    object: Annotated[Object, Field(description="The object type, which was always `response`.")]
+    created_at: Annotated[
+        int,
+        Field(description="The Unix timestamp (in seconds) for when the response was created."),
+    ]
+    completed_at: int | None
+    status: Annotated[str, Field(description="The status that was set for the response.")]
+    incomplete_details: IncompleteDetails | None
+    model: Annotated[str, Field(description="The model that generated this response.")]
+    previous_response_id: str | None
+    instructions: str | None
+    output: Annotated[
+        list[
+            Annotated[
+                Message | FunctionCall | FunctionCallOutput | ReasoningBody,
+                Field(),
+            ]
+        ],
+        Field(description="The output items that were generated by the model."),
+    ]
+    error: Error | None
+    tools: Annotated[
+        list[Tool],
+        Field(description="The tools that were available to the model during response generation."),
+    ]
+    tool_choice: FunctionToolChoice | ToolChoiceValueEnum | AllowedToolChoice
+    truncation: TruncationEnum
+    parallel_tool_calls: Annotated[
+        bool,
+        Field(description="Whether the model was allowed to call multiple tools in parallel."),
+    ]
+    text: TextField
+    top_p: Annotated[
+        float,
+        Field(description="The nucleus sampling parameter that was used for this response."),
+    ]
+    presence_penalty: Annotated[
+        float,
+        Field(
+            description="The presence penalty that was used to penalize new tokens based on whether they appear in the text so far."
+        ),
+    ]
+    frequency_penalty: Annotated[
+        float,
+        Field(
+            description="The frequency penalty that was used to penalize new tokens based on their frequency in the text so far."
+        ),
+    ]
+    top_logprobs: Annotated[
+        int,
+        Field(
+            description="The number of most likely tokens that were returned at each position, along with their log probabilities."
+        ),
+    ]
+    temperature: Annotated[
+        float,
+        Field(description="The sampling temperature that was used for this response."),
+    ]
+    reasoning: Reasoning | None
+    usage: Usage | None
+    max_output_tokens: int | None
+    max_tool_calls: int | None
+    store: Annotated[
+        bool,
+        Field(description="Whether this response was stored so it can be retrieved later."),
+    ]
+    background: Annotated[bool, Field(description="Whether this request was run in the background.")]
+    service_tier: Annotated[str, Field(description="The service tier that was used for this response.")]
+    metadata: Annotated[
+        Any,
+        Field(description="Developer-defined metadata that was associated with the response."),
+    ]
+    safety_identifier: str | None
+    prompt_cache_key: str | None
+
+
+class ResponseCreatedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[Type37, Field(description="The type of the event, always `response.created`.")]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class ResponseQueuedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[Type38, Field(description="The type of the event, always `response.queued`.")]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class ResponseInProgressStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type39,
+        Field(description="The type of the event, always `response.in_progress`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class ResponseCompletedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[Type40, Field(description="The type of the event, always `response.completed`.")]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class ResponseFailedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[Type41, Field(description="The type of the event, always `response.failed`.")]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class ResponseIncompleteStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type42,
+        Field(description="The type of the event, always `response.incomplete`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    response: ResponseResource
+
+
+class Item2(Message, Item1, strict=True):
+    pass
+
+
+class ResponseOutputItemAddedStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type43,
+        Field(description="The type of the event, always `response.output_item.added`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was added.")]
+    item: Item2 | Item3 | Item4 | Item5 | None
+
+
+class Item62(Message, Item61, strict=True):
+    pass
+
+
+class ResponseOutputItemDoneStreamingEvent(BaseModel, strict=True):
+    type: Annotated[
+        Type44,
+        Field(description="The type of the event, always `response.output_item.done`."),
+    ]
+    sequence_number: Annotated[int, Field(description="The sequence number of the event that was emitted.")]
+    output_index: Annotated[int, Field(description="The index of the output item that was completed.")]
+    item: Item62 | Item63 | Item64 | Item65 | None
+
+
+_TO_STRICT: dict[type[BaseModel], type[BaseModel]] = {
+    getattr(_lax, name): model
+    for name, model in list(globals().items())
+    if isinstance(model, type) and issubclass(model, BaseModel) and model.__module__ == __name__
+}
+_TO_LAX = {model: lax for lax, model in _TO_STRICT.items()}
+
+
+def _convert(value: Any, classes: dict[type[BaseModel], type[BaseModel]]) -> Any:
+    target = classes.get(type(value))
+    if target is not None:
+        model = target.__new__(target)
+        fields = {name: _convert(item, classes) for name, item in value.__dict__.items()}
+        object.__setattr__(model, "__dict__", fields)
+        object.__setattr__(model, "__pydantic_fields_set__", set(value.__pydantic_fields_set__))
+        object.__setattr__(model, "__pydantic_extra__", value.__pydantic_extra__)
+        object.__setattr__(model, "__pydantic_private__", value.__pydantic_private__)
+        return model
+    if type(value) is list:
+        return [_convert(item, classes) for item in value]
+    if type(value) is dict:
+        return {key: _convert(item, classes) for key, item in value.items()}
+    return value
+
+
+def to_strict(model: BaseModel) -> BaseModel:
+    """Return the strict-mode counterpart of an ``openresponses_types.types`` model, without revalidating."""
+    if type(model) not in _TO_STRICT:
+        raise TypeError(f"{type(model).__qualname__} is not a model of openresponses_types.types")
+    strict: BaseModel = _convert(model, _TO_STRICT)
+    return strict
+
+
+def to_lax(model: BaseModel) -> BaseModel:
+    """Return the ``openresponses_types.types`` counterpart of a strict-mode model, without revalidating."""
+    if type(model) not in _TO_LAX:
+        raise TypeError(f"{type(model).__qualname__} is not a model of openresponses_types.strict")
+    lax: BaseModel = _convert(model, _TO_LAX)
+    return lax
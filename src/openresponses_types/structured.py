@@ -0,0 +1,339 @@
+"""Streaming validation of structured output against a JSON Schema.
+
+When ``TextParam.format`` is a ``JsonSchemaResponseFormatParam`` the model's
+``output_text`` must follow ``schema_``. :func:`compile_schema` compiles a schema
+once into a :class:`CompiledSchema` and caches it by its canonical JSON text in a
+bounded LRU cache, so repeated requests with the same schema skip compilation.
+:class:`StructuredOutputValidator` feeds ``response.output_text.delta`` text to a
+:class:`~openresponses_types.partial_json.PartialJSONParser` and checks every value
+against its sub-schema as soon as it completes, raising
+:class:`StructuredOutputError` at the first violation so the stream can be aborted.
+
+The keywords of the structured output subset are supported: ``type`` (including
+type lists), ``properties``, ``required``, ``additionalProperties``, ``items``,
+``enum``, ``const``, ``anyOf``/``oneOf``, local ``$ref`` into ``$defs`` or
+``definitions``, numeric and length bounds, ``pattern``, ``minItems`` and
+``maxItems``. Other keywords are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from openresponses_types._cache import CacheInfo, LRUCache
+from openresponses_types.partial_json import JSONPath, PartialJSONParser
+from openresponses_types.streaming import StreamingEvent
+from openresponses_types.types import (
+    CreateResponseBody,
+    JsonSchemaResponseFormatParam,
+    ResponseOutputTextDeltaStreamingEvent,
+    ResponseOutputTextDoneStreamingEvent,
+)
+
+_TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+    "number": lambda value: isinstance(value, int | float) and not isinstance(value, bool),
+    "integer": lambda value: (
+        (isinstance(value, int) and not isinstance(value, bool)) or (isinstance(value, float) and value.is_integer())
+    ),
+}
+
+
+class StructuredOutputError(ValueError):
+    """Output text that is not valid JSON or violates the response format schema."""
+
+    def __init__(self, message: str, path: JSONPath = ()) -> None:
+        location = "".join(f"[{part!r}]" for part in path) or "<root>"
+        super().__init__(f"{location}: {message}")
+        self.path = path
+
+
+class CompiledSchema:
+    """One compiled (sub-)schema node."""
+
+    __slots__ = (
+        "types",
+        "properties",
+        "required",
+        "additional",
+        "items",
+        "enum",
+        "const",
+        "has_const",
+        "any_of",
+        "minimum",
+        "maximum",
+        "exclusive_minimum",
+        "exclusive_maximum",
+        "min_length",
+        "max_length",
+        "pattern",
+        "min_items",
+        "max_items",
+    )
+
+    def __init__(self) -> None:
+        self.types: tuple[str, ...] | None = None
+        self.properties: dict[str, CompiledSchema] = {}
+        self.required: tuple[str, ...] = ()
+        self.additional: CompiledSchema | bool = True
+        self.items: CompiledSchema | None = None
+        self.enum: list[Any] | None = None
+        self.const: Any = None
+        self.has_const = False
+        self.any_of: list[CompiledSchema] | None = None
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+        self.exclusive_minimum: float | None = None
+        self.exclusive_maximum: float | None = None
+        self.min_length: int | None = None
+        self.max_length: int | None = None
+        self.pattern: re.Pattern[str] | None = None
+        self.min_items: int | None = None
+        self.max_items: int | None = None
+
+    def child(self, key: str | int, path: JSONPath) -> CompiledSchema | None:
+        """Return the schema of member ``key``; ``None`` when the node cannot constrain it alone."""
+        if self.any_of is not None:
+            return None
+        if isinstance(key, int):
+            return self.items
+        schema = self.properties.get(key)
+        if schema is not None:
+            return schema
+        if self.additional is False:
+            raise StructuredOutputError(f"unexpected property {key!r}", path)
+        return self.additional if isinstance(self.additional, CompiledSchema) else None
+
+    def validate(self, value: Any, path: JSONPath = ()) -> None:
+        """Validate ``value`` and all of its members."""
+        self.check(value, path)
+        if self.any_of is not None:
+            return
+        if isinstance(value, dict):
+            for key, member in value.items():
+                schema = self.child(key, (*path, key))
+                if schema is not None:
+                    schema.validate(member, (*path, key))
+        elif isinstance(value, list) and self.items is not None:
+            for index, member in enumerate(value):
+                self.items.validate(member, (*path, index))
+
+    def check(self, value: Any, path: JSONPath = ()) -> None:
+        """Validate ``value`` itself, assuming its members were checked as they completed."""
+        if self.any_of is not None:
+            for option in self.any_of:
+                try:
+                    option.validate(value, path)
+                except StructuredOutputError:
+                    continue
+                break
+            else:
+                raise StructuredOutputError("value matches none of the anyOf/oneOf schemas", path)
+        if self.types is not None and not any(_TYPE_CHECKS[name](value) for name in self.types):
+            raise StructuredOutputError(f"expected {' or '.join(self.types)}, got {_json_type(value)}", path)
+        if self.enum is not None and value not in self.enum:
+            raise StructuredOutputError(f"{value!r} is not one of {self.enum!r}", path)
+        if self.has_const and value != self.const:
+            raise StructuredOutputError(f"expected {self.const!r}", path)
+        if isinstance(value, dict):
+            missing = [name for name in self.required if name not in value]
+            if missing:
+                raise StructuredOutputError(f"missing required properties {missing!r}", path)
+        elif isinstance(value, str):
+            if self.min_length is not None and len(value) < self.min_length:
+                raise StructuredOutputError(f"shorter than {self.min_length} characters", path)
+            if self.max_length is not None and len(value) > self.max_length:
+                raise StructuredOutputError(f"longer than {self.max_length} characters", path)
+            if self.pattern is not None and self.pattern.search(value) is None:
+                raise StructuredOutputError(f"does not match pattern {self.pattern.pattern!r}", path)
+        elif isinstance(value, list):
+            if self.min_items is not None and len(value) < self.min_items:
+                raise StructuredOutputError(f"fewer than {self.min_items} items", path)
+            if self.max_items is not None and len(value) > self.max_items:
+                raise StructuredOutputError(f"more than {self.max_items} items", path)
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            self._check_bounds(value, path)
+
+    def _check_bounds(self, value: float, path: JSONPath) -> None:
+        if self.minimum is not None and value < self.minimum:
+            raise StructuredOutputError(f"less than minimum {self.minimum}", path)
+        if self.maximum is not None and value > self.maximum:
+            raise StructuredOutputError(f"greater than maximum {self.maximum}", path)
+        if self.exclusive_minimum is not None and value <= self.exclusive_minimum:
+            raise StructuredOutputError(f"not greater than {self.exclusive_minimum}", path)
+        if self.exclusive_maximum is not None and value >= self.exclusive_maximum:
+            raise StructuredOutputError(f"not less than {self.exclusive_maximum}", path)
+
+
+def _json_type(value: Any) -> str:
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if _TYPE_CHECKS[name](value) and not (name == "integer" and isinstance(value, float)):
+            return name
+    return type(value).__name__
+
+
+class _Compiler:
+    def __init__(self, root: Mapping[str, Any]) -> None:
+        self.root = root
+        self.refs: dict[str, CompiledSchema] = {}
+
+    def compile(self, schema: Mapping[str, Any] | bool) -> CompiledSchema:
+        node = CompiledSchema()
+        if schema is False:
+            node.any_of = []
+            return node
+        if schema is True:
+            return node
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            target = self.refs.get(ref)
+            if target is None:
+                target = self.refs[ref] = CompiledSchema()
+                self._fill(target, self._resolve(ref))
+            return target
+        self._fill(node, schema)
+        return node
+
+    def _resolve(self, ref: str) -> Mapping[str, Any]:
+        if not ref.startswith("#"):
+            raise ValueError(f"Only local $ref values are supported, got {ref!r}")
+        target: Any = self.root
+        for part in ref[1:].split("/")[1:]:
+            target = target[part.replace("~1", "/").replace("~0", "~")]
+        return target  # type: ignore[no-any-return]
+
+    def _fill(self, node: CompiledSchema, schema: Mapping[str, Any]) -> None:
+        types = schema.get("type")
+        if types is not None:
+            node.types = (types,) if isinstance(types, str) else tuple(types)
+            unknown = set(node.types) - _TYPE_CHECKS.keys()
+            if unknown:
+                raise ValueError(f"Unknown JSON Schema types: {sorted(unknown)}")
+        node.properties = {name: self.compile(sub) for name, sub in schema.get("properties", {}).items()}
+        node.required = tuple(schema.get("required", ()))
+        additional = schema.get("additionalProperties", True)
+        node.additional = additional if isinstance(additional, bool) else self.compile(additional)
+        if "items" in schema and isinstance(schema["items"], Mapping | bool):
+            node.items = self.compile(schema["items"])
+        if "enum" in schema:
+            node.enum = list(schema["enum"])
+        if "const" in schema:
+            node.const, node.has_const = schema["const"], True
+        options = schema.get("anyOf", schema.get("oneOf"))
+        if options is not None:
+            node.any_of = [self.compile(option) for option in options]
+        node.minimum = schema.get("minimum")
+        node.maximum = schema.get("maximum")
+        node.exclusive_minimum = schema.get("exclusiveMinimum")
+        node.exclusive_maximum = schema.get("exclusiveMaximum")
+        node.min_length = schema.get("minLength")
+        node.max_length = schema.get("maxLength")
+        if "pattern" in schema:
+            node.pattern = re.compile(schema["pattern"])
+        node.min_items = schema.get("minItems")
+        node.max_items = schema.get("maxItems")
+
+
+_SCHEMAS: LRUCache[str, CompiledSchema] = LRUCache(256)
+
+
+def compile_schema(schema: Mapping[str, Any], *, cache: bool = True) -> CompiledSchema:
+    """Compile ``schema``, reusing the cached result for an identical schema unless ``cache`` is false."""
+    if not cache:
+        return _Compiler(schema).compile(schema)
+    key = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    compiled = _SCHEMAS.get(key)
+    if compiled is None:
+        compiled = _Compiler(schema).compile(schema)
+        _SCHEMAS.put(key, compiled)
+    return compiled
+
+
+def schema_cache_info() -> CacheInfo:
+    """Return hit/miss statistics of the compiled schema cache."""
+    return _SCHEMAS.info()
+
+
+def clear_schema_cache() -> None:
+    """Drop all compiled schemas."""
+    _SCHEMAS.clear()
+
+
+class StructuredOutputValidator:
+    """Validate streamed output text against a JSON Schema as it arrives.
+
+    :meth:`feed` raises :class:`StructuredOutputError` as soon as a completed value
+    violates its sub-schema (or the text stops being JSON); :meth:`close` checks that
+    the document is complete and returns it. :meth:`feed_event` consumes streaming
+    events directly, following the first output text part it sees.
+    """
+
+    def __init__(self, schema: Mapping[str, Any] | JsonSchemaResponseFormatParam) -> None:
+        if isinstance(schema, JsonSchemaResponseFormatParam):
+            if schema.schema_ is None:
+                raise ValueError("Response format has no schema")
+            schema = schema.schema_
+        self.schema = compile_schema(schema)
+        self._parser = PartialJSONParser(on_key=self._on_value)
+        self._part: tuple[str, int] | None = None
+
+    @classmethod
+    def for_request(cls, body: CreateResponseBody) -> StructuredOutputValidator | None:
+        """Return a validator for the request's JSON Schema response format, if it has one."""
+        format_ = body.text.format if body.text is not None else None
+        if isinstance(format_, JsonSchemaResponseFormatParam) and format_.schema_ is not None:
+            return cls(format_)
+        return None
+
+    @property
+    def value(self) -> Any:
+        """The partially parsed output."""
+        return self._parser.value
+
+    def feed(self, text: str) -> None:
+        """Consume the next fragment of output text."""
+        try:
+            self._parser.feed(text)
+        except StructuredOutputError:
+            raise
+        except ValueError as exc:
+            raise StructuredOutputError(f"invalid JSON: {exc}") from exc
+
+    def feed_event(self, event: StreamingEvent) -> None:
+        """Consume an output text delta or done event; other events are ignored."""
+        if not isinstance(event, ResponseOutputTextDeltaStreamingEvent | ResponseOutputTextDoneStreamingEvent):
+            return
+        part = (event.item_id, event.content_index)
+        if self._part is None:
+            self._part = part
+        elif part != self._part:
+            return
+        if isinstance(event, ResponseOutputTextDeltaStreamingEvent):
+            self.feed(event.delta)
+        else:
+            self.close()
+
+    def close(self) -> Any:
+        """Finish validation at the end of the output text and return the parsed value."""
+        try:
+            return self._parser.close()
+        except StructuredOutputError:
+            raise
+        except ValueError as exc:
+            raise StructuredOutputError(f"invalid JSON: {exc}") from exc
+
+    def _on_value(self, path: JSONPath, value: Any) -> None:
+        schema: CompiledSchema | None = self.schema
+        for depth, key in enumerate(path):
+            schema = schema.child(key, path[: depth + 1])  # type: ignore[union-attr]
+            if schema is None:
+                return
+        schema.check(value, path)  # type: ignore[union-attr]
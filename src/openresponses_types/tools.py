@@ -0,0 +1,188 @@
+"""Registry of function tools with compiled, cached argument validators.
+
+:class:`ToolRegistry` holds the tools offered to the model and validates each
+``FunctionCall.arguments`` JSON string against its tool's ``parameters`` schema,
+returning the decoded arguments. Schemas are compiled once (see
+:mod:`openresponses_types.structured`) and kept in an LRU cache keyed by tool name
+and schema content hash, so re-registering the same tools per request costs a hash
+rather than a compilation. :meth:`ToolRegistry.validate_calls` checks all calls of
+a ``parallel_tool_calls`` response in one pass and reports errors per call.
+
+A tool may also be registered with a pydantic ``model``, in which case the
+arguments are validated straight from JSON into an instance of that model.
+
+Note that the generated ``FunctionToolParam`` types ``parameters`` as an empty
+model, so a schema validated into it is dropped; register tools from
+``FunctionTool``, a raw tool dict, or pass ``parameters=`` explicitly. A tool
+without a schema or model is rejected with ``ValueError`` unless registered with
+``allow_unvalidated=True``, in which case any JSON arguments are accepted.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple, TypeAlias
+
+import pydantic_core
+from pydantic import BaseModel, RootModel, ValidationError
+
+from openresponses_types._cache import CacheInfo, LRUCache
+from openresponses_types.partial_json import JSONPath
+from openresponses_types.structured import CompiledSchema, StructuredOutputError, compile_schema
+from openresponses_types.types import (
+    FunctionCall,
+    FunctionCallItemParam,
+    FunctionTool,
+    FunctionToolParam,
+    ResponseResource,
+)
+
+ToolDefinition: TypeAlias = FunctionTool | FunctionToolParam | RootModel[Any] | Mapping[str, Any]
+"""A tool accepted by :meth:`ToolRegistry.register`."""
+
+CallLike: TypeAlias = FunctionCall | FunctionCallItemParam
+"""A function call as returned in output or replayed in input."""
+
+
+class ToolCallError(ValueError):
+    """Function call arguments that do not match the tool (or an unknown tool)."""
+
+    def __init__(self, message: str, *, name: str, call_id: str | None = None, path: JSONPath = ()) -> None:
+        super().__init__(f"{name}: {message}")
+        self.name = name
+        self.call_id = call_id
+        self.path = path
+
+
+class ValidatedCall(NamedTuple):
+    """Result of validating one call in batch mode."""
+
+    call: CallLike
+    arguments: Any
+    error: ToolCallError | None
+
+
+class _Entry(NamedTuple):
+    digest: str
+    schema: Mapping[str, Any] | None
+    model: type[BaseModel] | None
+
+
+class ToolRegistry:
+    """Function tools by name, with lazily compiled argument validators.
+
+    ``maxsize`` bounds the number of compiled schemas kept; evicted schemas are
+    recompiled on their next use. A registry can be shared between threads:
+    validation only reads the tool table and the validator cache is locked.
+    """
+
+    def __init__(
+        self, tools: Iterable[ToolDefinition] = (), *, maxsize: int = 1024, allow_unvalidated: bool = False
+    ) -> None:
+        self._tools: dict[str, _Entry] = {}
+        self._validators: LRUCache[tuple[str, str], CompiledSchema] = LRUCache(maxsize)
+        for tool in tools:
+            self.register(tool, allow_unvalidated=allow_unvalidated)
+
+    def register(
+        self,
+        tool: ToolDefinition | str,
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        model: type[BaseModel] | None = None,
+        allow_unvalidated: bool = False,
+    ) -> None:
+        """Register ``tool`` (a definition or a bare name), replacing any tool of the same name.
+
+        Raises ``ValueError`` if neither the definition, ``parameters`` nor ``model``
+        provides a schema (for example a ``FunctionToolParam``, whose ``parameters``
+        are dropped), unless ``allow_unvalidated`` is true.
+        """
+        definition = tool.root if isinstance(tool, RootModel) else tool
+        if isinstance(definition, str):
+            name = definition
+        elif isinstance(definition, FunctionTool | FunctionToolParam):
+            name = definition.name
+            if parameters is None and isinstance(definition.parameters, dict):
+                parameters = definition.parameters
+        elif isinstance(definition, Mapping):
+            name = definition["name"]
+            if parameters is None:
+                parameters = definition.get("parameters")
+        else:
+            raise TypeError(f"Cannot register {type(definition).__name__} as a tool")
+        if parameters is None and model is not None:
+            parameters = model.model_json_schema()
+        if parameters is None and not allow_unvalidated:
+            raise ValueError(
+                f"Tool {name!r} has no parameters schema; pass parameters=, model= or allow_unvalidated=True"
+            )
+        digest = "" if parameters is None else _digest(parameters)
+        self._tools[name] = _Entry(digest, parameters, model)
+
+    def unregister(self, name: str) -> None:
+        """Remove the tool called ``name``."""
+        del self._tools[name]
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the registered tools."""
+        return list(self._tools)
+
+    def validate_call(self, call: CallLike) -> Any:
+        """Decode and validate the arguments of ``call``, raising :class:`ToolCallError`."""
+        entry = self._tools.get(call.name)
+        if entry is None:
+            raise ToolCallError("unknown tool", name=call.name, call_id=call.call_id)
+        if entry.model is not None:
+            try:
+                return entry.model.model_validate_json(call.arguments)
+            except ValidationError as exc:
+                raise ToolCallError(str(exc), name=call.name, call_id=call.call_id) from exc
+        try:
+            arguments = pydantic_core.from_json(call.arguments)
+        except ValueError as exc:
+            raise ToolCallError(f"arguments are not valid JSON: {exc}", name=call.name, call_id=call.call_id) from exc
+        if entry.schema is not None:
+            try:
+                self._validator(call.name, entry).validate(arguments)
+            except StructuredOutputError as exc:
+                raise ToolCallError(str(exc), name=call.name, call_id=call.call_id, path=exc.path) from exc
+        return arguments
+
+    def validate_calls(self, calls: Iterable[CallLike] | ResponseResource) -> list[ValidatedCall]:
+        """Validate many calls (or all function calls of a response), collecting errors per call."""
+        if isinstance(calls, ResponseResource):
+            calls = [item for item in calls.output if isinstance(item, FunctionCall)]
+        results = []
+        for call in calls:
+            try:
+                results.append(ValidatedCall(call, self.validate_call(call), None))
+            except ToolCallError as exc:
+                results.append(ValidatedCall(call, None, exc))
+        return results
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics of the compiled validator cache."""
+        return self._validators.info()
+
+    def _validator(self, name: str, entry: _Entry) -> CompiledSchema:
+        key = (name, entry.digest)
+        validator = self._validators.get(key)
+        if validator is None:
+            validator = compile_schema(entry.schema, cache=False)  # type: ignore[arg-type]
+            self._validators.put(key, validator)
+        return validator
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+
+def _digest(schema: Mapping[str, Any]) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,156 @@
+"""Keep a rolling ``CreateResponseBody.input`` list within a size budget.
+
+Long-running agents append items to ``input`` on every turn. :class:`InputWindow`
+measures each item's serialized size once, when it is appended, and keeps a running
+total, so checking the budget never re-serializes the history. When the budget is
+exceeded the oldest items are evicted, optionally folded into a summary item, and a
+``FunctionCallItemParam`` is always evicted together with the
+``FunctionCallOutputItemParam`` that shares its ``call_id``. A call evicted before
+its output arrives takes the output with it: the output is dropped on arrival,
+since an output without its call is rejected by the API.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+
+from openresponses_types.history import InputItem
+from openresponses_types.request_builder import RequestBuilder
+from openresponses_types.types import FunctionCallOutputItemParam
+
+Summarizer = Callable[[InputItem | None, list[InputItem]], InputItem | None]
+"""Callback ``(previous_summary, evicted_items) -> new_summary`` used to fold evicted items."""
+
+
+class InputWindow:
+    """Bounded list of input items, sized in serialized bytes or approximate tokens.
+
+    ``max_tokens`` is converted to bytes with ``bytes_per_token``; when both limits are
+    given the smaller one applies. The most recent item (with its call/output partner)
+    is never evicted, even if it alone exceeds the budget.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        *,
+        max_tokens: int | None = None,
+        bytes_per_token: float = 4.0,
+        summarize: Summarizer | None = None,
+        builder: RequestBuilder | None = None,
+    ) -> None:
+        limits = [] if max_bytes is None else [max_bytes]
+        if max_tokens is not None:
+            limits.append(int(max_tokens * bytes_per_token))
+        if not limits:
+            raise ValueError("InputWindow requires max_bytes or max_tokens")
+        self.budget = min(limits)
+        self.bytes_per_token = bytes_per_token
+        self._summarize = summarize
+        self._builder = builder or RequestBuilder()
+        self._items: OrderedDict[int, tuple[InputItem, int]] = OrderedDict()
+        self._by_call_id: dict[str, list[int]] = {}
+        # Calls evicted before their output was appended.
+        self._evicted_calls: set[str] = set()
+        self._next_key = 0
+        self._summary: InputItem | None = None
+        self._summary_size = 0
+        self._size = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Serialized size of the window, including list separators."""
+        return self._size + self._summary_size
+
+    @property
+    def approx_tokens(self) -> int:
+        """Size of the window in approximate tokens."""
+        return int(self.size_bytes / self.bytes_per_token)
+
+    @property
+    def summary(self) -> InputItem | None:
+        """The summary item standing in for evicted history, if any."""
+        return self._summary
+
+    def items(self) -> list[InputItem]:
+        """Return the current window, summary first, ready for ``CreateResponseBody.input``."""
+        items = [item for item, _ in self._items.values()]
+        if self._summary is not None:
+            items.insert(0, self._summary)
+        return items
+
+    def append(self, item: InputItem) -> list[InputItem]:
+        """Add ``item`` and evict old items as needed; return the evicted items.
+
+        The output of a call that was already evicted is not added; it is returned
+        (and summarized) as evicted instead.
+        """
+        call_id = getattr(item, "call_id", None)
+        if isinstance(item, FunctionCallOutputItemParam) and call_id in self._evicted_calls:
+            self._evicted_calls.discard(call_id)
+            if self._summarize is not None:
+                self._set_summary(self._summarize(self._summary, [item]))
+            return [item, *self._evict(protect=self._next_key - 1)]
+        key = self._next_key
+        self._next_key += 1
+        size = self._measure(item)
+        self._items[key] = (item, size)
+        self._size += size
+        if call_id is not None:
+            self._by_call_id.setdefault(call_id, []).append(key)
+        return self._evict(protect=key)
+
+    def extend(self, items: Iterable[InputItem]) -> list[InputItem]:
+        """Append several items; return everything evicted along the way."""
+        evicted: list[InputItem] = []
+        for item in items:
+            evicted.extend(self.append(item))
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._items) + (self._summary is not None)
+
+    def __iter__(self) -> Iterator[InputItem]:
+        return iter(self.items())
+
+    def _measure(self, item: InputItem) -> int:
+        # +1 for the separating comma inside the JSON array.
+        return len(self._builder.fragment(item)) + 1
+
+    def _evict(self, protect: int) -> list[InputItem]:
+        evicted: list[InputItem] = []
+        for oldest in list(self._items):
+            if self.size_bytes <= self.budget:
+                break
+            if oldest not in self._items:  # evicted with an earlier call or output
+                continue
+            group = self._group(oldest)
+            if protect in group:
+                continue
+            for key in group:
+                item, size = self._items.pop(key)
+                self._size -= size
+                evicted.append(item)
+            call_id = getattr(evicted[-1], "call_id", None)
+            if call_id is not None:
+                del self._by_call_id[call_id]
+                if not any(isinstance(item, FunctionCallOutputItemParam) for item in evicted[-len(group) :]):
+                    self._evicted_calls.add(call_id)
+            if self._summarize is not None:
+                self._set_summary(self._summarize(self._summary, evicted[-len(group) :]))
+        if self.size_bytes > self.budget and self._summary is not None:
+            # The summary itself does not fit next to the protected items.
+            self._set_summary(None)
+        return evicted
+
+    def _group(self, key: int) -> list[int]:
+        item, _ = self._items[key]
+        call_id = getattr(item, "call_id", None)
+        if call_id is None:
+            return [key]
+        return self._by_call_id[call_id]
+
+    def _set_summary(self, summary: InputItem | None) -> None:
+        self._summary = summary
+        self._summary_size = 0 if summary is None else self._measure(summary)
@@ -0,0 +1,59 @@
+"""Tests for the shared LRU cache."""
+
+
+def test_eviction_and_statistics():
+    """Test that the least recently used entry is evicted and hits and misses are counted."""
+    from openresponses_types._cache import CacheInfo, LRUCache
+
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.info() == CacheInfo(hits=1, misses=1, maxsize=2, currsize=2)
+
+
+def test_concurrent_use_from_threads():
+    """Test that threads sharing a cache, a tool registry and the schema cache see consistent state."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from openresponses_types._cache import LRUCache
+    from openresponses_types.tools import ToolRegistry
+    from openresponses_types.types import FunctionCall, FunctionCallStatus
+
+    cache = LRUCache(16)
+    registry = ToolRegistry(
+        [
+            {"name": f"tool_{index}", "parameters": {"type": "object", "required": [f"arg_{index}"]}}
+            for index in range(8)
+        ],
+        maxsize=4,
+    )
+
+    def work(worker):
+        for index in range(2000):
+            key = (worker + index) % 32
+            if cache.get(key) is None:
+                cache.put(key, key)
+        for index in range(200):
+            tool = (worker + index) % 8
+            call = FunctionCall(
+                type="function_call",
+                id=f"fc_{index}",
+                call_id=f"call_{index}",
+                name=f"tool_{tool}",
+                arguments=f'{{"arg_{tool}": {index}}}',
+                status=FunctionCallStatus.completed,
+            )
+            assert registry.validate_call(call) == {f"arg_{tool}": index}
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(work, range(8)))
+
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 2000
+    assert info.currsize == len(cache) <= 16
+    assert registry.cache_info().currsize <= 4
@@ -0,0 +1,105 @@
+"""Tests for the streaming delta coalescing stage."""
+
+import asyncio
+
+
+def _text_delta(sequence_number, delta, *, item_id="msg_1", content_index=0, logprob=None):
+    from openresponses_types.types import LogProb, ResponseOutputTextDeltaStreamingEvent
+
+    logprobs = (
+        [] if logprob is None else [LogProb(token=delta, logprob=logprob, bytes=list(delta.encode()), top_logprobs=[])]
+    )
+    return ResponseOutputTextDeltaStreamingEvent.model_validate(
+        {
+            "type": "response.output_text.delta",
+            "sequence_number": sequence_number,
+            "item_id": item_id,
+            "output_index": 0,
+            "content_index": content_index,
+            "delta": delta,
+            "logprobs": logprobs,
+        }
+    )
+
+
+def _mock_events(**options):
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    return list(stream_events(CreateResponseBody(input="Hi"), **options))
+
+
+def test_consecutive_deltas_are_merged_with_logprobs():
+    """Test that deltas of one content part merge into one event with concatenated logprobs."""
+    from openresponses_types.coalesce import coalesce
+
+    events = [_text_delta(i, token, logprob=-float(i)) for i, token in enumerate(["He", "ll", "o"])]
+    (merged,) = coalesce(events, max_delay=None)
+
+    assert merged.delta == "Hello"
+    assert [logprob.token for logprob in merged.logprobs] == ["He", "ll", "o"]
+    assert merged.sequence_number == 0
+
+
+def test_runs_break_on_other_parts_and_events():
+    """Test that a different content part or a non-delta event flushes the pending run first."""
+    from openresponses_types.coalesce import coalesce
+
+    events = _mock_events(output_chars=64, delta_size=2, reasoning_chars=16)
+    merged = list(coalesce(events, max_delay=None))
+    types = [event.type for event in merged]
+
+    assert types.count("response.reasoning.delta") == 1
+    assert types.count("response.output_text.delta") == 1
+    assert [event.type for event in events if not event.type.endswith(".delta")] == [
+        t for t in types if not t.endswith(".delta")
+    ]
+    assert [event.sequence_number for event in merged] == list(range(len(merged)))
+
+    split = list(coalesce([_text_delta(0, "a"), _text_delta(1, "b", content_index=1)], max_delay=None))
+    assert [event.delta for event in split] == ["a", "b"]
+
+
+def test_byte_window_and_renumber_off():
+    """Test that max_bytes bounds each merged delta in UTF-8 bytes and renumber=False keeps the last sequence_number."""
+    from openresponses_types.coalesce import coalesce
+
+    events = [_text_delta(i, "abcd") for i in range(10)]
+    merged = list(coalesce(events, max_bytes=12, max_delay=None, renumber=False))
+
+    assert [len(event.delta) for event in merged] == [12, 12, 12, 4]
+    assert [event.sequence_number for event in merged] == [2, 5, 8, 9]
+
+    wide = list(coalesce([_text_delta(i, "éé") for i in range(6)], max_bytes=12, max_delay=None))
+    assert [event.delta for event in wide] == ["éééééé", "éééééé"]
+
+
+def test_time_window_flushes_pending_run():
+    """Test that flush_due releases a run once max_delay has elapsed."""
+    from openresponses_types.coalesce import DeltaCoalescer
+
+    now = [0.0]
+    coalescer = DeltaCoalescer(max_delay=0.05, clock=lambda: now[0])
+
+    assert coalescer.push(_text_delta(0, "a")) == []
+    assert coalescer.push(_text_delta(1, "b")) == []
+    assert coalescer.flush_due() == []
+    now[0] = 0.06
+    (flushed,) = coalescer.flush_due()
+    assert flushed.delta == "ab"
+    assert not coalescer.pending
+
+
+async def test_acoalesce_flushes_on_quiet_stream():
+    """Test that the async stage releases deltas when the source pauses past max_delay."""
+    from openresponses_types.coalesce import acoalesce
+
+    async def source():
+        yield _text_delta(0, "a")
+        yield _text_delta(1, "b")
+        await asyncio.sleep(0.1)
+        yield _text_delta(2, "c")
+
+    merged = [event.delta async for event in acoalesce(source(), max_delay=0.02)]
+
+    assert merged == ["ab", "c"]
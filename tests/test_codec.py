@@ -0,0 +1,68 @@
+"""Tests for the compact binary codec."""
+
+import pytest
+
+
+def _events():
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate(
+        {"model": "gpt-4", "input": "Hi", "tools": [{"type": "function", "name": "f"}], "metadata": {"k": "v"}}
+    )
+    return list(stream_events(body, output_chars=64, reasoning_chars=16, top_logprobs=2))
+
+
+def test_round_trip_is_lossless_and_smaller():
+    """Test that a response and a stream's events decode to equal models from a smaller payload."""
+    from openresponses_types.codec import decode, decode_many, encode, encode_many
+    from openresponses_types.types import CreateResponseBody, ResponseResource
+
+    events = _events()
+    response = events[-1].response
+    encoded = encode(response, backend="json")
+    decoded = decode(encoded, ResponseResource)
+
+    assert decoded == response
+    assert decoded.model_dump_json() == response.model_dump_json()
+    assert decoded.model_fields_set == response.model_fields_set
+    assert decoded.model_dump_json(exclude_unset=True) == response.model_dump_json(exclude_unset=True)
+
+    body = CreateResponseBody.model_validate_json(
+        '{"model": "gpt-4", "input": "Hi", "stream": true, "tools": [{"type": "function", "name": "f"}]}'
+    )
+    decoded_body = decode(encode(body, backend="json"), CreateResponseBody)
+    assert decoded_body.model_dump_json(exclude_unset=True) == body.model_dump_json(exclude_unset=True)
+    assert len(encoded) < len(response.model_dump_json()) * 0.8
+
+    batch = decode_many(encode_many(events, backend="json"))
+    assert batch == events
+    assert [type(event) for event in batch] == [type(event) for event in events]
+    assert [event.model_dump_json(exclude_unset=True) for event in batch] == [
+        event.model_dump_json(exclude_unset=True) for event in events
+    ]
+
+
+def test_header_is_checked():
+    """Test that foreign payloads, other spec versions and wrong model types are rejected."""
+    from openresponses_types.codec import SPEC_TAG, decode, encode
+    from openresponses_types.types import ResponseResource
+
+    event = _events()[0]
+    encoded = encode(event, backend="json")
+
+    with pytest.raises(ValueError, match="different OpenResponses spec"):
+        decode(encoded.replace(SPEC_TAG, bytes(len(SPEC_TAG)), 1))
+    with pytest.raises(ValueError, match="Not an encoded"):
+        decode(event.model_dump_json().encode())
+    with pytest.raises(TypeError):
+        decode(encoded, ResponseResource)
+
+
+def test_msgpack_backend():
+    """Test the MessagePack backend when msgpack is installed."""
+    pytest.importorskip("msgpack")
+    from openresponses_types.codec import decode, encode
+
+    response = _events()[-1].response
+    assert decode(encode(response, backend="msgpack")) == response
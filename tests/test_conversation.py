@@ -0,0 +1,69 @@
+"""Tests for the indexed conversation container."""
+
+
+def _call(call_id, item_id=None):
+    from openresponses_types.types import FunctionCall
+
+    return FunctionCall(
+        type="function_call",
+        id=item_id or f"fc_{call_id}",
+        call_id=call_id,
+        name="search",
+        arguments="{}",
+        status="completed",
+    )
+
+
+def _output(call_id):
+    from openresponses_types.types import FunctionCallOutputItemParam
+
+    return FunctionCallOutputItemParam(type="function_call_output", call_id=call_id, output="done")
+
+
+def test_pending_calls_follow_outputs():
+    """Test that calls leave the pending set once their output is appended."""
+    from openresponses_types.conversation import Conversation
+
+    conversation = Conversation([_call("a"), _call("b"), _call("c")])
+    conversation.append(_output("b"))
+
+    assert [call.call_id for call in conversation.pending_calls()] == ["a", "c"]
+    assert conversation.output_for("b").output.root == "done"
+    assert conversation.output_for("a") is None
+    assert conversation.has_pending_calls()
+
+
+def test_lookup_by_id_and_call_id():
+    """Test id and call_id lookups across input and output item models."""
+    from openresponses_types.conversation import Conversation
+    from openresponses_types.types import FunctionCallItemParam
+
+    param_call = FunctionCallItemParam(type="function_call", id="fc_2", call_id="b", name="search", arguments="{}")
+    conversation = Conversation([_call("a", item_id="fc_1"), param_call])
+
+    assert conversation.get("fc_1").call_id == "a"
+    assert conversation.call_for("b") is param_call
+    assert conversation.get("missing") is None
+    assert len(conversation) == 2
+
+
+def test_output_before_call_is_not_pending():
+    """Test that an output appended ahead of its call still resolves the call."""
+    from openresponses_types.conversation import Conversation
+
+    conversation = Conversation([_output("a"), _call("a")])
+
+    assert conversation.pending_calls() == []
+
+
+def test_add_response_indexes_streaming_items():
+    """Test that a response's output items are indexed by add_response."""
+    from openresponses_types.conversation import Conversation
+    from openresponses_types.types import ResponseResource
+
+    conversation = Conversation()
+    conversation.add_response(ResponseResource.model_construct(output=[_call("a"), _call("b")]))
+    conversation.append(_output("a"))
+
+    assert [call.call_id for call in conversation.pending_calls()] == ["b"]
+    assert [item.type for item in conversation] == ["function_call", "function_call", "function_call_output"]
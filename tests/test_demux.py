@@ -0,0 +1,113 @@
+"""Tests for the multiplexed stream demultiplexer."""
+
+
+def _events(output_chars=40, **kwargs):
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    return list(stream_events(CreateResponseBody(model="gpt-4", input="Hi"), output_chars=output_chars, **kwargs))
+
+
+def test_interleaved_streams_are_routed_and_freed():
+    """Test that interleaved events accumulate per stream and finished streams are released."""
+    from openresponses_types.demux import StreamDemultiplexer
+
+    demux = StreamDemultiplexer()
+    first, second = _events(reasoning_chars=8), _events(output_chars=12)
+    finished = []
+    for index in range(max(len(first), len(second))):
+        for key, events in (("a", first), ("b", second)):
+            if index < len(events):
+                state = demux.feed(key, events[index])
+                if state.finished:
+                    finished.append(state)
+
+    assert demux.active_streams == 0
+    assert demux.memory_bytes == 0
+    by_key = {state.key: state for state in finished}
+    assert by_key["a"].item(1).text() == first[-1].response.output[1].content[0].text
+    assert by_key["a"].item(0).text() == first[-1].response.output[0].content[0].text
+    assert by_key["b"].item(0).text() == second[-1].response.output[0].content[0].text
+    assert by_key["b"].status == "completed"
+
+
+def test_lookup_by_response_id_while_active():
+    """Test that active streams can be found by response.id."""
+    from openresponses_types.demux import StreamDemultiplexer
+
+    demux = StreamDemultiplexer()
+    events = _events()
+    for event in events[:5]:
+        demux.feed("conn-1", event)
+
+    state = demux.find_response(events[0].response.id)
+    assert state is demux.get("conn-1")
+    assert state.item(0).item_type == "message"
+    assert demux.memory_bytes > 0
+
+
+def test_memory_ceiling_evicts_least_recently_active_stream():
+    """Test that exceeding max_bytes evicts the stalest stream."""
+    from openresponses_types.demux import StreamDemultiplexer
+
+    evicted = []
+    demux = StreamDemultiplexer(max_bytes=2500, on_evict=evicted.append)
+    for key in ("a", "b", "c"):
+        for event in _events(output_chars=600)[:-1]:
+            demux.feed(key, event)
+
+    assert [state.key for state in evicted] == ["a", "b"]
+    assert demux.active_streams == 1
+    assert demux.memory_bytes <= 2500
+
+
+def test_memory_ceiling_counts_response_snapshots():
+    """Test that a large response snapshot counts toward max_bytes even without any delta text."""
+    from openresponses_types.demux import StreamDemultiplexer
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody(model="gpt-4", input="Hi", instructions="x" * 10_000)
+    created, in_progress = list(stream_events(body))[:2]
+    evicted = []
+    demux = StreamDemultiplexer(max_bytes=15_000, on_evict=evicted.append)
+    demux.feed("a", created)
+    demux.feed("a", in_progress)
+    size = demux.memory_bytes
+
+    assert 10_000 < size < 15_000
+    demux.feed("b", created)
+    assert [state.key for state in evicted] == ["a"]
+    assert demux.active_streams == 1 and demux.memory_bytes > 10_000
+
+
+def test_memory_ceiling_uses_payload_size_when_given():
+    """Test that the payload size passed to feed replaces measuring the response snapshot."""
+    from openresponses_types.demux import StreamDemultiplexer
+
+    created = _events()[0]
+    demux = StreamDemultiplexer()
+    demux.feed("a", created, size=5_000)
+    measured = StreamDemultiplexer()
+    measured.feed("a", created)
+
+    assert demux.memory_bytes - measured.memory_bytes == 5_000 - len(created.response.model_dump_json())
+
+
+def test_error_event_finishes_stream():
+    """Test that an error event releases the stream and records the error."""
+    from openresponses_types.demux import StreamDemultiplexer
+    from openresponses_types.types import ErrorStreamingEvent
+
+    demux = StreamDemultiplexer(max_streams=10)
+    demux.feed("a", _events()[0])
+    state = demux.feed(
+        "a",
+        ErrorStreamingEvent(
+            type="error", sequence_number=1, error={"type": "server_error", "code": None, "message": "x", "param": None}
+        ),
+    )
+
+    assert state.finished
+    assert state.error.type == "server_error"
+    assert demux.get("a") is None
@@ -0,0 +1,58 @@
+"""Tests for the server-side SSE emitter."""
+
+import pytest
+
+
+def _emitter():
+    from openresponses_types.emitter import ResponseStreamEmitter
+    from openresponses_types.mock_server import build_response
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody(model="gpt-4", input="Hi")
+    return ResponseStreamEmitter(build_response(body, response_id="resp_1", status="in_progress", output=[]))
+
+
+def test_frames_match_dumped_models():
+    """Test that emitted frames parse back to events that re-encode to the same bytes."""
+    from openresponses_types.mock_server import encode_sse
+    from openresponses_types.streaming import iter_events
+    from openresponses_types.types import LogProb
+
+    emitter = _emitter()
+    emitter.start_message(item_id="msg_1")
+    emitter.text_delta('He said "hi"\n')
+    emitter.text_delta("é\x01", logprobs=[LogProb(token="é", logprob=-0.5, bytes=[195, 169], top_logprobs=[])])
+    emitter.start_function_call("get_weather", call_id="call_1", item_id="fc_1")
+    emitter.function_args_delta('{"city":')
+    emitter.function_args_delta('"Paris"}')
+    emitter.complete()
+    data = emitter.take()
+
+    events = list(iter_events([data]))
+    assert b"".join(encode_sse(event) for event in events) == data
+    assert [event.sequence_number for event in events] == list(range(len(events)))
+    assert emitter.take() == b""
+
+    completed = events[-1].response
+    assert completed.status == "completed"
+    assert completed.output[0].content[0].text == 'He said "hi"\né\x01'
+    assert len(completed.output[0].content[0].logprobs) == 1
+    assert completed.output[1].arguments == '{"city":"Paris"}'
+    assert completed.output[1].call_id == "call_1"
+    assert [event.output_index for event in events if event.type.endswith(".delta")] == [0, 0, 1, 1]
+
+
+def test_out_of_order_calls_raise():
+    """Test that deltas without an open item and calls after completion raise RuntimeError."""
+    from openresponses_types.types import Error
+
+    emitter = _emitter()
+    with pytest.raises(RuntimeError):
+        emitter.text_delta("x")
+    emitter.start_function_call("f")
+    with pytest.raises(RuntimeError):
+        emitter.text_delta("x")
+    emitter.fail(Error(code="server_error", message="boom"))
+    with pytest.raises(RuntimeError):
+        emitter.start_message()
+    assert emitter.take().count(b"event: response.failed\n") == 1
@@ -0,0 +1,64 @@
+"""Tests for immutable-style updates with structural sharing."""
+
+import pytest
+
+
+def _response():
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate(
+        {"model": "gpt-4", "input": "Hi", "tools": [{"type": "function", "name": "f"}], "metadata": {"k": "v"}}
+    )
+    return list(stream_events(body, output_chars=32, reasoning_chars=8))[-1].response
+
+
+def test_evolve_copies_only_updated_paths():
+    """Test that path updates produce a new model sharing every untouched sub-object with the original."""
+    from openresponses_types.evolve import evolve
+
+    response = _response()
+    before = response.model_dump_json()
+
+    updated = evolve(
+        response,
+        {"output[1].content[0].text": "Bye", "tools[0].name": "g", ("metadata", "k"): "w"},
+        status="incomplete",
+    )
+
+    assert response.model_dump_json() == before
+    assert updated.status == "incomplete"
+    assert updated.output[1].content[0].text == "Bye"
+    assert updated.tools[0].root.name == "g"
+    assert updated.metadata == {"k": "w"}
+    assert updated.output[0] is response.output[0]
+    assert updated.output[1].content[0].logprobs is response.output[1].content[0].logprobs
+    assert updated.text is response.text
+    assert "status" in updated.model_fields_set
+    assert updated == response.model_copy(
+        update={
+            "status": "incomplete",
+            "output": [
+                response.output[0],
+                response.output[1].model_copy(
+                    update={"content": [response.output[1].content[0].model_copy(update={"text": "Bye"})]}
+                ),
+            ],
+            "tools": [
+                response.tools[0].model_copy(update={"root": response.tools[0].root.model_copy(update={"name": "g"})})
+            ],
+            "metadata": {"k": "w"},
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    "updates",
+    [{"output[1]..text": "x"}, {"output[1].missing": "x"}, {"output[1]": None, "output[1].id": "x"}, {"status.x": 1}],
+)
+def test_evolve_rejects_invalid_paths(updates):
+    """Test that malformed, unknown and conflicting paths raise errors."""
+    from openresponses_types.evolve import evolve
+
+    with pytest.raises((ValueError, TypeError)):
+        evolve(_response(), updates)
@@ -0,0 +1,125 @@
+"""Tests for columnar export of responses."""
+
+import math
+
+import pytest
+
+
+def _responses():
+    from openresponses_types.mock_server import build_response
+    from openresponses_types.types import (
+        CreateResponseBody,
+        FunctionCall,
+        FunctionCallStatus,
+        InputTokensDetails,
+        OutputTokensDetails,
+        Usage,
+    )
+
+    body = CreateResponseBody(model="gpt-4", input="Hi")
+    usage = Usage(
+        input_tokens=10,
+        output_tokens=5,
+        total_tokens=15,
+        input_tokens_details=InputTokensDetails(cached_tokens=4),
+        output_tokens_details=OutputTokensDetails(reasoning_tokens=2),
+    )
+    calls = [
+        FunctionCall(
+            type="function_call",
+            id=f"fc_{i}",
+            call_id=f"call_{i}",
+            name="f",
+            arguments="{}",
+            status=FunctionCallStatus.completed,
+        )
+        for i in range(2)
+    ]
+    done = build_response(body, response_id="resp_1", status="completed", output=calls, usage=usage, created_at=100)
+    done = done.model_copy(update={"completed_at": 103})
+    running = build_response(body, response_id="resp_2", status="in_progress", output=[], created_at=200)
+    return done, running
+
+
+def test_models_and_raw_json_produce_identical_columns():
+    """Test that models, JSON bytes and decoded dicts flatten to the same column values."""
+    from openresponses_types.export import ResponseColumns
+
+    done, running = _responses()
+    from_models = ResponseColumns([done, running])
+    from_json = ResponseColumns([done.model_dump_json().encode(), running.model_dump(mode="json")])
+
+    assert len(from_models) == 2
+    for name, column in from_models.columns().items():
+        expected, actual = list(column), list(from_json.columns()[name])
+        assert [str(value) for value in expected] == [str(value) for value in actual], name
+    columns = from_models.columns()
+    assert list(columns["status"]) == ["completed", "in_progress"]
+    assert columns["latency"][0] == 3.0 and math.isnan(columns["latency"][1])
+    assert list(columns["input_tokens"]) == [10, 0]
+    assert list(columns["has_usage"]) == [1, 0]
+    assert list(columns["tool_calls"]) == [2, 0]
+
+
+def test_numpy_columns_share_buffers():
+    """Test that to_numpy wraps numeric columns without copying."""
+    pytest.importorskip("numpy")
+    from openresponses_types.export import ResponseColumns
+
+    columns = ResponseColumns(_responses()).to_numpy()
+
+    assert columns["total_tokens"].sum() == 15
+    assert columns["created_at"].dtype.name == "int64"
+
+
+@pytest.mark.parametrize("export", ["to_numpy", "to_arrow"])
+def test_adding_after_export(export):
+    """Test that a zero-copy export freezes the columns with a clear error, and a copying one does not."""
+    pytest.importorskip("numpy" if export == "to_numpy" else "pyarrow")
+    from openresponses_types.export import ResponseColumns
+
+    done, running = _responses()
+    columns = ResponseColumns([done])
+    copied = getattr(columns, export)(copy=True)
+    columns.add(running)
+    shared = getattr(columns, export)()
+
+    with pytest.raises(BufferError, match="copy=True"):
+        columns.add(done)
+    assert len(columns) == 2 and columns.frozen
+    assert len(copied["id"]) == 1 and len(shared["id"]) == 2
+
+
+def test_invalid_row_leaves_columns_aligned():
+    """Test that a response failing partway through its row adds nothing to any column."""
+    from openresponses_types.export import ResponseColumns
+
+    done, running = _responses()
+    columns = ResponseColumns([done])
+    bad = running.model_dump(mode="json") | {"usage": {"input_tokens": "many"}}
+
+    with pytest.raises(KeyError):
+        columns.add(bad)
+    bad["usage"] = done.model_dump(mode="json")["usage"] | {"input_tokens": "many"}
+    with pytest.raises(TypeError):
+        columns.add(bad)
+    columns.add(running)
+
+    assert {len(values) for values in columns.columns().values()} == {2}
+    assert list(columns.numeric["created_at"]) == [100, 200]
+
+
+def test_arrow_export_requires_extra():
+    """Test that to_arrow builds a table with pyarrow, or explains the missing extra."""
+    from openresponses_types.export import ResponseColumns
+
+    columns = ResponseColumns(_responses())
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match=r"openresponses-types\[arrow\]"):
+            columns.to_arrow()
+    else:
+        table = columns.to_arrow()
+        assert table.num_rows == 2
+        assert table.column("output_tokens").to_pylist() == [5, 0]
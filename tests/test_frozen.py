@@ -0,0 +1,85 @@
+"""Tests for frozen, hashable model snapshots."""
+
+import pytest
+
+
+def _function_tool(**overrides):
+    from openresponses_types.types import FunctionTool
+
+    values = {
+        "type": "function",
+        "name": "get_weather",
+        "description": "Get weather for a location",
+        "parameters": {"type": "object", "properties": {"city": {"type": "string"}}, "required": ["city"]},
+        "strict": True,
+    }
+    values.update(overrides)
+    return FunctionTool(**values)
+
+
+def test_equal_models_freeze_to_equal_keys():
+    """Test that content-equal models produce equal hashes and can share a dict slot."""
+    from openresponses_types.frozen import freeze
+
+    first = freeze(_function_tool())
+    second = freeze(_function_tool())
+
+    assert first == second
+    assert hash(first) == hash(second)
+    assert {first: "compiled"}[second] == "compiled"
+
+
+def test_different_content_freezes_to_different_keys():
+    """Test that changing a nested schema value changes the frozen key."""
+    from openresponses_types.frozen import freeze
+
+    first = freeze(_function_tool())
+    second = freeze(_function_tool(parameters={"type": "object", "properties": {}}))
+
+    assert first != second
+
+
+def test_nested_containers_are_immutable():
+    """Test that nested dicts and lists are converted to immutable structures."""
+    from openresponses_types.frozen import FrozenDict, freeze
+
+    frozen = freeze(_function_tool())
+
+    assert isinstance(frozen.parameters, FrozenDict)
+    assert frozen.parameters["required"] == ("city",)
+    with pytest.raises(AttributeError):
+        frozen.name = "other"
+    with pytest.raises(TypeError):
+        frozen.parameters["type"] = "array"
+
+
+def test_snapshot_is_detached_from_source_model():
+    """Test that mutating the source model does not affect the snapshot or its hash."""
+    from openresponses_types.frozen import freeze
+
+    tool = _function_tool()
+    frozen = freeze(tool)
+    before = hash(frozen)
+
+    tool.parameters["properties"]["unit"] = {"type": "string"}
+
+    assert hash(frozen) == before
+    assert "unit" not in frozen.parameters["properties"]
+
+
+def test_thaw_round_trips_nested_models():
+    """Test that thawing returns an equal, independent model instance."""
+    from openresponses_types.frozen import freeze
+    from openresponses_types.types import JsonSchemaResponseFormatParam, ReasoningParam, TextParam
+
+    text = TextParam(
+        format=JsonSchemaResponseFormatParam(type="json_schema", name="out", schema={"type": "object"}),
+        verbosity="low",
+    )
+    frozen = freeze(text)
+    thawed = frozen.thaw()
+
+    assert thawed == text
+    assert thawed is not text
+    assert thawed.model_dump_json(exclude_unset=True) == text.model_dump_json(exclude_unset=True)
+    assert freeze(ReasoningParam(effort="low")) != freeze(ReasoningParam(effort="high"))
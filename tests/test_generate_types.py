@@ -0,0 +1,93 @@
+"""Tests for the type generation script's post-processing."""
+
+from pathlib import Path
+
+SCRIPT = Path(__file__).parent.parent / "scripts" / "generate_types.py"
+
+
+def _generator():
+    import importlib.util
+
+    spec = importlib.util.spec_from_file_location("generate_types", SCRIPT)
+    generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(generator)
+    return generator
+
+
+def _literal_types():
+    import sys
+    import types
+
+    import openresponses_types.types
+
+    generator = _generator()
+    module = types.ModuleType("openresponses_types_literal")
+    sys.modules[module.__name__] = module
+    source = generator.literal_enums(Path(openresponses_types.types.__file__).read_text())
+    exec(compile(source, module.__name__, "exec"), module.__dict__)
+    return module
+
+
+def test_literal_enums_annotates_fields_with_literal_aliases():
+    """Test that --literal-enums fields hold plain strings, keep the enums and dump the same JSON."""
+    from typing import Literal, get_args
+
+    from openresponses_types import types as enum_types
+
+    literal_types = _literal_types()
+    assert literal_types.Type49Literal == Literal["response.output_text.delta"]
+    assert get_args(literal_types.MessageStatusLiteral) == ("in_progress", "completed", "incomplete")
+    assert literal_types.MessageStatus.completed == "completed"
+
+    fields = {"sequence_number": 3, "item_id": "msg_1", "output_index": 0, "content_index": 0, "delta": "Hi"}
+    expected = enum_types.ResponseOutputTextDeltaStreamingEvent(
+        type=enum_types.Type49.response_output_text_delta, logprobs=[], **fields
+    )
+    from_enum = literal_types.ResponseOutputTextDeltaStreamingEvent(
+        type=literal_types.Type49.response_output_text_delta, logprobs=[], **fields
+    )
+    parsed = literal_types.ResponseOutputTextDeltaStreamingEvent.model_validate_json(expected.model_dump_json())
+
+    assert type(parsed.type) is str
+    assert from_enum.model_dump_json() == parsed.model_dump_json() == expected.model_dump_json()
+
+
+def test_helper_modules_work_with_literal_enum_types(tmp_path):
+    """Test that the helper modules import and round-trip a stream against a --literal-enums build of types.py."""
+    import shutil
+    import subprocess
+    import sys
+
+    import openresponses_types
+
+    source = Path(openresponses_types.__file__).parent
+    package = tmp_path / "openresponses_types"
+    shutil.copytree(source, package)
+    (package / "types.py").write_text(_generator().literal_enums((source / "types.py").read_text()))
+    script = """
+import importlib
+for name in ["coalesce", "demux", "emitter", "evolve", "history", "limits", "partial_json", "peek",
+             "rejection", "streaming", "structured", "tools"]:
+    importlib.import_module("openresponses_types." + name)
+
+from openresponses_types.emitter import ResponseStreamEmitter
+from openresponses_types.history import response_to_input
+from openresponses_types.mock_server import build_response
+from openresponses_types.streaming import EVENT_MODELS, iter_events
+from openresponses_types.types import CreateResponseBody
+
+assert EVENT_MODELS["response.output_text.delta"].__name__ == "ResponseOutputTextDeltaStreamingEvent"
+body = CreateResponseBody(model="gpt-4", input="Hi")
+emitter = ResponseStreamEmitter(build_response(body, response_id="resp_1", status="in_progress", output=[]))
+emitter.start_message(item_id="msg_1")
+emitter.text_delta("Hello")
+emitter.complete()
+response = list(iter_events([emitter.take()]))[-1].response
+assert type(response.output[0].status) is str
+assert response_to_input(response)[0].role == "assistant"
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", script], env={"PYTHONPATH": str(tmp_path)}, capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
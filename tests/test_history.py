@@ -0,0 +1,125 @@
+"""Tests for output-to-input item converters."""
+
+import pytest
+
+OUTPUT_ITEMS = [
+    {
+        "type": "reasoning",
+        "id": "rs_1",
+        "summary": [{"type": "summary_text", "text": "Looking up the weather."}],
+        "encrypted_content": "opaque",
+    },
+    {
+        "type": "function_call",
+        "id": "fc_1",
+        "call_id": "call_1",
+        "name": "get_weather",
+        "arguments": '{"city": "Paris"}',
+        "status": "completed",
+    },
+    {
+        "type": "function_call_output",
+        "id": "fco_1",
+        "call_id": "call_1",
+        "output": "sunny",
+        "status": "completed",
+    },
+    {
+        "type": "message",
+        "id": "msg_1",
+        "status": "completed",
+        "role": "assistant",
+        "content": [
+            {
+                "type": "output_text",
+                "text": "It is sunny in Paris.",
+                "annotations": [
+                    {"type": "url_citation", "url": "https://x.org", "start_index": 0, "end_index": 5, "title": "t"}
+                ],
+                "logprobs": [],
+            },
+            {"type": "refusal", "refusal": "No forecasts beyond today."},
+        ],
+    },
+]
+
+
+def _output_items():
+    from pydantic import TypeAdapter
+
+    from openresponses_types.history import OutputItem
+
+    return TypeAdapter(list[OutputItem]).validate_python(OUTPUT_ITEMS)
+
+
+def test_converted_items_match_dict_round_trip():
+    """Test that direct conversion matches dumping and re-validating as input items."""
+    from pydantic import TypeAdapter
+
+    from openresponses_types.history import InputItem, to_input_items
+
+    items = _output_items()
+    adapter = TypeAdapter(list[InputItem])
+    expected = adapter.validate_python([item.model_dump(exclude_none=True) for item in items])
+
+    converted = to_input_items(items)
+
+    assert [type(item) for item in converted] == [type(item) for item in expected]
+    assert adapter.dump_python(converted, mode="json", exclude_none=True) == adapter.dump_python(
+        expected, mode="json", exclude_none=True
+    )
+
+
+def test_converted_items_are_accepted_by_create_response_body():
+    """Test that converted items round-trip through CreateResponseBody JSON validation."""
+    from openresponses_types.history import to_input_items
+    from openresponses_types.types import CreateResponseBody, FunctionCallItemParam
+
+    body = CreateResponseBody(model="gpt-4", input=to_input_items(_output_items()))
+    parsed = CreateResponseBody.model_validate_json(body.model_dump_json(exclude_none=True))
+
+    assert isinstance(parsed.input[1], FunctionCallItemParam)
+    assert parsed.input[1].call_id == "call_1"
+
+
+def test_streaming_item_subclasses_are_converted():
+    """Test that Item* subclasses from output_item events are converted by their base type."""
+    from openresponses_types.history import to_input_item
+    from openresponses_types.types import FunctionCallItemParam, Item63
+
+    item = Item63.model_validate(OUTPUT_ITEMS[1])
+
+    assert isinstance(to_input_item(item), FunctionCallItemParam)
+
+
+def test_response_to_input():
+    """Test converting a whole ResponseResource output list."""
+    from openresponses_types.history import response_to_input
+    from openresponses_types.types import AssistantMessageItemParam, ResponseResource
+
+    response = ResponseResource.model_construct(output=_output_items())
+
+    converted = response_to_input(response)
+
+    assert len(converted) == 4
+    assert isinstance(converted[-1], AssistantMessageItemParam)
+    assert converted[-1].status == "completed"
+
+
+def test_unconvertible_content_raises():
+    """Test that content parts with no input equivalent are rejected."""
+    from openresponses_types.history import to_input_item
+    from openresponses_types.types import Message
+
+    message = Message.model_validate(
+        {
+            "type": "message",
+            "id": "msg_2",
+            "status": "completed",
+            "role": "assistant",
+            "content": [{"type": "input_video", "video_url": "https://example.com/v.mp4"}],
+        }
+    )
+
+    with pytest.raises(ValueError):
+        to_input_item(message)
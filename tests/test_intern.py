@@ -0,0 +1,61 @@
+"""Tests for interning of repeated strings and schemas."""
+
+INSTRUCTIONS = "You are a careful assistant. " * 20
+
+
+def _response_json(index):
+    from openresponses_types.mock_server import build_response
+    from openresponses_types.types import CreateResponseBody, FunctionCall, FunctionCallStatus
+
+    call = FunctionCall(
+        type="function_call",
+        id=f"fc_{index}",
+        call_id=f"call_{index}",
+        name="lookup_order_status",
+        arguments="{}",
+        status=FunctionCallStatus.completed,
+    )
+    body = CreateResponseBody(model="gpt-4", input="Hi", instructions=INSTRUCTIONS, metadata={"tenant": "acme"})
+    data = build_response(body, response_id=f"resp_{index}", status="completed", output=[call]).model_dump(mode="json")
+    data["tools"] = [
+        {
+            "type": "function",
+            "name": "lookup_order_status",
+            "description": "Look up the status of an order by its number. " * 4,
+            "parameters": {"type": "object", "properties": {"order": {"type": "string"}}},
+            "strict": True,
+        }
+    ]
+    return data
+
+
+def test_parsed_responses_share_interned_values():
+    """Test that interned responses share strings and schemas and are otherwise unchanged."""
+    import json
+
+    from openresponses_types.intern import InternTable, parse_response
+    from openresponses_types.types import ResponseResource
+
+    table = InternTable()
+    raw = [json.dumps(_response_json(index)) for index in range(3)]
+    first, second, third = (parse_response(data, table) for data in raw)
+
+    assert first == ResponseResource.model_validate_json(raw[0])
+    assert first.instructions is second.instructions is third.instructions
+    assert first.tools[0].root.description is second.tools[0].root.description
+    assert first.tools[0].root.parameters is second.tools[0].root.parameters
+    assert first.output[0].name is third.output[0].name
+    assert first.id is not second.id
+    assert table.info().hits > 0
+
+
+def test_table_size_is_capped():
+    """Test that the table keeps at most maxsize strings and skips over-long ones."""
+    from openresponses_types.intern import InternTable
+
+    table = InternTable(maxsize=2, max_length=5)
+    for value in ["a", "b", "c", "toolong"]:
+        table.string(value)
+
+    assert table.info().currsize == 2
+    assert table.string("".join(["b"])) == "b"
@@ -0,0 +1,85 @@
+"""Tests for the limits pre-check on raw request bodies."""
+
+import json
+
+import pytest
+
+TEXT_LIMIT = 10485760
+
+
+def _body(**fields):
+    return json.dumps({"model": "gpt-4", **fields})
+
+
+def _message(text):
+    return {"type": "message", "role": "user", "content": [{"type": "input_text", "text": text}]}
+
+
+def test_bodies_within_limits_pass():
+    """Test that bodies at the limits, counted in characters rather than escaped bytes, are not rejected."""
+    from openresponses_types.limits import check_limits
+    from openresponses_types.types import CreateResponseBody
+
+    for data in [
+        _body(input=[_message("Hi")] * 3, metadata={"tenant": "acme"}, tools=[{"type": "function", "name": "f"}]),
+        _body(input=[_message("x" * TEXT_LIMIT)]),
+        _body(input=[_message("é" * TEXT_LIMIT)]),
+        json.dumps({"model": "gpt-4", "input": [_message("é" * TEXT_LIMIT)]}, ensure_ascii=False),
+        _body(input="y" * TEXT_LIMIT, previous_response_id="z" * (TEXT_LIMIT + 1)),
+    ]:
+        assert check_limits(data, CreateResponseBody) is None
+
+
+@pytest.mark.parametrize(
+    ("data", "caps", "code", "path"),
+    [
+        (
+            _body(input=[_message("Hi"), _message("x" * (TEXT_LIMIT + 1))]),
+            {},
+            "string_too_long",
+            ("input", 1, "content", 0, "text"),
+        ),
+        (_body(input=[_message("é" * (TEXT_LIMIT + 1))]), {}, "string_too_long", ("input", 0, "content", 0, "text")),
+        (_body(input="y" * (TEXT_LIMIT + 1)), {}, "string_too_long", ("input",)),
+        (_body(metadata={str(index): "v" for index in range(513)}), {}, "too_long", ("metadata",)),
+        (_body(input=[_message("Hi")] * 4), {"max_items": 3}, "too_many_items", ("input",)),
+        (_body(input=[_message("Hi")]), {"max_depth": 3}, "too_deep", ("input", 0, "content")),
+        (_body(input="Hi"), {"max_bytes": 10}, "body_too_large", ()),
+        ('{"model": "gpt-4", "input": [', {}, "json_invalid", ("input",)),
+    ],
+)
+def test_bodies_over_limits_are_rejected(data, caps, code, path):
+    """Test that the first string, container or cap exceeded is reported with its path."""
+    from openresponses_types.limits import check_limits
+    from openresponses_types.types import CreateResponseBody
+
+    rejection = check_limits(data.encode(), CreateResponseBody, **caps)
+
+    assert rejection is not None
+    assert (rejection.code, rejection.path) == (code, path)
+
+
+@pytest.mark.parametrize(
+    ("text", "ensure_ascii", "rejected"),
+    [
+        ("\n" * 64, True, False),
+        ("\n" * 65, True, True),
+        ("😀" * 64, True, False),
+        ("😀" * 65, True, True),
+        ("😀" * 64, False, False),
+        ("\ud7ff" * 64, True, False),
+        ("\ud7ff" * 65, True, True),
+        ('\\u0041"' * 9 + "x", True, False),
+        ('\\u0041"' * 9 + "xy", True, True),
+    ],
+)
+def test_escaped_strings_are_counted_in_characters(text, ensure_ascii, rejected):
+    """Test that escapes, surrogate pairs and multi-byte characters each count as one character."""
+    from openresponses_types.limits import check_limits
+    from openresponses_types.types import CreateResponseBody
+
+    data = json.dumps({"model": "gpt-4", "safety_identifier": text}, ensure_ascii=ensure_ascii)
+    rejection = check_limits(data, CreateResponseBody)
+
+    assert (rejection is not None) == rejected
+    assert rejection is None or rejection.path == ("safety_identifier",)
@@ -0,0 +1,149 @@
+"""Tests for the local mock OpenResponses server."""
+
+import asyncio
+import json
+
+
+async def _post(server, payload, *, raw=None):
+    """Send one POST request and return (status, headers, body) with chunked bodies decoded."""
+    reader, writer = await asyncio.open_connection(server.host, server.port)
+    body = raw if raw is not None else json.dumps(payload).encode()
+    writer.write(
+        b"POST /v1/responses HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+        + f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    head, _, rest = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    headers = dict(line.decode().lower().split(": ", 1) for line in head.split(b"\r\n")[1:])
+    if headers.get("transfer-encoding") == "chunked":
+        decoded = b""
+        while True:
+            size_line, _, rest = rest.partition(b"\r\n")
+            size = int(size_line, 16)
+            if size == 0:
+                break
+            decoded += rest[:size]
+            rest = rest[size + 2 :]
+        rest = decoded
+    return status, headers, rest
+
+
+async def test_non_streaming_request_returns_response_resource():
+    """Test that a plain request returns a valid completed ResponseResource."""
+    from openresponses_types.mock_server import MockResponsesServer
+    from openresponses_types.types import ResponseResource
+
+    async with MockResponsesServer(output_chars=50) as server:
+        status, headers, body = await _post(server, {"model": "gpt-4", "input": "Hello"})
+
+    response = ResponseResource.model_validate_json(body)
+    assert status == 200
+    assert response.status == "completed"
+    assert response.model == "gpt-4"
+    assert len(response.output[0].content[0].text) == 50
+
+
+async def test_streaming_request_returns_sse_event_sequence():
+    """Test the SSE sequence, delta sizes and logprobs of a streamed response."""
+    from openresponses_types.mock_server import MockResponsesServer
+    from openresponses_types.types import ResponseOutputTextDeltaStreamingEvent
+
+    async with MockResponsesServer(output_chars=40, delta_size=8, top_logprobs=2) as server:
+        status, headers, body = await _post(server, {"model": "gpt-4", "input": "Hello", "stream": True})
+
+    frames = [frame for frame in body.decode().split("\n\n") if frame]
+    types = [frame.split("\n")[0].removeprefix("event: ") for frame in frames]
+    data = [json.loads(frame.split("\n")[1].removeprefix("data: ")) for frame in frames]
+    deltas = [ResponseOutputTextDeltaStreamingEvent.model_validate(d) for d in data if d["type"].endswith("text.delta")]
+
+    assert status == 200
+    assert headers["content-type"] == "text/event-stream"
+    assert types[:3] == ["response.created", "response.in_progress", "response.output_item.added"]
+    assert types[-1] == "response.completed"
+    assert len(deltas) == 5
+    assert all(len(delta.delta) == 8 and len(delta.logprobs[0].top_logprobs) == 2 for delta in deltas)
+    assert [d["sequence_number"] for d in data] == list(range(len(data)))
+
+
+def test_stream_events_with_reasoning():
+    """Test that reasoning_chars adds a reasoning item ahead of the message."""
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    events = list(stream_events(CreateResponseBody(input="Hi"), output_chars=8, reasoning_chars=12, delta_size=4))
+    completed = events[-1].response
+
+    assert sum(event.type == "response.reasoning.delta" for event in events) == 3
+    assert [item.type for item in completed.output] == ["reasoning", "message"]
+    assert completed.usage.output_tokens == 5
+
+
+async def test_invalid_body_is_rejected():
+    """Test that an invalid CreateResponseBody yields a 400 error payload."""
+    from openresponses_types.mock_server import MockResponsesServer
+
+    async with MockResponsesServer() as server:
+        status, _, body = await _post(server, None, raw=b'{"input": 5}')
+
+    assert status == 400
+    assert json.loads(body)["error"]["type"] == "invalid_request_error"
+    assert server.requests_served == 0
+
+
+def test_completed_response_matches_streamed_response():
+    """Test that the non-streamed response carries the output and usage of the final streamed event."""
+    from openresponses_types.mock_server import completed_response, stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody(input="Hi")
+    options = {"output_chars": 10, "reasoning_chars": 6, "delta_size": 4, "top_logprobs": 1}
+    streamed = list(stream_events(body, response_id="resp_1", **options))[-1].response
+    response = completed_response(body, response_id="resp_1", **options)
+
+    exclude = {"created_at": True, "completed_at": True, "output": {"__all__": {"id"}}}
+    assert response.model_dump(exclude=exclude) == streamed.model_dump(exclude=exclude)
+
+
+async def test_malformed_request_and_server_errors_are_reported(monkeypatch):
+    """Test that a malformed request gets a 400 and a failure to build the response a 500 error payload."""
+    from openresponses_types import mock_server
+
+    def fail(*args, **kwargs):
+        raise ValueError("boom")
+
+    async with mock_server.MockResponsesServer() as server:
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+        writer.write(b"GARBAGE\r\n\r\n")
+        response = await reader.read()
+        writer.close()
+        assert response.startswith(b"HTTP/1.1 400 ")
+
+        monkeypatch.setattr(mock_server, "build_response", fail)
+        for stream in (False, True):
+            status, _, body = await _post(server, {"model": "gpt-4", "input": "Hi", "stream": stream})
+            assert status == 500
+            error = json.loads(body)["error"]
+            assert (error["type"], error["message"]) == ("server_error", "ValueError: boom")
+
+
+async def test_failure_mid_stream_ends_with_error_event(monkeypatch):
+    """Test that a failure after the stream started is sent as a final error event."""
+    from openresponses_types import mock_server
+
+    def fail(*args, **kwargs):
+        raise ValueError("boom")
+
+    monkeypatch.setattr(mock_server, "_logprob", fail)
+    async with mock_server.MockResponsesServer(top_logprobs=1) as server:
+        status, _, body = await _post(server, {"model": "gpt-4", "input": "Hi", "stream": True})
+
+    data = [json.loads(frame.split("\n")[1].removeprefix("data: ")) for frame in body.decode().split("\n\n") if frame]
+    assert status == 200
+    assert data[-1]["type"] == "error"
+    assert data[-1]["error"]["message"] == "ValueError: boom"
+    assert [event["sequence_number"] for event in data] == list(range(len(data)))
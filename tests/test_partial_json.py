@@ -0,0 +1,86 @@
+"""Tests for incremental parsing of streamed function call arguments."""
+
+import json
+import random
+
+import pytest
+
+DOCUMENT = {
+    "path": "src/main.py",
+    "query": 'say "hi"\né\U0001f600',
+    "limits": [1, -2.5, 3e2, 0],
+    "flags": {"recursive": True, "hidden": False, "owner": None},
+    "empty": {},
+    "nested": [[], [{"a": "b"}]],
+}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_chunking_matches_json_loads(seed):
+    """Test that any split of the text parses to the same value as json.loads."""
+    from openresponses_types.partial_json import PartialJSONParser
+
+    text = json.dumps(DOCUMENT, indent=seed % 2 or None)
+    rng = random.Random(seed)
+    cuts = sorted(rng.sample(range(1, len(text)), 40))
+    parser = PartialJSONParser()
+    for start, end in zip([0, *cuts], [*cuts, len(text)], strict=True):
+        parser.feed(text[start:end])
+
+    assert parser.close() == DOCUMENT
+    assert parser.done
+
+
+def test_key_callbacks_and_partial_value():
+    """Test that on_key reports completed values by path while the value is still partial."""
+    from openresponses_types.partial_json import PartialJSONParser
+
+    completed = []
+    parser = PartialJSONParser(on_key=lambda path, value: completed.append((path, value)))
+    parser.feed('{"path": "a.py", "lines": [10, 2')
+
+    assert completed == [(("path",), "a.py"), (("lines", 0), 10)]
+    assert parser.value == {"path": "a.py", "lines": [10]}
+    assert not parser.done
+
+    parser.feed("0]}")
+    assert completed[-3:] == [(("lines", 1), 20), (("lines",), [10, 20]), ((), parser.value)]
+
+
+@pytest.mark.parametrize("text", ['{"a" 1}', "[1,]", '{"a":1,}', "tru e", "[1 2]", "01", '{"a":1}}'])
+def test_malformed_input_raises(text):
+    """Test that malformed JSON raises ValueError."""
+    from openresponses_types.partial_json import PartialJSONParser
+
+    parser = PartialJSONParser()
+    with pytest.raises(ValueError):
+        parser.feed(text)
+        parser.close()
+
+
+def test_tracker_follows_function_calls_in_a_stream():
+    """Test that the tracker parses the arguments of each function call item of a stream."""
+    from openresponses_types.emitter import ResponseStreamEmitter
+    from openresponses_types.mock_server import build_response
+    from openresponses_types.partial_json import FunctionArgumentsTracker
+    from openresponses_types.streaming import iter_events
+    from openresponses_types.types import CreateResponseBody
+
+    emitter = ResponseStreamEmitter(
+        build_response(CreateResponseBody(input="Hi"), response_id="resp_1", status="in_progress", output=[])
+    )
+    emitter.start_function_call("read_file", item_id="fc_1")
+    for fragment in ['{"pa', 'th": "/tmp/', 'x.txt", "mode"', ': "r"}']:
+        emitter.function_args_delta(fragment)
+    emitter.complete()
+
+    seen = []
+    tracker = FunctionArgumentsTracker(on_key=lambda call, path, value: seen.append((call.name, path, value)))
+    for event in iter_events([emitter.take()]):
+        if event.type == "response.function_call_arguments.done":
+            call = tracker.get("fc_1")
+        tracker.feed(event)
+
+    assert seen[0] == ("read_file", ("path",), "/tmp/x.txt")
+    assert call.arguments == {"path": "/tmp/x.txt", "mode": "r"}
+    assert tracker.get("fc_1") is None
@@ -0,0 +1,51 @@
+"""Tests for reading fields from raw JSON without full validation."""
+
+import pytest
+
+
+def test_peek_request_fields():
+    """Test that requested paths are returned as decoded JSON or validated field values."""
+    from openresponses_types.peek import peek
+    from openresponses_types.types import CreateResponseBody, Role2
+
+    body = CreateResponseBody.model_validate(
+        {
+            "model": "gpt-4",
+            "input": [{"type": "message", "role": "developer", "content": 'Say "hi"'}],
+            "stream": True,
+            "previous_response_id": "resp_1",
+        }
+    ).model_dump_json()
+
+    assert peek(body, ["model", ("input", 0, "content"), "missing"]) == {
+        "model": "gpt-4",
+        ("input", 0, "content"): 'Say "hi"',
+    }
+    assert peek(body.encode(), ["stream", "previous_response_id", "input.0.role"], model=CreateResponseBody) == {
+        "stream": True,
+        "previous_response_id": "resp_1",
+        "input.0.role": Role2.developer,
+    }
+    with pytest.raises(ValueError, match="no field"):
+        peek(body, ["missing"], model=CreateResponseBody)
+
+    long_body = CreateResponseBody.model_validate(
+        {"model": "gpt-4", "input": [{"type": "message", "role": "user", "content": "Hi"}] * 40, "stream": False}
+    ).model_dump_json()
+    assert peek(long_body, ["stream", "input.39.content"]) == {"stream": False, "input.39.content": "Hi"}
+
+
+def test_peek_event_stops_after_last_path():
+    """Test that usage is read from a completed event and scanning stops once all paths are found."""
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.peek import peek
+    from openresponses_types.types import CreateResponseBody, ResponseCompletedStreamingEvent, Usage
+
+    event = list(stream_events(CreateResponseBody(model="gpt-4", input="Hi"), output_chars=32))[-1]
+    found = peek(event.model_dump_json(), ["response.usage"], model=ResponseCompletedStreamingEvent)
+    assert isinstance(found["response.usage"], Usage)
+    assert found["response.usage"] == event.response.usage
+
+    assert peek(b'{"model": "gpt-4", "input": [{"type": "mess', ["model"]) == {"model": "gpt-4"}
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        peek(b'{"input": [1, 2', ["model"])
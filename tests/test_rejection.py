@@ -0,0 +1,58 @@
+"""Tests for compact rejection of invalid payloads."""
+
+import pytest
+
+
+def test_valid_payload_matches_model_validate_json():
+    """Test that valid input yields the same model, fields set and nested types as model_validate_json."""
+    from openresponses_types.rejection import validate_or_reject
+    from openresponses_types.types import CreateResponseBody
+
+    data = CreateResponseBody.model_validate(
+        {
+            "model": "gpt-4",
+            "input": [{"type": "message", "role": "user", "content": [{"type": "input_text", "text": "Hi"}]}],
+            "tools": [{"type": "function", "name": "lookup", "parameters": {"type": "object"}}],
+        }
+    ).model_dump_json(exclude_none=True)
+    expected = CreateResponseBody.model_validate_json(data)
+
+    result = validate_or_reject(data, CreateResponseBody)
+
+    assert result == expected
+    assert result.model_fields_set == expected.model_fields_set
+    assert type(result.input[0]) is type(expected.input[0])
+    assert type(result.tools[0].root) is type(expected.tools[0].root)
+    assert validate_or_reject(expected.model_dump(), CreateResponseBody) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "code", "path", "field"),
+    [
+        ('{"model": 3}', "string_type", ("model",), "model"),
+        ('{"model": "gpt-4", "tools": [{"type": "function"}]}', "missing", ("tools", 0, "name"), "name"),
+        (
+            '{"model": "gpt-4", "input": [{"type": "message", "role": "robot", "content": "Hi"}]}',
+            "union_mismatch",
+            ("input", 0),
+            "input",
+        ),
+        ('{"model": "gpt-4", "input": 5}', "union_mismatch", ("input",), "input"),
+        ('{"model"', "json_invalid", (), None),
+        ("[]", "model_type", (), None),
+    ],
+)
+@pytest.mark.parametrize("fail_fast", [True, False])
+def test_invalid_payload_is_rejected_compactly(data, code, path, field, fail_fast, monkeypatch):
+    """Test that invalid input returns its first error as a Rejection, with or without fail_fast support."""
+    from openresponses_types import rejection
+    from openresponses_types._cache import LRUCache
+    from openresponses_types.types import CreateResponseBody
+
+    if not fail_fast:
+        monkeypatch.setattr(rejection, "_HAS_FAIL_FAST", False)
+        monkeypatch.setattr(rejection, "_VALIDATORS", LRUCache(64))
+
+    result = rejection.validate_or_reject(data, CreateResponseBody)
+
+    assert result == rejection.Rejection(code, path, field)
@@ -0,0 +1,80 @@
+"""Tests for the cached CreateResponseBody serializer."""
+
+import json
+
+
+def _tool():
+    from openresponses_types.types import FunctionToolParam
+
+    return FunctionToolParam(type="function", name="get_weather", description="Get weather for a location")
+
+
+def _user(text):
+    from openresponses_types.types import UserMessageItemParam
+
+    return UserMessageItemParam(type="message", role="user", content=text)
+
+
+def test_build_matches_model_dump_json():
+    """Test that the spliced body is equivalent to a plain model dump."""
+    from openresponses_types.request_builder import RequestBuilder
+    from openresponses_types.types import CreateResponseBody, JsonSchemaResponseFormatParam, TextParam
+
+    body = CreateResponseBody(
+        model="gpt-4",
+        instructions="Be brief.",
+        input=[_user("Hello"), _user("Weather in Paris?")],
+        tools=[_tool()],
+        text=TextParam(format=JsonSchemaResponseFormatParam(type="json_schema", name="out", schema={"type": "object"})),
+    )
+
+    built = json.loads(RequestBuilder().build(body))
+
+    assert built == json.loads(body.model_dump_json(by_alias=True, exclude_none=True))
+    assert built["text"]["format"]["schema"] == {"type": "object"}
+
+
+def test_build_handles_string_input_and_missing_fields():
+    """Test string input and exclude_none=False output."""
+    from openresponses_types.request_builder import RequestBuilder
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody(model="gpt-4", input="Hello")
+
+    assert json.loads(RequestBuilder().build(body)) == {"model": "gpt-4", "input": "Hello"}
+    assert json.loads(RequestBuilder(exclude_none=False).build(body)) == json.loads(body.model_dump_json(by_alias=True))
+
+
+def test_only_new_items_are_serialized_on_later_turns():
+    """Test that unchanged tools and history items are served from the cache."""
+    from openresponses_types.request_builder import RequestBuilder
+    from openresponses_types.types import CreateResponseBody
+
+    builder = RequestBuilder()
+    tools = [_tool()]
+    history = [_user("Hello")]
+    builder.build(CreateResponseBody(model="gpt-4", input=history, tools=tools))
+    first = builder.cache_info()
+
+    history.append(_user("And tomorrow?"))
+    builder.build(CreateResponseBody(model="gpt-4", input=history, tools=tools))
+    second = builder.cache_info()
+
+    assert second.misses - first.misses == 1
+    assert second.hits - first.hits == 2
+
+
+def test_frozen_items_are_cached_by_content():
+    """Test that equal frozen snapshots share a fragment and eviction is bounded."""
+    from openresponses_types.frozen import freeze
+    from openresponses_types.request_builder import RequestBuilder
+
+    builder = RequestBuilder(maxsize=2)
+    fragment = builder.fragment(freeze(_tool()))
+
+    assert builder.fragment(freeze(_tool())) is fragment
+    for index in range(5):
+        builder.fragment(_user(f"message {index}"))
+    info = builder.cache_info()
+    assert info.currsize <= 3
+    assert info.maxsize == 4
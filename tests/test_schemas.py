@@ -0,0 +1,54 @@
+"""Tests for the prebuilt JSON Schema artifacts."""
+
+import pytest
+
+
+def test_artifacts_match_model_json_schema():
+    """Test that the shipped files were built from the current spec and equal model_json_schema() of every model."""
+    import json
+
+    from openresponses_types import __spec_hash__
+    from openresponses_types.schemas import _DIRECTORY, public_models
+
+    models = public_models()
+
+    assert (_DIRECTORY / "spec.sha256").read_text().strip() == __spec_hash__
+    assert {path.name for path in _DIRECTORY.iterdir() if path.name.endswith(".json")} == {
+        f"{name}.json" for name in models
+    }
+    for name, model in models.items():
+        assert json.loads((_DIRECTORY / f"{name}.json").read_bytes()) == model.model_json_schema(), name
+
+
+def test_loader_reads_lazily_and_falls_back_when_stale(monkeypatch):
+    """Test that schemas are looked up by class or name, cached, and generated at runtime for stale files."""
+    from openresponses_types import schemas
+    from openresponses_types._cache import LRUCache
+    from openresponses_types.types import ResponseCompletedStreamingEvent, ResponseResource
+
+    monkeypatch.setattr(schemas, "_SCHEMAS", LRUCache(256))
+    data = schemas.json_schema_bytes(ResponseResource)
+
+    assert schemas.json_schema_bytes("ResponseResource") is data
+    assert schemas.json_schema(ResponseResource) == ResponseResource.model_json_schema()
+    with pytest.raises(KeyError):
+        schemas.json_schema("NotAModel")
+
+    monkeypatch.setattr(schemas, "_SCHEMAS", LRUCache(256))
+    monkeypatch.setattr(schemas, "_fresh", False)
+    assert schemas.json_schema(ResponseCompletedStreamingEvent) == ResponseCompletedStreamingEvent.model_json_schema()
+
+
+def test_artifacts_from_another_pydantic_minor_version_are_stale(monkeypatch):
+    """Test that files written by a different pydantic minor version are not used, unlike another patch release."""
+    import pydantic
+
+    from openresponses_types import schemas
+
+    monkeypatch.setattr(schemas, "_fresh", None)
+    monkeypatch.setattr(pydantic, "VERSION", f"{schemas.schema_version()}.99")
+    assert schemas._artifacts_fresh()
+
+    monkeypatch.setattr(schemas, "_fresh", None)
+    monkeypatch.setattr(pydantic, "VERSION", "2.0.0")
+    assert not schemas._artifacts_fresh()
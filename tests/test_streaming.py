@@ -0,0 +1,161 @@
+"""Tests for streaming event parsing."""
+
+import json
+
+import pytest
+
+
+def test_event_models_cover_all_streaming_events():
+    """Test that every streaming event type string maps to its model."""
+    from openresponses_types.streaming import EVENT_MODELS
+    from openresponses_types.types import ErrorStreamingEvent, ResponseOutputTextDeltaStreamingEvent
+
+    assert len(EVENT_MODELS) == 24
+    assert EVENT_MODELS["response.output_text.delta"] is ResponseOutputTextDeltaStreamingEvent
+    assert EVENT_MODELS["error"] is ErrorStreamingEvent
+
+
+def test_parse_event_with_and_without_event_name():
+    """Test parsing a payload with the SSE event name and by reading its type key."""
+    from openresponses_types.streaming import parse_event
+    from openresponses_types.types import ResponseOutputTextDeltaStreamingEvent
+
+    data = (
+        '{"type":"response.output_text.delta","sequence_number":3,"item_id":"msg_1",'
+        '"output_index":0,"content_index":0,"delta":"Hi","logprobs":[]}'
+    )
+
+    assert isinstance(parse_event(data, "response.output_text.delta"), ResponseOutputTextDeltaStreamingEvent)
+    assert parse_event(data.encode()).delta == "Hi"
+
+
+def test_parse_event_rejects_unknown_type():
+    """Test that unknown event types raise ValueError."""
+    from openresponses_types.streaming import parse_event
+
+    with pytest.raises(ValueError):
+        parse_event('{"type": "response.unknown", "sequence_number": 0}')
+
+
+def _recorded_stream(**kwargs):
+    from openresponses_types.mock_server import encode_sse, stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    events = list(stream_events(CreateResponseBody(model="gpt-4", input="Hi"), output_chars=40, **kwargs))
+    return events, b"".join(encode_sse(event) for event in events)
+
+
+@pytest.mark.parametrize("size", [1, 7])
+@pytest.mark.parametrize("newline", [b"\r\n", b"\r"])
+def test_parser_reassembles_events_across_arbitrary_chunks(size, newline):
+    """Test that frames split at any byte boundary, with CRLF or CR line endings, parse identically."""
+    from openresponses_types.streaming import iter_events
+
+    events, raw = _recorded_stream(reasoning_chars=12)
+    raw = raw.replace(b"\n", newline)
+    chunks = [raw[index : index + size] for index in range(0, len(raw), size)]
+
+    assert list(iter_events(chunks)) == events
+
+
+def test_subscribe_drops_unwanted_frames_before_decoding(monkeypatch):
+    """Test that unsubscribed frames are dropped without JSON parsing, using event lines or leading type bytes."""
+    from openresponses_types import streaming
+    from openresponses_types.streaming import SSEParser
+
+    events, raw = _recorded_stream(reasoning_chars=40)
+    without_event_lines = b"".join(line + b"\n" for line in raw.split(b"\n") if not line.startswith(b"event:"))
+    wanted = {"response.output_text.delta", "response.completed"}
+
+    decoded = []
+    monkeypatch.setattr(streaming.pydantic_core, "from_json", lambda data: decoded.append(data))
+    for payload in (raw, without_event_lines):
+        parser = SSEParser(subscribe=wanted)
+        parsed = parser.feed(payload) + parser.flush()
+
+        assert [event.type for event in parsed] == [event.type for event in events if event.type in wanted]
+        assert parser.dropped == len(events) - len(parsed)
+    assert decoded == []
+
+
+def test_subscribe_falls_back_to_decoding_when_type_is_not_leading():
+    """Test payloads whose type key is not first are still filtered correctly."""
+    from openresponses_types.streaming import SSEParser
+
+    parser = SSEParser(subscribe={"response.output_text.delta"})
+    frames = (
+        b'data: {"sequence_number":1,"type":"response.reasoning.delta","item_id":"rs","output_index":0,'
+        b'"content_index":0,"delta":"x"}\n\n'
+        b'data: {"sequence_number":2,"type":"response.output_text.delta","item_id":"m","output_index":1,'
+        b'"content_index":0,"delta":"y","logprobs":[]}\n\ndata: [DONE]\n\n'
+    )
+
+    parsed = parser.feed(frames)
+
+    assert [event.delta for event in parsed] == ["y"]
+    assert parser.dropped == 1
+
+
+def test_subscribe_rejects_unknown_event_types():
+    """Test that misspelled subscriptions fail fast."""
+    from openresponses_types.streaming import SSEParser
+
+    with pytest.raises(ValueError):
+        SSEParser(subscribe={"response.output_text.deltas"})
+
+
+def test_parse_context_shares_unchanged_snapshot_fields():
+    """Test that snapshots parsed with a context are equal to plain parses and share unchanged fields."""
+    from openresponses_types.mock_server import encode_sse, stream_events
+    from openresponses_types.streaming import ParseContext, iter_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate(
+        {
+            "model": "gpt-4",
+            "input": "Hi",
+            "instructions": "Be brief.",
+            "tools": [{"type": "function", "name": "lookup", "parameters": {"type": "object"}}],
+        }
+    )
+    events = list(stream_events(body, output_chars=32))
+    frames = [encode_sse(event) for event in events]
+    context = ParseContext()
+
+    parsed = list(iter_events(frames, context=context))
+    first, *_, last = (event.response for event in parsed if hasattr(event, "response"))
+
+    assert parsed == events
+    assert last.tools[0] is first.tools[0]
+    assert last.text is first.text
+    assert last.output != first.output
+    assert context.reused > 0
+
+    subscribed = list(
+        iter_events([frame.split(b"\n", 1)[1] for frame in frames], {"response.completed"}, context=ParseContext())
+    )
+    assert subscribed == [events[-1]]
+
+
+def test_parse_context_reuses_only_identical_json():
+    """Test that a snapshot field is only shared when its JSON text is unchanged, not merely equal in Python."""
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.streaming import ParseContext, parse_event
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate({"model": "gpt-4", "input": "Hi"})
+    created = next(iter(stream_events(body))).model_dump(mode="json")
+    payloads = []
+    for maximum in ["1", "1.0", "true", "true", " true"]:
+        tool = {"type": "function", "name": "f", "description": None, "parameters": {"maximum": 0}, "strict": None}
+        created["response"]["tools"] = [tool]
+        payloads.append(json.dumps(created).replace('"maximum": 0', f'"maximum": {maximum}'))
+    context = ParseContext()
+
+    parsed = [context.parse(payload) for payload in payloads]
+
+    assert parsed == [parse_event(payload) for payload in payloads]
+    maximums = [event.response.tools[0].root.parameters["maximum"] for event in parsed]
+    assert [type(value) for value in maximums] == [int, float, bool, bool, bool]
+    assert parsed[3].response.tools[0] is parsed[2].response.tools[0]
+    assert parsed[4].response.tools[0] is not parsed[3].response.tools[0]
@@ -0,0 +1,47 @@
+"""Tests for the strict-mode model variants."""
+
+import pytest
+
+
+def _events():
+    from openresponses_types.mock_server import stream_events
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate(
+        {"model": "gpt-4", "input": "Hi", "tools": [{"type": "function", "name": "f"}]}
+    )
+    return list(stream_events(body, output_chars=32, reasoning_chars=8, top_logprobs=1))
+
+
+def test_strict_models_validate_exact_json_and_reject_coercions():
+    """Test that strict models accept the lax models' JSON but not coercible values."""
+    from pydantic import ValidationError
+
+    from openresponses_types import strict, types
+
+    for event in _events():
+        strict_type = getattr(strict, type(event).__name__)
+        assert strict_type.model_validate_json(event.model_dump_json()).model_dump() == event.model_dump()
+
+    data = '{"type": "response.output_text.delta", "sequence_number": "3", "item_id": "msg_1", "output_index": 0, '
+    data += '"content_index": 0, "delta": "Hi", "logprobs": []}'
+    assert types.ResponseOutputTextDeltaStreamingEvent.model_validate_json(data).sequence_number == 3
+    with pytest.raises(ValidationError, match="sequence_number"):
+        strict.ResponseOutputTextDeltaStreamingEvent.model_validate_json(data)
+    assert strict.MessageStatus is types.MessageStatus
+
+
+def test_conversion_round_trip():
+    """Test that to_strict and to_lax convert nested models without changing them."""
+    from openresponses_types import strict
+
+    response = _events()[-1].response
+    converted = strict.to_strict(response)
+
+    assert type(converted) is strict.ResponseResource
+    assert type(converted.tools[0].root) is strict.FunctionTool
+    assert converted.model_dump_json() == response.model_dump_json()
+    assert converted.model_fields_set == response.model_fields_set
+    assert strict.to_lax(converted) == response
+    with pytest.raises(TypeError):
+        strict.to_lax(response)
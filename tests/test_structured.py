@@ -0,0 +1,91 @@
+"""Tests for streaming structured-output validation."""
+
+import json
+
+import pytest
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "city": {"type": "string", "minLength": 1},
+        "days": {"type": "array", "items": {"$ref": "#/$defs/day"}, "maxItems": 3},
+        "unit": {"enum": ["c", "f"]},
+        "note": {"anyOf": [{"type": "string"}, {"type": "null"}]},
+    },
+    "required": ["city", "days", "unit", "note"],
+    "additionalProperties": False,
+    "$defs": {
+        "day": {
+            "type": "object",
+            "properties": {"high": {"type": "integer", "minimum": -100}, "sunny": {"type": "boolean"}},
+            "required": ["high"],
+            "additionalProperties": False,
+        }
+    },
+}
+
+
+def _feed(validator, text, size=3):
+    for start in range(0, len(text), size):
+        validator.feed(text[start : start + size])
+
+
+def test_valid_output_passes_and_schema_is_cached():
+    """Test that a conforming document validates and an equal schema reuses the compiled one."""
+    from openresponses_types.structured import StructuredOutputValidator, clear_schema_cache, schema_cache_info
+
+    clear_schema_cache()
+    document = {"city": "Paris", "days": [{"high": 21, "sunny": True}], "unit": "c", "note": None}
+    validator = StructuredOutputValidator(SCHEMA)
+    _feed(validator, json.dumps(document))
+
+    assert validator.close() == document
+    assert StructuredOutputValidator(json.loads(json.dumps(SCHEMA))).schema is validator.schema
+    assert schema_cache_info().hits == 1
+
+
+@pytest.mark.parametrize(
+    ("text", "path"),
+    [
+        ('{"city": "Paris", "extra": 1, "days": [', ("extra",)),
+        ('{"city": "Paris", "days": [{"high": "warm"}', ("days", 0, "high")),
+        ('{"city": "", "days"', ("city",)),
+        ('{"city": "Paris", "days": [{"sunny": true}, ', ("days", 0)),
+        ('{"city": "Paris", "unit": "k", ', ("unit",)),
+        ('{"city": "Paris", "note": 5, ', ("note",)),
+        ('{"city": "Paris", "days": [{"high": 1}, {"high": 2}, {"high": 3}, {"high": 4}]', ("days",)),
+        ('{"city": "Paris" "days"', ()),
+    ],
+)
+def test_violations_are_reported_before_the_document_ends(text, path):
+    """Test that a violation raises StructuredOutputError with its path while the document is incomplete."""
+    from openresponses_types.structured import StructuredOutputError, StructuredOutputValidator
+
+    validator = StructuredOutputValidator(SCHEMA)
+    with pytest.raises(StructuredOutputError) as info:
+        _feed(validator, text)
+    assert info.value.path == path
+
+
+def test_validator_from_request_follows_text_deltas():
+    """Test that for_request picks up the JSON Schema format and feed_event consumes output text events."""
+    from openresponses_types.emitter import ResponseStreamEmitter
+    from openresponses_types.mock_server import build_response
+    from openresponses_types.streaming import iter_events
+    from openresponses_types.structured import StructuredOutputError, StructuredOutputValidator
+    from openresponses_types.types import CreateResponseBody
+
+    body = CreateResponseBody.model_validate(
+        {"input": "Hi", "text": {"format": {"type": "json_schema", "name": "weather", "schema": SCHEMA}}}
+    )
+    emitter = ResponseStreamEmitter(build_response(body, response_id="resp_1", status="in_progress", output=[]))
+    emitter.start_message()
+    emitter.text_delta('{"city": "Paris", "days": [], ')
+    emitter.text_delta('"unit": "c"}')
+    emitter.complete()
+
+    validator = StructuredOutputValidator.for_request(body)
+    with pytest.raises(StructuredOutputError, match="missing required properties"):
+        for event in iter_events([emitter.take()]):
+            validator.feed_event(event)
+    assert StructuredOutputValidator.for_request(CreateResponseBody(input="Hi")) is None
@@ -0,0 +1,106 @@
+"""Tests for the function tool registry."""
+
+import pytest
+
+WEATHER = {
+    "type": "function",
+    "name": "get_weather",
+    "parameters": {
+        "type": "object",
+        "properties": {"city": {"type": "string"}, "days": {"type": "integer", "minimum": 1}},
+        "required": ["city"],
+        "additionalProperties": False,
+    },
+}
+
+
+def _call(name, arguments, call_id="call_1"):
+    from openresponses_types.types import FunctionCall, FunctionCallStatus
+
+    return FunctionCall(
+        type="function_call",
+        id=f"fc_{call_id}",
+        call_id=call_id,
+        name=name,
+        arguments=arguments,
+        status=FunctionCallStatus.completed,
+    )
+
+
+def test_validate_call_decodes_arguments_and_caches_validator():
+    """Test that valid arguments decode to Python values and the schema compiles once."""
+    from openresponses_types.tools import ToolRegistry
+    from openresponses_types.types import FunctionTool
+
+    registry = ToolRegistry([WEATHER])
+    assert registry.validate_call(_call("get_weather", '{"city": "Paris", "days": 3}')) == {"city": "Paris", "days": 3}
+    registry.validate_call(_call("get_weather", '{"city": "Rome"}'))
+    registry.register(FunctionTool.model_validate({**WEATHER, "description": None, "strict": True}))
+    registry.validate_call(_call("get_weather", '{"city": "Oslo"}'))
+
+    info = registry.cache_info()
+    assert (info.misses, info.hits, info.currsize) == (1, 2, 1)
+
+
+@pytest.mark.parametrize(
+    ("name", "arguments", "message"),
+    [
+        ("get_weather", '{"city": "Paris", "days": 0}', "minimum"),
+        ("get_weather", '{"city": "Paris", "country": "FR"}', "unexpected property"),
+        ("get_weather", '{"city": ', "not valid JSON"),
+        ("get_time", "{}", "unknown tool"),
+    ],
+)
+def test_invalid_calls_raise_tool_call_error(name, arguments, message):
+    """Test that schema violations, bad JSON and unknown tools raise ToolCallError."""
+    from openresponses_types.tools import ToolCallError, ToolRegistry
+
+    registry = ToolRegistry([WEATHER])
+    with pytest.raises(ToolCallError, match=message) as info:
+        registry.validate_call(_call(name, arguments))
+    assert info.value.call_id == "call_1"
+
+
+def test_model_tools_and_batch_mode():
+    """Test pydantic-model tools and per-call results when validating many calls at once."""
+    from pydantic import BaseModel
+
+    from openresponses_types.tools import ToolRegistry
+
+    class Search(BaseModel):
+        query: str
+        limit: int = 10
+
+    registry = ToolRegistry([WEATHER])
+    registry.register("search", model=Search)
+    results = registry.validate_calls(
+        [
+            _call("search", '{"query": "pydantic"}', "call_1"),
+            _call("get_weather", '{"days": 2}', "call_2"),
+            _call("get_weather", '{"city": "Lima"}', "call_3"),
+        ]
+    )
+
+    assert results[0].arguments == Search(query="pydantic")
+    assert results[1].error is not None and results[1].error.call_id == "call_2"
+    assert results[2].arguments == {"city": "Lima"} and results[2].error is None
+
+
+def test_tools_without_schema_require_opting_out_of_validation():
+    """Test that a tool without a parameters schema is rejected unless registered as unvalidated."""
+    from openresponses_types.tools import ToolRegistry
+    from openresponses_types.types import FunctionToolParam
+
+    param = FunctionToolParam.model_validate(WEATHER)
+    registry = ToolRegistry()
+    for tool in [param, "get_weather", {"type": "function", "name": "get_weather"}]:
+        with pytest.raises(ValueError, match="no parameters schema"):
+            registry.register(tool)
+    assert "get_weather" not in registry
+
+    registry.register(param, WEATHER["parameters"])
+    with pytest.raises(ValueError, match="minimum"):
+        registry.validate_call(_call("get_weather", '{"city": "Paris", "days": 0}'))
+
+    registry.register(param, allow_unvalidated=True)
+    assert registry.validate_call(_call("get_weather", '{"days": 0}')) == {"days": 0}
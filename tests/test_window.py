@@ -0,0 +1,112 @@
+"""Tests for the bounded input window."""
+
+import pytest
+
+
+def _user(text):
+    from openresponses_types.types import UserMessageItemParam
+
+    return UserMessageItemParam(type="message", role="user", content=text)
+
+
+def _call(call_id):
+    from openresponses_types.types import FunctionCallItemParam
+
+    return FunctionCallItemParam(type="function_call", call_id=call_id, name="search", arguments='{"q": "x"}')
+
+
+def _output(call_id):
+    from openresponses_types.types import FunctionCallOutputItemParam
+
+    return FunctionCallOutputItemParam(type="function_call_output", call_id=call_id, output="result " * 5)
+
+
+def _json_size(items):
+    from pydantic import TypeAdapter
+
+    from openresponses_types.history import InputItem
+
+    return len(TypeAdapter(list[InputItem]).dump_json(items, by_alias=True, exclude_none=True))
+
+
+def test_window_requires_a_budget():
+    """Test that a window without limits is rejected."""
+    from openresponses_types.window import InputWindow
+
+    with pytest.raises(ValueError):
+        InputWindow()
+
+
+def test_window_stays_within_budget_and_tracks_size():
+    """Test that old items are evicted and the running size matches the serialized list."""
+    from openresponses_types.window import InputWindow
+
+    window = InputWindow(max_bytes=400)
+    evicted = window.extend(_user(f"message number {index}") for index in range(20))
+
+    assert evicted
+    assert window.size_bytes <= 400
+    assert window.size_bytes == _json_size(window.items()) - 1
+    assert window.items()[-1].content.root == "message number 19"
+
+
+def test_calls_and_outputs_are_evicted_together():
+    """Test that a function call is never kept without its output, even for parallel calls."""
+    from openresponses_types.window import InputWindow
+
+    window = InputWindow(max_tokens=120)
+    window.extend([_user("hi"), _call("a"), _call("b"), _output("a"), _output("b")])
+    window.extend(_user(f"follow up {index}") for index in range(6))
+
+    call_ids = [getattr(item, "call_id", None) for item in window.items()]
+    for call_id in ("a", "b"):
+        assert call_ids.count(call_id) in (0, 2)
+
+
+def test_evicted_items_are_summarized():
+    """Test that the summarizer folds evicted items into a single leading summary item."""
+    from openresponses_types.window import InputWindow
+
+    seen = []
+
+    def summarize(previous, evicted):
+        seen.extend(evicted)
+        return _user(f"summary of {len(seen)} items")
+
+    window = InputWindow(max_bytes=500, summarize=summarize)
+    window.extend(_user(f"message number {index}") for index in range(20))
+
+    items = window.items()
+    assert items[0] is window.summary
+    assert items[0].content.root == f"summary of {len(seen)} items"
+    assert len(seen) + len(items) - 1 == 20
+    assert window.size_bytes <= 500
+
+
+def test_output_of_an_evicted_call_is_dropped():
+    """Test that an output arriving after its call was evicted is not left in the window without it."""
+    from openresponses_types.window import InputWindow
+
+    window = InputWindow(max_bytes=400)
+    window.append(_call("c1"))
+    evicted = window.extend(_user("x" * 60) for _ in range(4))
+    dropped = window.append(_output("c1"))
+
+    assert evicted[0].call_id == "c1"
+    assert dropped[0].call_id == "c1"
+    assert [item.type for item in window.items()] == ["message"] * 3
+    assert window.size_bytes <= 400
+
+
+def test_eviction_skips_the_protected_group():
+    """Test that items after the newest call's group are still evicted to meet the budget."""
+    from openresponses_types.window import InputWindow
+
+    window = InputWindow(max_bytes=360)
+    window.append(_call("c1"))
+    window.extend([_user("first"), _user("x" * 60), _user("y" * 60)])
+    evicted = window.append(_output("c1"))
+
+    assert [item.content.root for item in evicted] == ["first", "x" * 60]
+    assert [item.type for item in window.items()] == ["function_call", "message", "function_call_output"]
+    assert window.size_bytes <= 360